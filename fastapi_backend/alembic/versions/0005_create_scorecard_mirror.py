@@ -0,0 +1,81 @@
+"""create local college scorecard mirror
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2026-10-17
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0005"
+down_revision = "0004"
+branch_labels = None
+depends_on = None
+
+FLOAT_COLUMNS = [
+    "part_time_share",
+    "completion_rate",
+    "avg_net_price",
+    "earnings_10yr_median",
+    "median_debt",
+    "median_debt_monthly_payment",
+    "share_white",
+    "share_black",
+    "share_hispanic",
+    "share_asian",
+    "share_two_or_more",
+    "share_non_resident_alien",
+    "share_first_generation",
+    "pell_grant_rate",
+    "federal_loan_rate",
+    "student_faculty_ratio",
+    "retention_four_year",
+    "retention_lt_four_year",
+    "sat_reading_25th",
+    "sat_reading_75th",
+    "act_cumulative_25th",
+    "act_cumulative_75th",
+    "admission_rate",
+    "repayment_rate_3yr",
+    "earnings_6yr_gt_threshold",
+] + [
+    f"net_price_{sector}_{level}"
+    for sector in ("public", "private")
+    for level in ("0_30000", "30001_48000", "48001_75000", "75001_110000", "110001_plus")
+]
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.create_table(
+        "scorecard_schools",
+        sa.Column("id", sa.Integer, primary_key=True, autoincrement=False),
+        sa.Column("name", sa.String(length=256)),
+        sa.Column("city", sa.String(length=128)),
+        sa.Column("state", sa.String(length=8)),
+        sa.Column("school_url", sa.String(length=512)),
+        sa.Column("ownership", sa.Integer),
+        sa.Column("locale", sa.Integer),
+        sa.Column("student_size", sa.Integer),
+        sa.Column("academic_year", sa.Integer),
+        *[sa.Column(name, sa.Float) for name in FLOAT_COLUMNS],
+    )
+    op.create_index(
+        "ix_scorecard_schools_name_trgm",
+        "scorecard_schools",
+        ["name"],
+        postgresql_using="gin",
+        postgresql_ops={"name": "gin_trgm_ops"},
+    )
+    op.create_index(
+        "ix_scorecard_schools_state_size", "scorecard_schools", ["state", "student_size"]
+    )
+    op.create_index("ix_scorecard_schools_student_size", "scorecard_schools", ["student_size"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_scorecard_schools_student_size", table_name="scorecard_schools")
+    op.drop_index("ix_scorecard_schools_state_size", table_name="scorecard_schools")
+    op.drop_index("ix_scorecard_schools_name_trgm", table_name="scorecard_schools")
+    op.drop_table("scorecard_schools")
@@ -0,0 +1,44 @@
+"""add normalized degree and lookup indexes to education plans
+
+Revision ID: 0006
+Revises: 0005
+Create Date: 2026-10-17
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0006"
+down_revision = "0005"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "education_plans",
+        sa.Column("degree_norm", sa.String(length=128), nullable=False, server_default=""),
+    )
+    # Mirrors _normalize_degree(plan.degree or payload["degree"]) in education_plan_service.
+    op.execute(
+        """
+        UPDATE education_plans
+        SET degree_norm = lower(btrim(coalesce(nullif(degree, ''), payload->>'degree', '')))
+        """
+    )
+    op.create_index(
+        "ix_education_plans_user_program_degree",
+        "education_plans",
+        ["user_id", "program_name", "university_name", "degree_norm"],
+    )
+    op.create_index(
+        "ix_education_plans_program_degree",
+        "education_plans",
+        ["program_name", "university_name", "degree_norm"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_education_plans_program_degree", table_name="education_plans")
+    op.drop_index("ix_education_plans_user_program_degree", table_name="education_plans")
+    op.drop_column("education_plans", "degree_norm")
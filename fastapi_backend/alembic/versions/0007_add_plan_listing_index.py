@@ -0,0 +1,23 @@
+"""add keyset pagination index for education plan listing
+
+Revision ID: 0007
+Revises: 0006
+Create Date: 2026-10-17
+"""
+
+from alembic import op
+
+revision = "0007"
+down_revision = "0006"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_education_plans_user_updated", "education_plans", ["user_id", "updated_at", "id"]
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_education_plans_user_updated", table_name="education_plans")
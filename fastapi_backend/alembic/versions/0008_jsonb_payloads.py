@@ -0,0 +1,51 @@
+"""store plan, reschedule and intake payloads as jsonb with gin indexes
+
+Revision ID: 0008
+Revises: 0007
+Create Date: 2026-10-17
+"""
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+revision = "0008"
+down_revision = "0007"
+branch_labels = None
+depends_on = None
+
+PAYLOAD_TABLES = {
+    "education_plans": "ix_education_plans_payload",
+    "course_reschedules": "ix_course_reschedules_payload",
+    "intake_submissions": "ix_intake_submissions_payload",
+}
+
+
+def upgrade() -> None:
+    for table, index_name in PAYLOAD_TABLES.items():
+        op.alter_column(
+            table,
+            "payload",
+            type_=postgresql.JSONB(),
+            existing_type=sa.JSON(),
+            postgresql_using="payload::jsonb",
+        )
+        op.create_index(
+            index_name,
+            table,
+            ["payload"],
+            postgresql_using="gin",
+            postgresql_ops={"payload": "jsonb_path_ops"},
+        )
+
+
+def downgrade() -> None:
+    for table, index_name in PAYLOAD_TABLES.items():
+        op.drop_index(index_name, table_name=table)
+        op.alter_column(
+            table,
+            "payload",
+            type_=sa.JSON(),
+            existing_type=postgresql.JSONB(),
+            postgresql_using="payload::json",
+        )
@@ -1,6 +1,15 @@
 from fastapi import APIRouter
 
-from app.api.routes import customer, dashboard, global_data, intake, universities, users
+from app.api.routes import (
+    careers,
+    catalog,
+    customer,
+    dashboard,
+    global_data,
+    intake,
+    universities,
+    users,
+)
 
 
 def get_api_router() -> APIRouter:
@@ -11,4 +20,6 @@ def get_api_router() -> APIRouter:
     router.include_router(universities.router, prefix="/api")
     router.include_router(customer.router, prefix="/api")
     router.include_router(intake.router, prefix="/api")
+    router.include_router(catalog.router, prefix="/api")
+    router.include_router(careers.router, prefix="/api")
     return router
@@ -0,0 +1,40 @@
+from fastapi import APIRouter, Query, Request
+
+from app.services.career_catalog import career_catalog
+from app.utils.http_cache import encoded_response
+
+router = APIRouter(prefix="/careers", tags=["careers"])
+
+
+@router.get("/programs")
+async def list_career_programs(request: Request, degree: str | None = None):
+    """Degree/program pairs with their career counts, without career detail."""
+    catalog = await career_catalog.current()
+    return encoded_response(request, catalog.program_listing(degree))
+
+
+@router.get("")
+async def list_careers(
+    request: Request,
+    degree: str | None = None,
+    program: str | None = None,
+    employer: str | None = Query(None, description="Case-insensitive substring of an employer"),
+    search: str | None = Query(None, description="Case-insensitive substring of the title"),
+    salary_min: int | None = Query(None, ge=0),
+    salary_max: int | None = Query(None, ge=0),
+    page: int = Query(0, ge=0),
+    per_page: int = Query(20, ge=1, le=100),
+):
+    """Careers with salary ranges, competencies and employers already joined in."""
+    catalog = await career_catalog.current()
+    encoded = catalog.page(
+        page=page,
+        per_page=per_page,
+        degree=degree,
+        program=program,
+        employer=employer,
+        search=search,
+        salary_min=salary_min,
+        salary_max=salary_max,
+    )
+    return encoded_response(request, encoded)
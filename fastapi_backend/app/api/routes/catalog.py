@@ -0,0 +1,28 @@
+from fastapi import APIRouter, HTTPException, Request
+
+from app.services.program_catalog import program_catalog
+from app.utils.http_cache import encoded_response
+
+router = APIRouter(prefix="/catalog", tags=["catalog"])
+
+
+@router.get("/programs")
+async def list_programs(
+    request: Request,
+    program: str | None = None,
+    degree: str | None = None,
+    university: str | None = None,
+    course: str | None = None,
+):
+    """Program listing without course detail, optionally filtered by exact name or course code."""
+    catalog = await program_catalog.current()
+    return encoded_response(request, catalog.listing_for(program, degree, university, course))
+
+
+@router.get("/programs/{program_id}")
+async def get_program(request: Request, program_id: str):
+    catalog = await program_catalog.current()
+    encoded = catalog.details.get(program_id)
+    if encoded is None:
+        raise HTTPException(status_code=404, detail="Program not found")
+    return encoded_response(request, encoded)
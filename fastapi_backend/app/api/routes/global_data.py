@@ -1,20 +1,31 @@
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Request, Response
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.db.session import get_db
 from app.schemas.global_data import CountryResponse, StateResponse
 from app.services import global_service
+from app.utils.http_cache import DEFAULT_CACHE_CONTROL, not_modified, version_etag
 
 router = APIRouter(prefix="/global", tags=["global"])
 
 
 @router.get("/countries", response_model=list[CountryResponse])
-async def list_countries(db: AsyncSession = Depends(get_db)):
+async def list_countries(request: Request, response: Response, db: AsyncSession = Depends(get_db)):
+    version = await global_service.countries_version(db)
+    etag = version_etag("countries", version)
+    if (cached := not_modified(request, response, etag, DEFAULT_CACHE_CONTROL)) is not None:
+        return cached
     countries = await global_service.list_countries(db)
     return countries
 
 
 @router.get("/states/{country_id}", response_model=list[StateResponse])
-async def list_states(country_id: int, db: AsyncSession = Depends(get_db)):
+async def list_states(
+    country_id: int, request: Request, response: Response, db: AsyncSession = Depends(get_db)
+):
+    version = await global_service.states_version(db, country_id)
+    etag = version_etag("states", country_id, version)
+    if (cached := not_modified(request, response, etag, DEFAULT_CACHE_CONTROL)) is not None:
+        return cached
     states = await global_service.list_states(db, country_id)
     return states
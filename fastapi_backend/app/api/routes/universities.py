@@ -1,10 +1,31 @@
+import csv
+import io
+import json
+from typing import Any, AsyncIterator, Literal
+
 from fastapi import APIRouter, HTTPException, Query
+from fastapi.responses import StreamingResponse
 
-from app.clients.college_scorecard import client as scorecard_client
-from app.schemas.university import CompareRequest, University
+from app.clients.college_scorecard import (
+    SCHOOL_FIELDS,
+    client as scorecard_client,
+    parse_fields,
+)
+from app.schemas.university import CompareRequest, RankRequest, University
+from app.services.university_index import name_index
+from app.services.university_ranking import ranking_engine
 
 router = APIRouter(prefix="/universities", tags=["universities"])
 
+FIELDS_DESCRIPTION = "Comma-separated response keys to return, e.g. name,city,state,size"
+
+
+def _fields(raw: str | None) -> tuple[str, ...] | None:
+    try:
+        return parse_fields(raw)
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
+
 
 @router.get("", response_model=dict)
 async def search_universities(
@@ -12,30 +33,109 @@ async def search_universities(
     state: str | None = None,
     page: int = 0,
     per_page: int = Query(10, ge=1, le=100),
+    fields: str | None = Query(None, description=FIELDS_DESCRIPTION),
 ):
     payload = await scorecard_client.search_schools(
-    page=page, per_page=per_page, search=search, state=state
+        page=page, per_page=per_page, search=search, state=state, fields=_fields(fields)
     )
     return {
         "success": True,
         "data": payload["results"],
         "metadata": payload.get("metadata"),
+        "stale": payload.get("stale", False),
     }
 
 
+@router.get("/export")
+async def export_universities(
+    search: str | None = None,
+    state: str | None = None,
+    format: Literal["ndjson", "csv"] = "ndjson",
+    fields: str | None = Query(None, description=FIELDS_DESCRIPTION),
+):
+    selected = _fields(fields)
+    rows = scorecard_client.iter_schools(search=search, state=state, fields=selected)
+    if format == "csv":
+        columns = list(selected or SCHOOL_FIELDS)
+        return StreamingResponse(
+            _csv_lines(rows, columns),
+            media_type="text/csv",
+            headers={"Content-Disposition": 'attachment; filename="universities.csv"'},
+        )
+    return StreamingResponse(_ndjson_lines(rows), media_type="application/x-ndjson")
+
+
+async def _ndjson_lines(rows: AsyncIterator[dict[str, Any]]) -> AsyncIterator[str]:
+    async for row in rows:
+        yield json.dumps(row, separators=(",", ":")) + "\n"
+
+
+async def _csv_lines(rows: AsyncIterator[dict[str, Any]], columns: list[str]) -> AsyncIterator[str]:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(columns)
+    async for row in rows:
+        # Nested objects (diversity, net price, college_info) are embedded as JSON.
+        writer.writerow(
+            [
+                json.dumps(value) if isinstance(value, (dict, list)) else value
+                for value in (row.get(column) for column in columns)
+            ]
+        )
+        yield buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate()
+    if buffer.tell():
+        yield buffer.getvalue()
+
+
+@router.get("/suggest", response_model=dict)
+async def suggest_universities(
+    q: str = Query(..., min_length=1, max_length=100),
+    limit: int = Query(10, ge=1, le=20),
+):
+    return {"success": True, "data": name_index.suggest(q, limit)}
+
+
 @router.get("/{unit_id}", response_model=dict)
-async def get_university(unit_id: str):
-    school = await scorecard_client.get_school(unit_id)
+async def get_university(
+    unit_id: str, fields: str | None = Query(None, description=FIELDS_DESCRIPTION)
+):
+    school = await scorecard_client.get_school(unit_id, _fields(fields))
     if not school:
         raise HTTPException(status_code=404, detail="University not found")
-    return {"success": True, "data": school}
+    stale = school.get("stale", False)
+    if stale:
+        school = {key: value for key, value in school.items() if key != "stale"}
+    return {"success": True, "data": school, "stale": stale}
 
 
 @router.post("/compare", response_model=dict)
-async def compare_universities(payload: CompareRequest):
-    results: list[University] = []
-    for unit_id in payload.unit_ids[:5]:
-        school = await scorecard_client.get_school(unit_id)
-        if school:
-            results.append(University(**school))
-    return {"success": True, "data": [item.model_dump() for item in results]}
+async def compare_universities(
+    payload: CompareRequest, fields: str | None = Query(None, description=FIELDS_DESCRIPTION)
+):
+    selected = _fields(fields)
+    batch = await scorecard_client.get_schools(payload.unit_ids[:5], selected)
+    results = [University(**school) for school in batch["results"]]
+    return {
+        "success": True,
+        "data": [item.model_dump(exclude_unset=selected is not None) for item in results],
+        "missing": batch["missing"],
+        "stale": batch["stale"],
+    }
+
+
+@router.post("/rank", response_model=dict)
+async def rank_universities(payload: RankRequest):
+    if not ranking_engine.loaded:
+        raise HTTPException(status_code=503, detail="University ranking table is still loading")
+    try:
+        results = ranking_engine.rank(
+            payload.weights,
+            income_bracket=payload.income_bracket,
+            state=payload.state,
+            limit=payload.limit,
+        )
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
+    return {"success": True, "data": results}
@@ -1,4 +1,6 @@
-from fastapi import APIRouter, Depends, HTTPException
+import asyncio
+
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.db.session import get_db
@@ -8,11 +10,14 @@ from app.schemas.education import (
     EducationPlanListQuery,
     EducationPlanQuery,
     EducationPlanRequest,
+    PlanGenerateRequest,
     RescheduleRequest,
 )
 from app.security.auth import create_access_token
-from app.services import education_plan_service, user_service
+from app.services import education_plan_service, plan_generator, schedule_conflicts, user_service
+from app.services.program_catalog import program_catalog
 from app.utils.email import send_email
+from app.utils.http_cache import not_modified, version_etag
 from app.utils.sms import send_sms
 
 router = APIRouter(tags=["users"])
@@ -53,31 +58,95 @@ async def add_education_plan(request: EducationPlanRequest, db: AsyncSession = D
     user = await user_service.get_user_by_email(db, request.emailaddress)
     if not user:
         raise HTTPException(status_code=404, detail="User not found")
-    plan = await education_plan_service.add_or_replace_plan(db, user, request)
-    return {"success": True, "message": "Education plan saved", "data": plan.payload}
+    plan, changes, prerequisites = await education_plan_service.add_or_replace_plan(
+        db, user, request
+    )
+    return {
+        "success": True,
+        "message": "Education plan saved",
+        "data": plan.payload,
+        "changes": changes,
+        "prerequisites": prerequisites,
+        "conflicts": schedule_conflicts.plan_conflicts(request.program),
+    }
+
+
+@router.post("/users/education-plan/generate")
+async def generate_education_plan(request: PlanGenerateRequest):
+    """Build a semester-by-semester plan from the catalog; the result can be saved as-is."""
+    await program_catalog.current()
+    # The search is CPU-bound for up to PLAN_GENERATOR_TIME_BUDGET; keep it off the event loop.
+    plan = await asyncio.to_thread(
+        plan_generator.generate_plan,
+        request.program,
+        request.university,
+        request.degree,
+        completed=request.completed,
+        max_credits=request.max_credits,
+        seasons=request.semesters,
+        max_semesters=request.max_semesters,
+    )
+    return {
+        "success": True,
+        "message": "Education plan generated",
+        "data": {"program": plan.program, "degree": request.degree},
+        "semesters": plan.semesters,
+        "optimal": plan.optimal,
+        "unscheduled": plan.unscheduled,
+    }
 
 
 @router.post("/users/education-plan/query")
 async def query_education_plan(request: EducationPlanQuery, db: AsyncSession = Depends(get_db)):
-    plan = await education_plan_service.query_plan(db, request)
-    if not plan:
+    payload = await education_plan_service.query_plan_payload(db, request)
+    return _plan_response(payload)
+
+
+@router.get("/users/education-plan/query")
+async def get_education_plan(
+    request: Request,
+    response: Response,
+    query: EducationPlanQuery = Depends(),
+    db: AsyncSession = Depends(get_db),
+):
+    """Conditional-GET form of the plan query: 304 while the plan is unchanged."""
+    version = await education_plan_service.query_plan_version(db, query)
+    etag = version_etag("plan", query.programname, query.univerityname, query.degree, version)
+    if (cached := not_modified(request, response, etag)) is not None:
+        return cached
+    payload = await education_plan_service.query_plan_payload(db, query, version)
+    return _plan_response(payload)
+
+
+def _plan_response(payload: dict | None) -> dict:
+    if payload is None:
         return {"success": True, "message": "No education plan found", "data": None}
-    payload = dict(plan.payload or {})
-    if plan.degree and not payload.get("degree"):
-        payload["degree"] = plan.degree
     return {"success": True, "message": "Plan retrieved", "data": payload}
 
 
 @router.post("/users/education-plan/list")
 async def list_plans(request: EducationPlanListQuery, db: AsyncSession = Depends(get_db)):
-    plans = await education_plan_service.list_plans(db, request)
-    data = []
-    for plan in plans:
-        payload = dict(plan.payload or {})
-        if plan.degree and not payload.get("degree"):
-            payload["degree"] = plan.degree
-        data.append(payload)
-    return {"success": True, "message": "Plans loaded", "data": data}
+    # With summary=true, full payloads are fetched per plan through /users/education-plan/query.
+    data, next_cursor = await education_plan_service.list_plan_payloads(db, request)
+    return {"success": True, "message": "Plans loaded", "data": data, "next_cursor": next_cursor}
+
+
+@router.get("/users/education-plan/list")
+async def get_plans(
+    request: Request,
+    response: Response,
+    query: EducationPlanListQuery = Depends(),
+    db: AsyncSession = Depends(get_db),
+):
+    """Conditional-GET form of the plan listing: 304 until one of the user's plans changes."""
+    version = await education_plan_service.plan_list_version(db, query.email)
+    etag = version_etag(
+        "plans", query.email.lower(), query.limit, query.cursor, query.summary, version
+    )
+    if (cached := not_modified(request, response, etag)) is not None:
+        return cached
+    data, next_cursor = await education_plan_service.list_plan_payloads(db, query, version)
+    return {"success": True, "message": "Plans loaded", "data": data, "next_cursor": next_cursor}
 
 
 @router.post("/users/education-plan/delete")
@@ -97,7 +166,12 @@ async def reschedule_courses(request: RescheduleRequest, db: AsyncSession = Depe
     if not user:
         raise HTTPException(status_code=404, detail="User not found")
     entry = await education_plan_service.save_reschedule(db, user, request)
-    return {"success": True, "message": "Reschedule request queued", "data": entry.payload}
+    return {
+        "success": True,
+        "message": "Reschedule request queued",
+        "data": entry.payload,
+        "conflicts": schedule_conflicts.reschedule_conflicts(request.reschedule),
+    }
 
 
 @router.post("/users/email-advisor")
@@ -0,0 +1,52 @@
+"""Load a College Scorecard bulk CSV into the local mirror.
+
+Usage::
+
+    python -m app.cli.ingest_scorecard Most-Recent-Cohorts-Institution.csv --academic-year 2022
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import logging
+
+from app.db.session import engine
+from app.services.scorecard_ingest import ingest_csv
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("path", help="Path to the Scorecard institution-level CSV")
+    parser.add_argument("--chunk-size", type=int, default=5000, help="Rows per COPY batch")
+    parser.add_argument(
+        "--academic-year", type=int, default=None, help="Value for latest.academic_year"
+    )
+    parser.add_argument(
+        "--prune", action="store_true", help="Delete mirrored schools missing from the file"
+    )
+    return parser.parse_args(argv)
+
+
+async def run(args: argparse.Namespace) -> int:
+    try:
+        return await ingest_csv(
+            engine,
+            args.path,
+            chunk_size=args.chunk_size,
+            academic_year=args.academic_year,
+            prune=args.prune,
+        )
+    finally:
+        await engine.dispose()
+
+
+def main(argv: list[str] | None = None) -> None:
+    logging.basicConfig(level=logging.INFO, format="%(levelname)s %(message)s")
+    args = parse_args(argv)
+    loaded = asyncio.run(run(args))
+    logging.info("Loaded %s schools into the Scorecard mirror", loaded)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+import asyncio
+import time
+from typing import Awaitable, Callable, TypeVar
+
+T = TypeVar("T")
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitOpenError(Exception):
+    """Raised without calling upstream while the breaker is open."""
+
+    def __init__(self, retry_after: float) -> None:
+        super().__init__("Upstream service unavailable")
+        self.retry_after = retry_after
+
+
+class CircuitBreaker:
+    """Consecutive-failure circuit breaker with a single half-open probe.
+
+    After ``failure_threshold`` consecutive failures the breaker opens and rejects calls for
+    ``recovery_timeout`` seconds. The first call after that is let through as a probe; its
+    outcome closes the breaker again or re-opens it for another full timeout.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int,
+        recovery_timeout: float,
+        is_failure: Callable[[BaseException], bool] = lambda exc: True,
+    ) -> None:
+        self.failure_threshold = max(1, failure_threshold)
+        self.recovery_timeout = recovery_timeout
+        self.is_failure = is_failure
+        self.state = CLOSED
+        self.failures = 0
+        self._opened_at = 0.0
+        self._probe_in_flight = False
+        self.trips = 0
+        self.rejected = 0
+
+    def _reject(self) -> CircuitOpenError:
+        self.rejected += 1
+        remaining = self.recovery_timeout - (time.monotonic() - self._opened_at)
+        return CircuitOpenError(max(remaining, 0.0))
+
+    def _before_call(self) -> None:
+        if self.state == OPEN:
+            if time.monotonic() - self._opened_at < self.recovery_timeout:
+                raise self._reject()
+            self.state = HALF_OPEN
+        if self.state == HALF_OPEN:
+            if self._probe_in_flight:
+                raise self._reject()
+            self._probe_in_flight = True
+
+    def _open(self) -> None:
+        if self.state != OPEN:
+            self.trips += 1
+        self.state = OPEN
+        self._opened_at = time.monotonic()
+
+    async def call(self, func: Callable[[], Awaitable[T]]) -> T:
+        self._before_call()
+        try:
+            result = await func()
+        except asyncio.CancelledError:
+            self._probe_in_flight = False
+            raise
+        except Exception as exc:
+            self._probe_in_flight = False
+            if not self.is_failure(exc):
+                self.failures = 0
+                self.state = CLOSED
+                raise
+            self.failures += 1
+            if self.state == HALF_OPEN or self.failures >= self.failure_threshold:
+                self._open()
+            raise
+        self._probe_in_flight = False
+        self.failures = 0
+        self.state = CLOSED
+        return result
@@ -1,10 +1,31 @@
 from __future__ import annotations
 
-from typing import Any
+import asyncio
+import logging
+from typing import Any, AsyncIterator, Awaitable, Callable, Hashable, Sequence
 
 import httpx
+from tenacity import (
+    AsyncRetrying,
+    RetryCallState,
+    retry_if_exception,
+    stop_after_attempt,
+    wait_random_exponential,
+)
 
+from app.clients.circuit_breaker import CircuitBreaker, CircuitOpenError
+from app.clients.rate_limit import (
+    PRIORITY_BACKGROUND,
+    PRIORITY_BULK,
+    PRIORITY_DETAIL,
+    RateLimitError,
+    TokenBucket,
+)
+from app.clients.scorecard_mirror import ScorecardMirror
 from app.core.config import settings
+from app.utils.cache import FRESH, STALE, TTLCache
+
+logger = logging.getLogger(__name__)
 
 BASE_FIELDS = [
     "id",
@@ -71,18 +92,300 @@ LOCALE_MAP = {
 }
 
 
+INCOME_LEVELS = ["0-30000", "30001-48000", "48001-75000", "75001-110000", "110001-plus"]
+DIVERSITY_FIELDS = {
+    "white": "latest.student.share_white",
+    "black": "latest.student.share_black",
+    "hispanic": "latest.student.share_hispanic",
+    "asian": "latest.student.share_asian",
+    "two_or_more": "latest.student.share_two_or_more",
+    "non_resident": "latest.student.share_non_resident_alien",
+}
+RETENTION_FIELDS = (
+    "latest.student.retention_rate_suppressed.four_year.full_time_pooled",
+    "latest.student.retention_rate_suppressed.lt_four_year.full_time_pooled",
+)
+NET_PRICE_FIELDS = tuple(
+    f"latest.cost.net_price.{sector}.by_income_level.{level}"
+    for sector in ("public", "private")
+    for level in INCOME_LEVELS
+)
+
+
+def _value(field: str) -> tuple[tuple[str, ...], Callable[[dict[str, Any]], Any]]:
+    return (field,), lambda record: record.get(field)
+
+
+def _enrollment(record: dict[str, Any]) -> tuple[int | None, int | None]:
+    size = record.get("latest.student.size") or 0
+    part_time_share = record.get("latest.student.part_time_share")
+    if size and part_time_share is not None:
+        return int(round(size * (1 - part_time_share))), int(round(size * part_time_share))
+    return None, None
+
+
+def _family_income_net_price(record: dict[str, Any]) -> dict[str, Any] | None:
+    for source in ("public", "private"):
+        breakdown = {
+            level: value
+            for level in INCOME_LEVELS
+            if (value := record.get(f"latest.cost.net_price.{source}.by_income_level.{level}"))
+            is not None
+        }
+        if breakdown:
+            return {"source": source, "breakdown": breakdown}
+    return None
+
+
+def _college_info(record: dict[str, Any]) -> dict[str, Any]:
+    return {
+        "type": OWNERSHIP_MAP.get(record.get("school.ownership"), "Other"),
+        "setting": LOCALE_MAP.get(record.get("school.locale"), "Other"),
+        "website": record.get("school.school_url"),
+        "location": ", ".join(
+            filter(None, [record.get("school.city"), record.get("school.state")])
+        ),
+    }
+
+
+# Response key -> (upstream fields it needs, builder). Order matches the full response.
+SCHOOL_FIELDS: dict[str, tuple[tuple[str, ...], Callable[[dict[str, Any]], Any]]] = {
+    "unit_id": _value("id"),
+    "name": _value("school.name"),
+    "city": _value("school.city"),
+    "state": _value("school.state"),
+    "website": _value("school.school_url"),
+    "year": _value("latest.academic_year"),
+    "organization_type": (
+        ("school.ownership",),
+        lambda record: OWNERSHIP_MAP.get(record.get("school.ownership"), "Other"),
+    ),
+    "size": _value("latest.student.size"),
+    "location_type": (
+        ("school.locale",),
+        lambda record: LOCALE_MAP.get(record.get("school.locale"), "Other"),
+    ),
+    "graduation_rate": _value("latest.completion.consumer_rate"),
+    "average_annual_cost": _value("latest.cost.avg_net_price.overall"),
+    "median_earnings": _value("latest.earnings.10_yrs_after_entry.median"),
+    "financial_aid_debt": _value("latest.aid.median_debt.completers.overall"),
+    "typical_earnings": _value("latest.earnings.10_yrs_after_entry.median"),
+    "campus_diversity": (
+        tuple(DIVERSITY_FIELDS.values()),
+        lambda record: {key: record.get(field) for key, field in DIVERSITY_FIELDS.items()},
+    ),
+    "sat_reading_25th": _value("latest.admissions.sat_scores.25th_percentile.critical_reading"),
+    "sat_reading_75th": _value("latest.admissions.sat_scores.75th_percentile.critical_reading"),
+    "act_score_25th": _value("latest.admissions.act_scores.25th_percentile.cumulative"),
+    "act_score_75th": _value("latest.admissions.act_scores.75th_percentile.cumulative"),
+    "acceptance_rate": (
+        ("latest.admissions.admission_rate.overall",),
+        lambda record: record.get("latest.admissions.admission_rate.overall") or 1.0,
+    ),
+    "full_time_enrollment": (
+        ("latest.student.size", "latest.student.part_time_share"),
+        lambda record: _enrollment(record)[0],
+    ),
+    "part_time_enrollment": (
+        ("latest.student.size", "latest.student.part_time_share"),
+        lambda record: _enrollment(record)[1],
+    ),
+    "first_year_return_rate": (
+        RETENTION_FIELDS,
+        lambda record: next(
+            (value for field in RETENTION_FIELDS if (value := record.get(field)) is not None),
+            None,
+        ),
+    ),
+    "student_faculty_ratio": _value("latest.student.demographics.student_faculty_ratio"),
+    "federal_loan_rate": _value("latest.aid.dcs_federal_loan_rate_pooled"),
+    "median_debt": _value("latest.aid.median_debt.completers.overall"),
+    "typical_monthly_payment": _value("latest.aid.median_debt.completers.monthly_payments"),
+    "repayment_rate": _value("latest.repayment.3_yr_repayment.completers.rate"),
+    "percent_more_than_hs": _value("latest.earnings.6_yrs_after_entry.gt_threshold"),
+    "family_income_net_price": (NET_PRICE_FIELDS, _family_income_net_price),
+    "socioeconomic_diversity": (
+        ("latest.student.share_firstgeneration", "latest.aid.pell_grant_rate"),
+        lambda record: {
+            "first_generation_share": record.get("latest.student.share_firstgeneration"),
+            "pell_grant_rate": record.get("latest.aid.pell_grant_rate"),
+        },
+    ),
+    "college_info": (
+        ("school.ownership", "school.locale", "school.school_url", "school.city", "school.state"),
+        _college_info,
+    ),
+}
+
+
+def parse_fields(raw: str | None) -> tuple[str, ...] | None:
+    """Parse a ``fields=`` query value into response keys; ``None`` means every field."""
+    if not raw:
+        return None
+    fields = tuple(dict.fromkeys(field.strip() for field in raw.split(",") if field.strip()))
+    unknown = [field for field in fields if field not in SCHOOL_FIELDS]
+    if unknown:
+        raise ValueError(f"Unknown fields: {', '.join(unknown)}")
+    # unit_id is always returned so clients can key the rows.
+    return ("unit_id", *(field for field in fields if field != "unit_id"))
+
+
+def upstream_fields(fields: Sequence[str] | None) -> str:
+    if not fields:
+        return ",".join(BASE_FIELDS)
+    needed = {source for key in fields for source in SCHOOL_FIELDS[key][0]}
+    return ",".join(field for field in BASE_FIELDS if field in needed)
+
+
+def _is_retryable(exc: BaseException) -> bool:
+    if isinstance(exc, httpx.HTTPStatusError):
+        return exc.response.status_code == 429 or exc.response.status_code >= 500
+    return isinstance(exc, httpx.TransportError)
+
+
+def _is_outage(exc: BaseException) -> bool:
+    if isinstance(exc, httpx.HTTPStatusError):
+        return exc.response.status_code >= 500
+    return isinstance(exc, httpx.TransportError)
+
+
+def _mark_stale(value: Any) -> Any:
+    return {**value, "stale": True} if isinstance(value, dict) else value
+
+
+def _header_int(response: httpx.Response, name: str) -> int | None:
+    value = response.headers.get(name)
+    try:
+        return int(float(value)) if value is not None else None
+    except ValueError:
+        return None
+
+
 class CollegeScorecardClient:
-    def __init__(self) -> None:
-        self.base_url = settings.college_scorecard_base_url.rstrip("/")
-        self.api_key = settings.college_scorecard_api_key
+    def __init__(self, *, base_url: str | None = None, api_key: str | None = None) -> None:
+        self.base_url = (base_url or settings.college_scorecard_base_url).rstrip("/")
+        self.api_key = api_key or settings.college_scorecard_api_key
+        self.backend = settings.college_scorecard_backend.strip().lower()
+        self._mirror = ScorecardMirror() if self.backend == "local" else None
+        self._http: httpx.AsyncClient | None = None
+        self._cache = TTLCache(
+            settings.college_scorecard_cache_size,
+            settings.college_scorecard_cache_ttl,
+            settings.college_scorecard_cache_stale_ttl,
+        )
+        # Upstream loads currently in flight, shared by concurrent callers of the same key.
+        self._inflight: dict[Hashable, asyncio.Task] = {}
+        self.coalesced = 0
+        self._limiter = TokenBucket(
+            settings.college_scorecard_rate_per_hour, settings.college_scorecard_burst
+        )
+        self._backoff = wait_random_exponential(
+            multiplier=settings.college_scorecard_backoff_base,
+            max=settings.college_scorecard_backoff_max,
+        )
+        self.retried = 0
+        self.throttled = 0
+        self._breaker = CircuitBreaker(
+            settings.college_scorecard_breaker_threshold,
+            settings.college_scorecard_breaker_reset,
+            is_failure=_is_outage,
+        )
+        self.served_stale = 0
+
+    def _build_http_client(self) -> httpx.AsyncClient:
+        timeout = httpx.Timeout(
+            settings.college_scorecard_timeout,
+            connect=settings.college_scorecard_connect_timeout,
+        )
+        limits = httpx.Limits(
+            max_connections=settings.college_scorecard_max_connections,
+            max_keepalive_connections=settings.college_scorecard_max_keepalive,
+            keepalive_expiry=settings.college_scorecard_keepalive_expiry,
+        )
+        http2 = settings.college_scorecard_http2
+        if http2:
+            try:
+                import h2  # noqa: F401
+            except ImportError:
+                logger.warning("h2 not installed; College Scorecard client using HTTP/1.1")
+                http2 = False
+        return httpx.AsyncClient(
+            base_url=self.base_url, timeout=timeout, limits=limits, http2=http2
+        )
+
+    async def start(self) -> None:
+        """Open the pooled HTTP client; called from the application lifespan."""
+        if self._http is None or self._http.is_closed:
+            self._http = self._build_http_client()
 
-    async def _get(self, path: str, params: dict[str, Any]) -> dict[str, Any]:
+    async def close(self) -> None:
+        for task in list(self._inflight.values()):
+            task.cancel()
+        self._inflight.clear()
+        if self._http is not None:
+            await self._http.aclose()
+            self._http = None
+
+    async def _fetch(
+        self, path: str, params: dict[str, Any], priority: int = PRIORITY_BULK
+    ) -> dict[str, Any]:
+        if self._mirror is not None:
+            return await self._mirror.query(params)
+        return await self._get(path, params, priority)
+
+    async def _get(
+        self, path: str, params: dict[str, Any], priority: int = PRIORITY_BULK
+    ) -> dict[str, Any]:
+        # Lazily open the pool for callers outside the app lifespan (scripts, shells).
+        if self._http is None or self._http.is_closed:
+            await self.start()
         query = {"api_key": self.api_key, "per_page": 25}
         query.update(params)
-        async with httpx.AsyncClient(timeout=20.0) as client:
-            response = await client.get(f"{self.base_url}{path}", params=query)
-            response.raise_for_status()
-            return response.json()
+        retrying = AsyncRetrying(
+            stop=stop_after_attempt(settings.college_scorecard_max_retries + 1),
+            wait=self._retry_wait,
+            retry=retry_if_exception(_is_retryable),
+            before_sleep=self._count_retry,
+            reraise=True,
+        )
+        # Background crawls may queue for the quota; request-path calls fail fast instead.
+        max_wait = (
+            None if priority == PRIORITY_BACKGROUND else settings.college_scorecard_max_queue_wait
+        )
+        async for attempt in retrying:
+            with attempt:
+                # Take the token outside the breaker so a local quota wait is not an outcome.
+                await self._limiter.acquire(priority, max_wait)
+                # An open breaker raises CircuitOpenError, which is not retried.
+                response = await self._breaker.call(lambda: self._request(path, query))
+        return response.json()
+
+    async def _request(self, path: str, query: dict[str, Any]) -> httpx.Response:
+        response = await self._http.get(path, params=query)
+        self._limiter.observe(
+            _header_int(response, "X-RateLimit-Remaining"),
+            _header_int(response, "X-RateLimit-Limit"),
+        )
+        if response.status_code == 429:
+            self.throttled += 1
+        response.raise_for_status()
+        return response
+
+    def _retry_wait(self, retry_state: RetryCallState) -> float:
+        exc = retry_state.outcome.exception() if retry_state.outcome else None
+        if isinstance(exc, httpx.HTTPStatusError):
+            retry_after = _header_int(exc.response, "Retry-After")
+            if retry_after is not None:
+                return min(float(retry_after), settings.college_scorecard_backoff_max)
+        return self._backoff(retry_state)
+
+    def _count_retry(self, retry_state: RetryCallState) -> None:
+        self.retried += 1
+        logger.warning(
+            "Retrying College Scorecard request (attempt %s): %r",
+            retry_state.attempt_number,
+            retry_state.outcome.exception() if retry_state.outcome else None,
+        )
 
     async def search_schools(
         self,
@@ -91,136 +394,263 @@ class CollegeScorecardClient:
         state: str | None = None,
         page: int = 0,
         per_page: int = 25,
+        fields: Sequence[str] | None = None,
+    ) -> dict[str, Any]:
+        fields = tuple(fields) if fields else None
+        search = search.strip() if search else None
+        state = state.strip().upper() if state else None
+        params = self._search_params(search, state, page, per_page, fields)
+
+        async def load() -> dict[str, Any]:
+            return await self._search_page(params, fields)
+
+        key = ("search", search.lower() if search else None, state, page, per_page, fields)
+        return await self._cached(key, load)
+
+    async def iter_schools(
+        self,
+        *,
+        search: str | None = None,
+        state: str | None = None,
+        per_page: int = 100,
+        fields: Sequence[str] | None = None,
+        priority: int = PRIORITY_BULK,
+        raw: bool = False,
+    ) -> AsyncIterator[dict[str, Any]]:
+        """Yield every school matching the query, page by page, bypassing the cache.
+
+        The next page is requested while the current one is being consumed, so at most two
+        pages are held in memory regardless of the size of the result set. Startup and
+        periodic crawls pass ``PRIORITY_BACKGROUND`` so they yield to user traffic and wait
+        out the quota instead of failing with ``RateLimitError``. With ``raw`` the upstream
+        records are yielded unmapped, keyed by Scorecard field name.
+        """
+        fields = tuple(fields) if fields else None
+        search = search.strip() if search else None
+        state = state.strip().upper() if state else None
+
+        def fetch(page: int) -> asyncio.Task:
+            params = self._search_params(search, state, page, per_page, fields)
+            return asyncio.create_task(self._search_page(params, fields, priority, raw))
+
+        page = 0
+        pending = fetch(page)
+        try:
+            while pending is not None:
+                payload = await pending
+                pending = None
+                results = payload["results"]
+                total = payload.get("metadata", {}).get("total")
+                page += 1
+                if results and (total is None or page * per_page < total):
+                    pending = fetch(page)
+                for school in results:
+                    yield school
+        finally:
+            if pending is not None:
+                pending.cancel()
+
+    def _search_params(
+        self,
+        search: str | None,
+        state: str | None,
+        page: int,
+        per_page: int,
+        fields: tuple[str, ...] | None,
     ) -> dict[str, Any]:
         params: dict[str, Any] = {
             "page": page,
             "per_page": per_page,
-            "fields": ",".join(BASE_FIELDS),
+            "fields": upstream_fields(fields),
             "sort": "latest.student.size:desc",
         }
         if search:
             params["school.name"] = search
         if state:
             params["school.state"] = state
-        payload = await self._get("/schools", params)
-        schools = [self._map_school(result) for result in payload.get("results", [])]
+        return params
+
+    async def _search_page(
+        self,
+        params: dict[str, Any],
+        fields: tuple[str, ...] | None,
+        priority: int = PRIORITY_BULK,
+        raw: bool = False,
+    ) -> dict[str, Any]:
+        payload = await self._fetch("/schools", params, priority)
+        results = payload.get("results", [])
+        schools = results if raw else [self._map_school(result, fields) for result in results]
         return {"results": schools, "metadata": payload.get("metadata", {})}
 
-    async def get_school(self, unit_id: str) -> dict[str, Any] | None:
-        params = {"id": unit_id, "fields": ",".join(BASE_FIELDS)}
-        payload = await self._get("/schools", params)
-        if not payload.get("results"):
-            return None
-        return self._map_school(payload["results"][0])
-
-    def _map_school(self, record: dict[str, Any]) -> dict[str, Any]:
-        ownership_code = record.get("school.ownership")
-        locale_code = record.get("school.locale")
-        graduation_rate = record.get("latest.completion.consumer_rate")
-        avg_cost = record.get("latest.cost.avg_net_price.overall")
-        median_earnings = record.get("latest.earnings.10_yrs_after_entry.median")
-        sat_reading_25th = record.get("latest.admissions.sat_scores.25th_percentile.critical_reading")
-        sat_reading_75th = record.get("latest.admissions.sat_scores.75th_percentile.critical_reading")
-        act_score_25th = record.get("latest.admissions.act_scores.25th_percentile.cumulative")
-        act_score_75th = record.get("latest.admissions.act_scores.75th_percentile.cumulative")
-        acceptance_rate = record.get("latest.admissions.admission_rate.overall") or 1.0
-        part_time_share = record.get("latest.student.part_time_share")
-        size = record.get("latest.student.size") or 0
-        full_time_enrollment = None
-        part_time_enrollment = None
-        if size and part_time_share is not None:
-            full_time_enrollment = int(round(size * (1 - part_time_share)))
-            part_time_enrollment = int(round(size * part_time_share))
-        student_faculty_ratio = record.get("latest.student.demographics.student_faculty_ratio")
-        diversity = {
-            "white": record.get("latest.student.share_white"),
-            "black": record.get("latest.student.share_black"),
-            "hispanic": record.get("latest.student.share_hispanic"),
-            "asian": record.get("latest.student.share_asian"),
-            "two_or_more": record.get("latest.student.share_two_or_more"),
-            "non_resident": record.get("latest.student.share_non_resident_alien"),
-        }
-        monthly_payment_median = record.get(
-            "latest.aid.median_debt.completers.monthly_payments"
+    async def get_school(
+        self, unit_id: str, fields: Sequence[str] | None = None
+    ) -> dict[str, Any] | None:
+        unit_id = str(unit_id).strip()
+        fields = tuple(fields) if fields else None
+        return await self._cached(
+            ("school", unit_id, fields), self._school_loader(unit_id, fields)
         )
-        typical_monthly_payment = monthly_payment_median
-
-        income_levels = [
-            "0-30000",
-            "30001-48000",
-            "48001-75000",
-            "75001-110000",
-            "110001-plus",
-        ]
-
-        def _income_breakdown(prefix: str) -> dict[str, Any]:
-            return {
-                level: record.get(f"latest.cost.net_price.{prefix}.by_income_level.{level}")
-                for level in income_levels
-            }
-
-        def _clean_breakdown(data: dict[str, Any]) -> dict[str, Any]:
-            return {level: value for level, value in data.items() if value is not None}
-
-        public_net_price = _clean_breakdown(_income_breakdown("public"))
-        private_net_price = _clean_breakdown(_income_breakdown("private"))
-
-        family_income_net_price = None
-        if public_net_price:
-            family_income_net_price = {"source": "public", "breakdown": public_net_price}
-        elif private_net_price:
-            family_income_net_price = {"source": "private", "breakdown": private_net_price}
-
-        retention_candidates = [
-            record.get("latest.student.retention_rate_suppressed.four_year.full_time_pooled"),
-            record.get("latest.student.retention_rate_suppressed.lt_four_year.full_time_pooled"),
-        ]
-        first_year_retention = next((value for value in retention_candidates if value is not None), None)
 
+    async def get_schools(
+        self, unit_ids: Sequence[str | int], fields: Sequence[str] | None = None
+    ) -> dict[str, Any]:
+        """Fetch several schools at once, preserving the requested order.
+
+        Cached ids are answered from memory; the rest are requested in a single upstream
+        query using the comma-separated ``id`` filter. If the upstream rejects the batch,
+        the remaining ids are fetched individually with bounded concurrency.
+        """
+        ids = list(dict.fromkeys(str(unit_id).strip() for unit_id in unit_ids))
+        fields = tuple(fields) if fields else None
+        found: dict[str, dict[str, Any] | None] = {}
+        pending: list[str] = []
+        for unit_id in ids:
+            key = ("school", unit_id, fields)
+            value, state = self._cache.lookup(key)
+            if state is None:
+                pending.append(unit_id)
+                continue
+            found[unit_id] = value
+            if state == STALE and key not in self._inflight:
+                self._start_load(key, self._school_loader(unit_id, fields)).add_done_callback(
+                    self._log_refresh_failure
+                )
+
+        if len(pending) > 1:
+            try:
+                found.update(await self._fetch_batch(pending, fields))
+                pending = []
+            except (httpx.HTTPError, CircuitOpenError, RateLimitError) as exc:
+                # A spent quota (429) or an outage goes to the stale fallback, not a fan-out.
+                if isinstance(exc, httpx.HTTPStatusError) and not _is_retryable(exc):
+                    logger.warning("Batched College Scorecard lookup rejected; fetching one by one")
+                else:
+                    fallback = {
+                        unit_id: self._cache.peek(("school", unit_id, fields))
+                        for unit_id in pending
+                    }
+                    if not any(known for _, known in fallback.values()):
+                        raise
+                    logger.warning("College Scorecard unavailable; serving last known schools")
+                    self.served_stale += 1
+                    found.update(
+                        (unit_id, _mark_stale(value))
+                        for unit_id, (value, known) in fallback.items()
+                        if known
+                    )
+                    pending = []
+
+        if pending:
+            semaphore = asyncio.Semaphore(settings.college_scorecard_max_concurrency)
+
+            async def fetch_one(unit_id: str) -> dict[str, Any] | None:
+                async with semaphore:
+                    return await self.get_school(unit_id, fields)
+
+            schools = await asyncio.gather(*(fetch_one(unit_id) for unit_id in pending))
+            found.update(zip(pending, schools, strict=True))
+
+        results = [found[unit_id] for unit_id in ids if found.get(unit_id)]
+        missing = [unit_id for unit_id in ids if not found.get(unit_id)]
+        stale = any(school.get("stale") for school in results)
+        return {"results": results, "missing": missing, "stale": stale}
+
+    async def _fetch_batch(
+        self, unit_ids: list[str], fields: tuple[str, ...] | None
+    ) -> dict[str, dict[str, Any] | None]:
+        params = {
+            "id": ",".join(unit_ids),
+            "per_page": len(unit_ids),
+            "fields": upstream_fields(fields),
+        }
+        payload = await self._fetch("/schools", params, PRIORITY_DETAIL)
+        found: dict[str, dict[str, Any] | None] = dict.fromkeys(unit_ids)
+        for record in payload.get("results", []):
+            unit_id = str(record.get("id"))
+            if unit_id in found:
+                found[unit_id] = self._map_school(record, fields)
+        for unit_id, school in found.items():
+            self._cache.set(("school", unit_id, fields), school)
+        return found
+
+    def _school_loader(
+        self, unit_id: str, fields: tuple[str, ...] | None = None
+    ) -> Callable[[], Awaitable[dict[str, Any] | None]]:
+        params = {"id": unit_id, "fields": upstream_fields(fields)}
+
+        async def load() -> dict[str, Any] | None:
+            payload = await self._fetch("/schools", params, PRIORITY_DETAIL)
+            if not payload.get("results"):
+                return None
+            return self._map_school(payload["results"][0], fields)
+
+        return load
+
+    def stats(self) -> dict[str, Any]:
         return {
-            "unit_id": record.get("id"),
-            "name": record.get("school.name"),
-            "city": record.get("school.city"),
-            "state": record.get("school.state"),
-            "website": record.get("school.school_url"),
-            "year": record.get("latest.academic_year"),
-            "organization_type": OWNERSHIP_MAP.get(ownership_code, "Other"),
-            "size": record.get("latest.student.size"),
-            "location_type": LOCALE_MAP.get(locale_code, "Other"),
-            "graduation_rate": graduation_rate,
-            "average_annual_cost": avg_cost,
-            "median_earnings": median_earnings,
-            "financial_aid_debt": record.get("latest.aid.median_debt.completers.overall"),
-            "typical_earnings": median_earnings,
-            "campus_diversity": diversity,
-            "sat_reading_25th": sat_reading_25th,
-            "sat_reading_75th": sat_reading_75th,
-            "act_score_25th": act_score_25th,
-            "act_score_75th": act_score_75th,
-            "acceptance_rate": acceptance_rate,
-            "full_time_enrollment": full_time_enrollment,
-            "part_time_enrollment": part_time_enrollment,
-            "first_year_return_rate": first_year_retention,
-            "student_faculty_ratio": student_faculty_ratio,
-            "federal_loan_rate": record.get("latest.aid.dcs_federal_loan_rate_pooled"),
-            "median_debt": record.get("latest.aid.median_debt.completers.overall"),
-            "typical_monthly_payment": typical_monthly_payment,
-            "repayment_rate": record.get("latest.repayment.3_yr_repayment.completers.rate"),
-            "percent_more_than_hs": record.get(
-                "latest.earnings.6_yrs_after_entry.gt_threshold"
-            ),
-            "family_income_net_price": family_income_net_price,
-            "socioeconomic_diversity": {
-                "first_generation_share": record.get("latest.student.share_firstgeneration"),
-                "pell_grant_rate": record.get("latest.aid.pell_grant_rate"),
-            },
-            "college_info": {
-                "type": OWNERSHIP_MAP.get(ownership_code, "Other"),
-                "setting": LOCALE_MAP.get(locale_code, "Other"),
-                "website": record.get("school.school_url"),
-                "location": ", ".join(filter(None, [record.get("school.city"), record.get("school.state")])),
-            },
+            **self._cache.stats(),
+            "coalesced": self.coalesced,
+            "rate_limited": self._limiter.throttled,
+            "rate_limit_rejected": self._limiter.rejected,
+            "throttled": self.throttled,
+            "retried": self.retried,
+            "breaker_state": self._breaker.state,
+            "breaker_trips": self._breaker.trips,
+            "breaker_rejected": self._breaker.rejected,
+            "served_stale": self.served_stale,
         }
 
+    async def _cached(self, key: Hashable, load: Callable[[], Awaitable[Any]]) -> Any:
+        value, state = self._cache.lookup(key)
+        if state == FRESH:
+            return value
+        if state == STALE:
+            # Stale-while-revalidate: answer from memory and refresh in the background.
+            if key not in self._inflight:
+                self._start_load(key, load).add_done_callback(self._log_refresh_failure)
+            return value
+        try:
+            # Shield the shared load so one caller disconnecting does not cancel it for the rest.
+            return await asyncio.shield(self._start_load(key, load))
+        except (httpx.HTTPError, CircuitOpenError, RateLimitError) as exc:
+            if isinstance(exc, httpx.HTTPStatusError) and not _is_retryable(exc):
+                raise
+            # Upstream is down, the breaker is open or the quota is spent: fall back to the
+            # last known good value.
+            value, known = self._cache.peek(key)
+            if not known:
+                raise
+            logger.warning("College Scorecard unavailable; serving stale entry key=%s", key)
+            self.served_stale += 1
+            return _mark_stale(value)
+
+    def _start_load(self, key: Hashable, load: Callable[[], Awaitable[Any]]) -> asyncio.Task:
+        task = self._inflight.get(key)
+        if task is not None:
+            self.coalesced += 1
+            return task
+
+        async def run() -> Any:
+            value = await load()
+            self._cache.set(key, value)
+            return value
+
+        task = asyncio.create_task(run())
+        self._inflight[key] = task
+        task.add_done_callback(
+            lambda done: self._inflight.pop(key) if self._inflight.get(key) is done else None
+        )
+        return task
+
+    @staticmethod
+    def _log_refresh_failure(task: asyncio.Task) -> None:
+        if not task.cancelled() and task.exception() is not None:
+            logger.warning("Background College Scorecard refresh failed: %r", task.exception())
+
+    def _map_school(
+        self, record: dict[str, Any], fields: Sequence[str] | None = None
+    ) -> dict[str, Any]:
+        return {key: SCHOOL_FIELDS[key][1](record) for key in (fields or SCHOOL_FIELDS)}
+
 
 client = CollegeScorecardClient()
@@ -0,0 +1,120 @@
+from __future__ import annotations
+
+import asyncio
+import heapq
+import itertools
+import time
+
+PRIORITY_DETAIL = 0
+PRIORITY_BULK = 1
+# Background crawls (suggest index, ranking table): served last and allowed to wait.
+PRIORITY_BACKGROUND = 2
+
+
+class RateLimitError(Exception):
+    """Raised when a call would wait longer than allowed for a token."""
+
+    def __init__(self, retry_after: float) -> None:
+        super().__init__("Upstream request quota exhausted")
+        self.retry_after = retry_after
+
+
+class TokenBucket:
+    """Async token bucket with priority ordering and quota feedback from response headers.
+
+    Waiters are served lowest ``priority`` first, FIFO within a priority, so detail lookups
+    overtake queued bulk searches. ``observe`` slows the refill rate when the upstream
+    reports that the remaining quota for the current window is running low. Callers on the
+    request path pass ``max_wait`` so an exhausted quota fails fast with ``RateLimitError``
+    instead of queueing without bound.
+    """
+
+    def __init__(
+        self, rate_per_hour: float, burst: int, window: float = 3600.0, low_water: float = 0.1
+    ) -> None:
+        self.base_rate = rate_per_hour / window
+        self.rate = self.base_rate
+        self.capacity = max(1, burst)
+        self.window = window
+        self.low_water = low_water
+        self._tokens = float(self.capacity)
+        self._updated = time.monotonic()
+        self._waiters: list[tuple[int, int]] = []
+        self._sequence = itertools.count()
+        self._changed = asyncio.Event()
+        self.throttled = 0
+        self.rejected = 0
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def _notify(self) -> None:
+        self._changed.set()
+        self._changed = asyncio.Event()
+
+    def _expected_wait(self) -> float:
+        """Rough time until every current waiter has been served."""
+        missing = len(self._waiters) - self._tokens
+        return max(missing, 1) / self.rate if self.rate > 0 else self.window
+
+    async def acquire(self, priority: int = PRIORITY_BULK, max_wait: float | None = None) -> None:
+        """Wait for a token; raise ``RateLimitError`` instead of waiting beyond ``max_wait``."""
+        deadline = None if max_wait is None else time.monotonic() + max_wait
+        entry = (priority, next(self._sequence))
+        heapq.heappush(self._waiters, entry)
+        if self._waiters[0] == entry:
+            self._notify()
+        waited = False
+        try:
+            while True:
+                self._refill()
+                if deadline is not None and time.monotonic() >= deadline:
+                    self.rejected += 1
+                    raise RateLimitError(self._expected_wait())
+                if self._waiters[0] == entry:
+                    if self._tokens >= 1:
+                        heapq.heappop(self._waiters)
+                        self._tokens -= 1
+                        if waited:
+                            self.throttled += 1
+                        self._notify()
+                        return
+                    waited = True
+                    changed = self._changed
+                    delay = (1 - self._tokens) / self.rate if self.rate > 0 else 1.0
+                    if deadline is not None and time.monotonic() + delay > deadline:
+                        # The next token arrives too late; fail now rather than at the deadline.
+                        self.rejected += 1
+                        raise RateLimitError(delay)
+                    # Wake on refill, or earlier if a higher-priority caller joins the queue.
+                    try:
+                        await asyncio.wait_for(changed.wait(), timeout=delay)
+                    except TimeoutError:
+                        pass
+                else:
+                    waited = True
+                    timeout = None if deadline is None else deadline - time.monotonic()
+                    try:
+                        await asyncio.wait_for(self._changed.wait(), timeout=timeout)
+                    except TimeoutError:
+                        pass
+        except BaseException:
+            if entry in self._waiters:
+                self._waiters.remove(entry)
+                heapq.heapify(self._waiters)
+                self._notify()
+            raise
+
+    def observe(self, remaining: int | None, limit: int | None) -> None:
+        if remaining is None:
+            return
+        self._refill()
+        limit = limit or remaining
+        if limit and remaining <= limit * self.low_water:
+            # Spread what is left of the quota over the rest of the window.
+            self.rate = min(self.base_rate, max(remaining, 1) / self.window)
+            self._tokens = min(self._tokens, float(remaining))
+        else:
+            self.rate = self.base_rate
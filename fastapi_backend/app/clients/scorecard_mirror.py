@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+from typing import Any
+
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.db.session import AsyncSessionLocal
+from app.models.scorecard import ScorecardSchool
+
+# College Scorecard API field -> ScorecardSchool column.
+FIELD_COLUMNS: dict[str, str] = {
+    "id": "id",
+    "school.name": "name",
+    "school.city": "city",
+    "school.state": "state",
+    "school.school_url": "school_url",
+    "school.ownership": "ownership",
+    "school.locale": "locale",
+    "latest.student.size": "student_size",
+    "latest.student.part_time_share": "part_time_share",
+    "latest.academic_year": "academic_year",
+    "latest.completion.consumer_rate": "completion_rate",
+    "latest.cost.avg_net_price.overall": "avg_net_price",
+    "latest.earnings.10_yrs_after_entry.median": "earnings_10yr_median",
+    "latest.aid.median_debt.completers.overall": "median_debt",
+    "latest.aid.median_debt.completers.monthly_payments": "median_debt_monthly_payment",
+    "latest.student.share_white": "share_white",
+    "latest.student.share_black": "share_black",
+    "latest.student.share_hispanic": "share_hispanic",
+    "latest.student.share_asian": "share_asian",
+    "latest.student.share_two_or_more": "share_two_or_more",
+    "latest.student.share_non_resident_alien": "share_non_resident_alien",
+    "latest.student.share_firstgeneration": "share_first_generation",
+    "latest.aid.pell_grant_rate": "pell_grant_rate",
+    "latest.aid.dcs_federal_loan_rate_pooled": "federal_loan_rate",
+    "latest.student.demographics.student_faculty_ratio": "student_faculty_ratio",
+    "latest.student.retention_rate_suppressed.four_year.full_time_pooled": "retention_four_year",
+    "latest.student.retention_rate_suppressed.lt_four_year.full_time_pooled": (
+        "retention_lt_four_year"
+    ),
+    "latest.admissions.sat_scores.25th_percentile.critical_reading": "sat_reading_25th",
+    "latest.admissions.sat_scores.75th_percentile.critical_reading": "sat_reading_75th",
+    "latest.admissions.act_scores.25th_percentile.cumulative": "act_cumulative_25th",
+    "latest.admissions.act_scores.75th_percentile.cumulative": "act_cumulative_75th",
+    "latest.admissions.admission_rate.overall": "admission_rate",
+    "latest.repayment.3_yr_repayment.completers.rate": "repayment_rate_3yr",
+    "latest.earnings.6_yrs_after_entry.gt_threshold": "earnings_6yr_gt_threshold",
+}
+for _sector in ("public", "private"):
+    for _level in ("0-30000", "30001-48000", "48001-75000", "75001-110000", "110001-plus"):
+        FIELD_COLUMNS[f"latest.cost.net_price.{_sector}.by_income_level.{_level}"] = (
+            f"net_price_{_sector}_{_level.replace('-', '_')}"
+        )
+
+
+class ScorecardMirror:
+    """Answers College Scorecard ``/schools`` queries from the local ``scorecard_schools`` table.
+
+    ``query`` accepts the same parameters the upstream API does (``id``, ``school.name``,
+    ``school.state``, ``page``, ``per_page``, ``fields``) and returns the same payload shape,
+    so the client's mapping code is shared by both backends.
+    """
+
+    def __init__(self, session_factory: async_sessionmaker[AsyncSession] = AsyncSessionLocal):
+        self._session_factory = session_factory
+
+    async def query(self, params: dict[str, Any]) -> dict[str, Any]:
+        page = int(params.get("page", 0))
+        per_page = int(params.get("per_page", 25))
+        stmt = select(ScorecardSchool)
+        if ids := params.get("id"):
+            unit_ids = [int(value) for value in str(ids).split(",") if value.strip().isdigit()]
+            stmt = stmt.where(ScorecardSchool.id.in_(unit_ids))
+        if name := params.get("school.name"):
+            escaped = name.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+            stmt = stmt.where(ScorecardSchool.name.ilike(f"%{escaped}%", escape="\\"))
+        if state := params.get("school.state"):
+            stmt = stmt.where(ScorecardSchool.state == str(state).upper())
+
+        async with self._session_factory() as session:
+            total = await session.scalar(select(func.count()).select_from(stmt.subquery()))
+            rows = await session.scalars(
+                stmt.order_by(ScorecardSchool.student_size.desc().nulls_last(), ScorecardSchool.id)
+                .offset(page * per_page)
+                .limit(per_page)
+            )
+            schools = rows.all()
+
+        fields = params.get("fields")
+        requested = fields.split(",") if fields else list(FIELD_COLUMNS)
+        return {
+            "metadata": {"page": page, "per_page": per_page, "total": total or 0},
+            "results": [self._to_record(school, requested) for school in schools],
+        }
+
+    @staticmethod
+    def _to_record(school: ScorecardSchool, fields: list[str]) -> dict[str, Any]:
+        return {
+            field: getattr(school, FIELD_COLUMNS[field])
+            for field in fields
+            if field in FIELD_COLUMNS
+        }
@@ -1,9 +1,13 @@
 from functools import lru_cache
+from pathlib import Path
 from typing import List, Union
 
 from pydantic import AnyHttpUrl, Field, field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
+# Static catalog JSON shipped with the frontend (programdetail.json, career_program_data.json, ...).
+_FRONTEND_ASSETS_DIR = Path(__file__).resolve().parents[3] / "ChatbotUI" / "public" / "assets"
+
 
 class Settings(BaseSettings):
     model_config = SettingsConfigDict(
@@ -23,6 +27,14 @@ class Settings(BaseSettings):
     jwt_secret: str = Field(..., alias="JWT_SECRET")
     jwt_algorithm: str = Field("HS256", alias="JWT_ALGORITHM")
     access_token_expire_minutes: int = Field(60, alias="ACCESS_TOKEN_EXPIRE_MINUTES")
+    # Resolved users are cached per worker; deactivation reaches other workers within the TTL.
+    auth_user_cache_ttl: float = Field(30.0, alias="AUTH_USER_CACHE_TTL")
+    auth_cache_size: int = Field(4096, alias="AUTH_CACHE_SIZE")
+    # PBKDF2-SHA256 work factor; stored hashes with other parameters are re-hashed on login.
+    password_hash_rounds: int = Field(29000, alias="PASSWORD_HASH_ROUNDS")
+    password_hash_workers: int = Field(4, alias="PASSWORD_HASH_WORKERS")
+    # Hashing calls allowed in flight (running + queued) before sign-ins get a 503.
+    password_hash_max_pending: int = Field(64, alias="PASSWORD_HASH_MAX_PENDING")
 
     cors_origins: List[AnyHttpUrl] | List[str] = Field(default_factory=list, alias="CORS_ORIGINS")
 
@@ -42,6 +54,65 @@ class Settings(BaseSettings):
         "https://api.data.gov/ed/collegescorecard/v1",
         alias="COLLEGE_SCORECARD_BASE_URL",
     )
+    # "api" proxies api.data.gov; "local" answers from the scorecard_schools mirror.
+    college_scorecard_backend: str = Field("api", alias="COLLEGE_SCORECARD_BACKEND")
+    college_scorecard_timeout: float = Field(20.0, alias="COLLEGE_SCORECARD_TIMEOUT")
+    college_scorecard_connect_timeout: float = Field(
+        5.0, alias="COLLEGE_SCORECARD_CONNECT_TIMEOUT"
+    )
+    college_scorecard_max_connections: int = Field(
+        50, alias="COLLEGE_SCORECARD_MAX_CONNECTIONS"
+    )
+    college_scorecard_max_keepalive: int = Field(20, alias="COLLEGE_SCORECARD_MAX_KEEPALIVE")
+    college_scorecard_keepalive_expiry: float = Field(
+        30.0, alias="COLLEGE_SCORECARD_KEEPALIVE_EXPIRY"
+    )
+    college_scorecard_http2: bool = Field(True, alias="COLLEGE_SCORECARD_HTTP2")
+    college_scorecard_max_concurrency: int = Field(
+        5, alias="COLLEGE_SCORECARD_MAX_CONCURRENCY"
+    )
+    college_scorecard_rate_per_hour: float = Field(
+        1000, alias="COLLEGE_SCORECARD_RATE_PER_HOUR"
+    )
+    college_scorecard_burst: int = Field(20, alias="COLLEGE_SCORECARD_BURST")
+    college_scorecard_max_queue_wait: float = Field(
+        10.0, alias="COLLEGE_SCORECARD_MAX_QUEUE_WAIT"
+    )
+    college_scorecard_max_retries: int = Field(3, alias="COLLEGE_SCORECARD_MAX_RETRIES")
+    college_scorecard_backoff_base: float = Field(0.5, alias="COLLEGE_SCORECARD_BACKOFF_BASE")
+    college_scorecard_backoff_max: float = Field(8.0, alias="COLLEGE_SCORECARD_BACKOFF_MAX")
+    college_scorecard_breaker_threshold: int = Field(
+        5, alias="COLLEGE_SCORECARD_BREAKER_THRESHOLD"
+    )
+    college_scorecard_breaker_reset: float = Field(30.0, alias="COLLEGE_SCORECARD_BREAKER_RESET")
+    college_scorecard_cache_size: int = Field(2048, alias="COLLEGE_SCORECARD_CACHE_SIZE")
+    college_scorecard_cache_ttl: float = Field(6 * 3600, alias="COLLEGE_SCORECARD_CACHE_TTL")
+    college_scorecard_cache_stale_ttl: float = Field(
+        7 * 24 * 3600, alias="COLLEGE_SCORECARD_CACHE_STALE_TTL"
+    )
+    # JSON list of {unit_id, name, city, state, size}. Without the Scorecard mirror the
+    # suggest index is crawled from the API and written here, so restarts load it directly.
+    university_name_snapshot_path: str | None = Field(
+        None, alias="UNIVERSITY_NAME_SNAPSHOT_PATH"
+    )
+    # Seconds between rebuilds of the suggest index from the mirror or the API.
+    university_index_refresh_interval: float = Field(
+        24 * 3600, alias="UNIVERSITY_INDEX_REFRESH_INTERVAL"
+    )
+    # Seconds between reloads of the ranking table from the mirror or the API.
+    university_ranking_refresh_interval: float = Field(
+        24 * 3600, alias="UNIVERSITY_RANKING_REFRESH_INTERVAL"
+    )
+    catalog_assets_dir: str = Field(str(_FRONTEND_ASSETS_DIR), alias="CATALOG_ASSETS_DIR")
+    # Seconds between checks of the catalog files for changes.
+    catalog_reload_interval: float = Field(30.0, alias="CATALOG_RELOAD_INTERVAL")
+    # Seconds the plan generator may search before returning its best plan so far.
+    plan_generator_time_budget: float = Field(0.08, alias="PLAN_GENERATOR_TIME_BUDGET")
+    # "memory" (per worker), "redis" (shared across workers; needs the redis extra) or "none".
+    plan_cache_backend: str = Field("memory", alias="PLAN_CACHE_BACKEND")
+    plan_cache_url: str = Field("redis://localhost:6379/0", alias="PLAN_CACHE_URL")
+    plan_cache_size: int = Field(2048, alias="PLAN_CACHE_SIZE")
+    plan_cache_ttl: float = Field(300.0, alias="PLAN_CACHE_TTL")
     default_admin_email: str = Field(..., alias="DEFAULT_ADMIN_EMAIL")
     default_admin_password: str = Field(..., alias="DEFAULT_ADMIN_PASSWORD")
 
@@ -1,24 +1,62 @@
+import asyncio
 from contextlib import asynccontextmanager
 import logging
 import uuid
 
+import httpx
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.requests import Request
 from fastapi.responses import JSONResponse
 
 from app.api.routes import get_api_router
+from app.clients.circuit_breaker import CircuitOpenError
+from app.clients.college_scorecard import client as scorecard_client
+from app.clients.rate_limit import RateLimitError
 from app.core.config import settings
 from app.db.session import engine
+from app.security.auth import hashing_pool
+from app.services.career_catalog import career_catalog
+from app.services.plan_cache import plan_cache
+from app.services.program_catalog import program_catalog
+from app.services.university_index import name_index
+from app.services.university_ranking import ranking_engine
+from app.utils.http_cache import ConditionalGetMiddleware
+from app.utils.periodic import run_periodically
 
 logger = logging.getLogger(__name__)
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
+    await scorecard_client.start()
+    await program_catalog.refresh()
+    await career_catalog.refresh()
+    # Typeahead is optional: build it in the background and keep it fresh.
+    index_task = asyncio.create_task(
+        run_periodically(
+            "University suggest index",
+            name_index.refresh,
+            settings.university_index_refresh_interval,
+            first=lambda: name_index.refresh(prefer_snapshot=True),
+        )
+    )
+    # Loading every school takes many upstream pages; do it without delaying startup.
+    ranking_task = asyncio.create_task(
+        run_periodically(
+            "University ranking table",
+            ranking_engine.refresh,
+            settings.university_ranking_refresh_interval,
+        )
+    )
     try:
         yield
     finally:
+        ranking_task.cancel()
+        index_task.cancel()
+        await scorecard_client.close()
+        await plan_cache.close()
+        hashing_pool.close()
         await engine.dispose()
 
 
@@ -38,6 +76,44 @@ def create_application() -> FastAPI:
             "data": {"name": settings.app_name, "version": "1.0.0"},
         }
 
+    @app.exception_handler(CircuitOpenError)
+    async def upstream_unavailable_handler(request: Request, exc: CircuitOpenError):
+        return JSONResponse(
+            status_code=503,
+            content={"success": False, "message": "University data is temporarily unavailable"},
+            headers={"Retry-After": str(max(1, int(exc.retry_after)))},
+        )
+
+    @app.exception_handler(httpx.HTTPError)
+    async def upstream_error_handler(request: Request, exc: httpx.HTTPError):
+        # Reached once retries and the stale fallback are exhausted.
+        logger.warning("College Scorecard request failed path=%s: %r", request.url.path, exc)
+        retry_after = settings.college_scorecard_breaker_reset
+        if isinstance(exc, httpx.HTTPStatusError):
+            code = exc.response.status_code
+            if code < 500 and code != 429:
+                # Rejected rather than unavailable (bad API key, bad query): retrying won't help.
+                return JSONResponse(
+                    status_code=502,
+                    content={"success": False, "message": "University data request was rejected"},
+                )
+            header = exc.response.headers.get("Retry-After", "")
+            retry_after = float(header) if header.isdigit() else retry_after
+        timed_out = isinstance(exc, httpx.TimeoutException)
+        return JSONResponse(
+            status_code=504 if timed_out else 503,
+            content={"success": False, "message": "University data is temporarily unavailable"},
+            headers={"Retry-After": str(max(1, int(retry_after)))},
+        )
+
+    @app.exception_handler(RateLimitError)
+    async def upstream_quota_handler(request: Request, exc: RateLimitError):
+        return JSONResponse(
+            status_code=503,
+            content={"success": False, "message": "University data is busy, please retry"},
+            headers={"Retry-After": str(max(1, int(exc.retry_after)))},
+        )
+
     @app.exception_handler(Exception)
     async def unhandled_exception_handler(request: Request, exc: Exception):
         request_id = uuid.uuid4().hex
@@ -51,6 +127,8 @@ def create_application() -> FastAPI:
             payload["detail"] = str(exc)
         return JSONResponse(status_code=500, content=payload)
 
+    # Added first so it sits inside CORS and tags the final JSON body.
+    app.add_middleware(ConditionalGetMiddleware)
     app.add_middleware(
         CORSMiddleware,
         allow_origins=[str(origin) for origin in settings.cors_origins] or ["*"],
@@ -8,3 +8,4 @@ from app.models.education_plan import (  # noqa: F401
     ProgramCourse,
     State,
 )
+from app.models.scorecard import ScorecardSchool  # noqa: F401
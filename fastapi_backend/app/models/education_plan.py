@@ -3,7 +3,8 @@ from __future__ import annotations
 from datetime import datetime
 from typing import List
 
-from sqlalchemy import Boolean, DateTime, ForeignKey, Integer, JSON, String, func
+from sqlalchemy import Boolean, DateTime, ForeignKey, Index, Integer, JSON, String, func
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.db.base import Base
@@ -11,13 +12,37 @@ from app.db.base import Base
 
 class EducationPlan(Base):
     __tablename__ = "education_plans"
+    __table_args__ = (
+        Index(
+            "ix_education_plans_user_program_degree",
+            "user_id",
+            "program_name",
+            "university_name",
+            "degree_norm",
+        ),
+        Index(
+            "ix_education_plans_program_degree",
+            "program_name",
+            "university_name",
+            "degree_norm",
+        ),
+        Index("ix_education_plans_user_updated", "user_id", "updated_at", "id"),
+        Index(
+            "ix_education_plans_payload",
+            "payload",
+            postgresql_using="gin",
+            postgresql_ops={"payload": "jsonb_path_ops"},
+        ),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
     user_id: Mapped[int] = mapped_column(ForeignKey("users.id", ondelete="CASCADE"), index=True)
     program_name: Mapped[str] = mapped_column(String(256))
     university_name: Mapped[str] = mapped_column(String(256))
     degree: Mapped[str | None] = mapped_column(String(128), nullable=True)
-    payload: Mapped[dict] = mapped_column(JSON)
+    # Lower-cased, trimmed degree used for indexed lookups; "" when the plan has no degree.
+    degree_norm: Mapped[str] = mapped_column(String(128), default="", server_default="")
+    payload: Mapped[dict] = mapped_column(JSONB)
     created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
     updated_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), server_default=func.now(), onupdate=func.now()
@@ -63,11 +88,19 @@ class CourseSchedule(Base):
 
 class CourseReschedule(Base):
     __tablename__ = "course_reschedules"
+    __table_args__ = (
+        Index(
+            "ix_course_reschedules_payload",
+            "payload",
+            postgresql_using="gin",
+            postgresql_ops={"payload": "jsonb_path_ops"},
+        ),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
     user_id: Mapped[int] = mapped_column(ForeignKey("users.id", ondelete="CASCADE"))
     requested_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
-    payload: Mapped[dict] = mapped_column(JSON)
+    payload: Mapped[dict] = mapped_column(JSONB)
 
     user: Mapped["User"] = relationship(back_populates="reschedules")
 
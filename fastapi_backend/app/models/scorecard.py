@@ -0,0 +1,67 @@
+from __future__ import annotations
+
+from sqlalchemy import Float, Index, Integer, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.db.base import Base
+
+
+class ScorecardSchool(Base):
+    """Local mirror of the College Scorecard fields listed in ``BASE_FIELDS``."""
+
+    __tablename__ = "scorecard_schools"
+    __table_args__ = (
+        Index(
+            "ix_scorecard_schools_name_trgm",
+            "name",
+            postgresql_using="gin",
+            postgresql_ops={"name": "gin_trgm_ops"},
+        ),
+        Index("ix_scorecard_schools_state_size", "state", "student_size"),
+        Index("ix_scorecard_schools_student_size", "student_size"),
+    )
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=False)
+    name: Mapped[str | None] = mapped_column(String(256))
+    city: Mapped[str | None] = mapped_column(String(128))
+    state: Mapped[str | None] = mapped_column(String(8))
+    school_url: Mapped[str | None] = mapped_column(String(512))
+    ownership: Mapped[int | None] = mapped_column(Integer)
+    locale: Mapped[int | None] = mapped_column(Integer)
+    student_size: Mapped[int | None] = mapped_column(Integer)
+    part_time_share: Mapped[float | None] = mapped_column(Float)
+    academic_year: Mapped[int | None] = mapped_column(Integer)
+    completion_rate: Mapped[float | None] = mapped_column(Float)
+    avg_net_price: Mapped[float | None] = mapped_column(Float)
+    earnings_10yr_median: Mapped[float | None] = mapped_column(Float)
+    median_debt: Mapped[float | None] = mapped_column(Float)
+    median_debt_monthly_payment: Mapped[float | None] = mapped_column(Float)
+    share_white: Mapped[float | None] = mapped_column(Float)
+    share_black: Mapped[float | None] = mapped_column(Float)
+    share_hispanic: Mapped[float | None] = mapped_column(Float)
+    share_asian: Mapped[float | None] = mapped_column(Float)
+    share_two_or_more: Mapped[float | None] = mapped_column(Float)
+    share_non_resident_alien: Mapped[float | None] = mapped_column(Float)
+    share_first_generation: Mapped[float | None] = mapped_column(Float)
+    pell_grant_rate: Mapped[float | None] = mapped_column(Float)
+    federal_loan_rate: Mapped[float | None] = mapped_column(Float)
+    student_faculty_ratio: Mapped[float | None] = mapped_column(Float)
+    retention_four_year: Mapped[float | None] = mapped_column(Float)
+    retention_lt_four_year: Mapped[float | None] = mapped_column(Float)
+    sat_reading_25th: Mapped[float | None] = mapped_column(Float)
+    sat_reading_75th: Mapped[float | None] = mapped_column(Float)
+    act_cumulative_25th: Mapped[float | None] = mapped_column(Float)
+    act_cumulative_75th: Mapped[float | None] = mapped_column(Float)
+    admission_rate: Mapped[float | None] = mapped_column(Float)
+    repayment_rate_3yr: Mapped[float | None] = mapped_column(Float)
+    earnings_6yr_gt_threshold: Mapped[float | None] = mapped_column(Float)
+    net_price_public_0_30000: Mapped[float | None] = mapped_column(Float)
+    net_price_public_30001_48000: Mapped[float | None] = mapped_column(Float)
+    net_price_public_48001_75000: Mapped[float | None] = mapped_column(Float)
+    net_price_public_75001_110000: Mapped[float | None] = mapped_column(Float)
+    net_price_public_110001_plus: Mapped[float | None] = mapped_column(Float)
+    net_price_private_0_30000: Mapped[float | None] = mapped_column(Float)
+    net_price_private_30001_48000: Mapped[float | None] = mapped_column(Float)
+    net_price_private_48001_75000: Mapped[float | None] = mapped_column(Float)
+    net_price_private_75001_110000: Mapped[float | None] = mapped_column(Float)
+    net_price_private_110001_plus: Mapped[float | None] = mapped_column(Float)
@@ -48,6 +48,20 @@ class EducationPlanDeleteRequest(BaseModel):
 
 class EducationPlanListQuery(BaseModel):
     email: EmailStr
+    # Without a limit every plan is returned (legacy behaviour).
+    limit: int | None = Field(None, ge=1, le=200)
+    cursor: str | None = None
+    summary: bool = False
+
+
+class PlanGenerateRequest(BaseModel):
+    program: str
+    university: str
+    degree: str | None = None
+    completed: list[str] = Field(default_factory=list)
+    max_credits: int = Field(18, ge=1, le=30)
+    semesters: list[str] = Field(default_factory=lambda: ["Fall", "Spring"], min_length=1)
+    max_semesters: int = Field(16, ge=1, le=24)
 
 
 class RescheduleEntry(BaseModel):
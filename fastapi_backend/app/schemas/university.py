@@ -1,4 +1,4 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 
 
 class DiversityStats(BaseModel):
@@ -65,3 +65,12 @@ class University(BaseModel):
 
 class CompareRequest(BaseModel):
     unit_ids: list[int]
+
+
+class RankRequest(BaseModel):
+    weights: dict[str, float] = Field(
+        default_factory=lambda: {"graduation_rate": 1.0, "median_earnings": 1.0}
+    )
+    income_bracket: str | None = None
+    state: str | None = None
+    limit: int = Field(10, ge=1, le=100)
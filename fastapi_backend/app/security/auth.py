@@ -1,34 +1,62 @@
+import hashlib
+import time
 from datetime import datetime, timedelta
-from typing import Annotated
+from typing import Annotated, Any
 
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
 from jose import JWTError, jwt
 from passlib.context import CryptContext
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import event, inspect, select
+from sqlalchemy.orm import Session, make_transient_to_detached
 
 from app.core.config import settings
 from app.db.session import get_db
 from app.models.user import User
+from app.security.hashing import HashingPool
+from app.utils.cache import TTLCache
 
 # NOTE: Use a pure-Python password hash scheme to avoid bcrypt backend issues on some
 # deployment runtimes (e.g., Python 3.13 wheels / bcrypt backend incompatibilities).
-pwd_context = CryptContext(schemes=["pbkdf2_sha256"], deprecated="auto")
+# Hashes with a different round count are flagged by needs_update and replaced on login.
+pwd_context = CryptContext(
+    schemes=["pbkdf2_sha256"],
+    deprecated="auto",
+    pbkdf2_sha256__rounds=settings.password_hash_rounds,
+    pbkdf2_sha256__min_rounds=settings.password_hash_rounds,
+    pbkdf2_sha256__max_rounds=settings.password_hash_rounds,
+)
+hashing_pool = HashingPool(settings.password_hash_workers, settings.password_hash_max_pending)
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl=f"{settings.api_prefix}/users/login")
 
+# token digest -> (subject, exp); an entry never outlives the token it was decoded from.
+_token_cache = TTLCache(
+    maxsize=settings.auth_cache_size, ttl=settings.access_token_expire_minutes * 60
+)
+# subject -> column values of an active user. Per worker: forget_user only clears the
+# local copy, so other workers may serve the old state for up to AUTH_USER_CACHE_TTL.
+_user_cache = TTLCache(maxsize=settings.auth_cache_size, ttl=settings.auth_user_cache_ttl)
+
 
 class AuthError(HTTPException):
     def __init__(self, detail: str, status_code: int = status.HTTP_401_UNAUTHORIZED) -> None:
         super().__init__(status_code=status_code, detail=detail)
 
 
-def hash_password(password: str) -> str:
-    return pwd_context.hash(password)
+async def hash_password(password: str) -> str:
+    return await hashing_pool.run(pwd_context.hash, password)
+
+
+async def verify_password(plain_password: str, hashed_password: str) -> bool:
+    return await hashing_pool.run(pwd_context.verify, plain_password, hashed_password)
 
 
-def verify_password(plain_password: str, hashed_password: str) -> bool:
-    return pwd_context.verify(plain_password, hashed_password)
+async def verify_and_update_password(
+    plain_password: str, hashed_password: str
+) -> tuple[bool, str | None]:
+    """Verify a password; on success also return a new hash if the stored one is outdated."""
+    return await hashing_pool.run(pwd_context.verify_and_update, plain_password, hashed_password)
 
 
 def create_access_token(subject: str, expires_minutes: int | None = None) -> str:
@@ -38,9 +66,11 @@ def create_access_token(subject: str, expires_minutes: int | None = None) -> str
     return jwt.encode(payload, settings.jwt_secret, algorithm=settings.jwt_algorithm)
 
 
-async def get_current_user(
-    token: Annotated[str, Depends(oauth2_scheme)], db: Annotated[AsyncSession, Depends(get_db)]
-) -> User:
+def _decode_subject(token: str) -> str:
+    key = hashlib.blake2b(token.encode(), digest_size=16).digest()
+    cached = _token_cache.get(key)
+    if cached is not None and cached[1] > time.time():
+        return cached[0]
     try:
         payload = jwt.decode(token, settings.jwt_secret, algorithms=[settings.jwt_algorithm])
         email: str | None = payload.get("sub")
@@ -49,9 +79,57 @@ async def get_current_user(
 
     if not email:
         raise AuthError("Invalid authentication payload")
+    expires = payload.get("exp")
+    if isinstance(expires, (int, float)):
+        _token_cache.set(key, (email, float(expires)), ttl=float(expires) - time.time())
+    return email
+
+
+def _user_state(user: User) -> dict[str, Any]:
+    return {attr.key: getattr(user, attr.key) for attr in User.__mapper__.column_attrs}
+
+
+def forget_user(email: str) -> None:
+    """Drop the cached state of a user; call after committing any change to the user."""
+    _user_cache.invalidate(email)
+    _user_cache.invalidate(email.lower())
+
+
+@event.listens_for(User, "after_update")
+@event.listens_for(User, "after_delete")
+def _forget_flushed_user(mapper, connection, target: User) -> None:
+    # Covers ORM changes made anywhere (deactivation, profile edits, deletes). Bulk
+    # UPDATE statements bypass this hook and must call forget_user themselves.
+    state = inspect(target)
+    if state.session is None:
+        return
+    # Only drop the entries once the change is committed: until then a concurrent request
+    # still reads the old row and would put it straight back into the cache.
+    pending = state.session.info.setdefault("forget_users", set())
+    pending.update(email for email in (target.email, *state.attrs.email.history.deleted) if email)
+
+
+@event.listens_for(Session, "after_commit")
+def _forget_committed_users(session: Session) -> None:
+    for email in session.info.pop("forget_users", ()):
+        forget_user(email)
+
+
+async def get_current_user(
+    token: Annotated[str, Depends(oauth2_scheme)], db: Annotated[AsyncSession, Depends(get_db)]
+) -> User:
+    email = _decode_subject(token)
+
+    state = _user_cache.get(email)
+    if state is not None:
+        # Rebuild the user from its cached columns and attach it without a query.
+        user = User(**state)
+        make_transient_to_detached(user)
+        return await db.merge(user, load=False)
 
     result = await db.execute(select(User).where(User.email == email))
     user = result.scalar_one_or_none()
     if not user or not user.is_active or user.is_deactivated:
         raise AuthError("User inactive or not found")
+    _user_cache.set(email, _user_state(user))
     return user
@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, TypeVar
+
+from fastapi import HTTPException, status
+
+T = TypeVar("T")
+
+
+class HashingPool:
+    """Runs password hashing on a few dedicated threads instead of the event loop.
+
+    PBKDF2 in ``hashlib`` releases the GIL, so worker threads hash in parallel while the
+    loop keeps serving other requests. At most ``max_pending`` calls may be in flight;
+    beyond that callers get a 503 instead of an ever-growing queue during a login storm.
+    All counters are updated on the event loop thread only.
+    """
+
+    def __init__(self, workers: int, max_pending: int) -> None:
+        self.workers = max(1, workers)
+        self.max_pending = max(self.workers, max_pending)
+        self._executor: ThreadPoolExecutor | None = None
+        self.in_flight = 0
+        self.max_queued = 0
+        self.completed = 0
+        self.rejected = 0
+        self.wait_total = 0.0
+        self.wait_max = 0.0
+
+    @property
+    def queued(self) -> int:
+        """Calls waiting for a free worker thread."""
+        return max(0, self.in_flight - self.workers)
+
+    async def run(self, fn: Callable[..., T], *args: Any) -> T:
+        if self.in_flight >= self.max_pending:
+            self.rejected += 1
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="Too many sign-in attempts in progress, please retry",
+                headers={"Retry-After": "1"},
+            )
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(self.workers, thread_name_prefix="password-hash")
+        submitted = time.perf_counter()
+
+        def call() -> tuple[float, T]:
+            return time.perf_counter(), fn(*args)
+
+        self.in_flight += 1
+        self.max_queued = max(self.max_queued, self.queued)
+        try:
+            started, result = await asyncio.get_running_loop().run_in_executor(
+                self._executor, call
+            )
+        finally:
+            self.in_flight -= 1
+        wait = started - submitted
+        self.completed += 1
+        self.wait_total += wait
+        self.wait_max = max(self.wait_max, wait)
+        return result
+
+    def close(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "workers": self.workers,
+            "in_flight": self.in_flight,
+            "queued": self.queued,
+            "max_queued": self.max_queued,
+            "completed": self.completed,
+            "rejected": self.rejected,
+            "wait_ms_avg": 1000 * self.wait_total / self.completed if self.completed else 0.0,
+            "wait_ms_max": 1000 * self.wait_max,
+        }
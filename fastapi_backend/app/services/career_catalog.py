@@ -0,0 +1,167 @@
+"""Career outcomes per degree and program, pre-joined with their employers."""
+
+from __future__ import annotations
+
+import math
+import re
+from typing import Any
+
+from app.services.catalog_store import ReloadableCatalog, envelope, normalize, slugify
+from app.utils.cache import TTLCache
+from app.utils.http_cache import EncodedBody
+
+CAREER_FILES = ("career_program_data.json", "career_employers.json")
+_SALARY_RE = re.compile(r"(\d+(?:\.\d+)?)\s*([kK])?")
+
+
+def parse_salary(text: str | None) -> tuple[int | None, int | None]:
+    """``"$35k - $55k"`` -> ``(35000, 55000)``; a single figure is both bounds."""
+    amounts = [
+        int(float(number) * (1000 if suffix else 1))
+        for number, suffix in _SALARY_RE.findall(str(text or "").replace(",", ""))
+    ]
+    if not amounts:
+        return None, None
+    return min(amounts), max(amounts)
+
+
+class CareerSnapshot:
+    """Immutable join of careers and employers with filter indexes and encoded pages."""
+
+    def __init__(self, careers_doc: Any, employers_doc: Any, version: str = "") -> None:
+        self.version = version
+        degrees = careers_doc.get("degrees", []) if isinstance(careers_doc, dict) else []
+        employers = employers_doc if isinstance(employers_doc, dict) else {}
+
+        self.careers: list[dict[str, Any]] = []
+        self.by_degree: dict[str, list[int]] = {}
+        self.by_program: dict[str, list[int]] = {}
+        self.employer_index: dict[str, list[int]] = {}
+        programs: list[dict[str, Any]] = []
+
+        for degree in degrees:
+            degree_name = degree.get("name")
+            degree_employers = employers.get(degree_name) or {}
+            for program in degree.get("programs") or []:
+                careers = program.get("careers") or []
+                programs.append(
+                    {
+                        "degree": degree_name,
+                        "program": program.get("name"),
+                        "description": program.get("description"),
+                        "career_count": len(careers),
+                    }
+                )
+                for career in careers:
+                    position = len(self.careers)
+                    salary_min, salary_max = parse_salary(career.get("salary"))
+                    names = list(degree_employers.get(career.get("title")) or [])
+                    self.careers.append(
+                        {
+                            "id": slugify(degree_name, program.get("name"), career.get("title")),
+                            "degree": degree_name,
+                            "program": program.get("name"),
+                            "title": career.get("title"),
+                            "description": career.get("description"),
+                            "salary": career.get("salary"),
+                            "salary_min": salary_min,
+                            "salary_max": salary_max,
+                            "competencies": career.get("competencies") or [],
+                            "employers": names,
+                        }
+                    )
+                    self.by_degree.setdefault(normalize(degree_name), []).append(position)
+                    self.by_program.setdefault(normalize(program.get("name")), []).append(position)
+                    for name in names:
+                        self.employer_index.setdefault(normalize(name), []).append(position)
+
+        self.programs = programs
+        self._program_listing = EncodedBody.encode(envelope("Career programs loaded", programs))
+        # Filtered listings and pages are encoded on first use for the life of the snapshot.
+        self._encoded = TTLCache(maxsize=512, ttl=math.inf)
+
+    def __len__(self) -> int:
+        return len(self.careers)
+
+    def program_listing(self, degree: str | None = None) -> EncodedBody:
+        if not degree:
+            return self._program_listing
+        key = ("programs", normalize(degree))
+        encoded = self._encoded.get(key)
+        if encoded is None:
+            selected = [item for item in self.programs if normalize(item["degree"]) == key[1]]
+            encoded = EncodedBody.encode(envelope("Career programs loaded", selected))
+            self._encoded.set(key, encoded)
+        return encoded
+
+    def filter(
+        self,
+        degree: str | None = None,
+        program: str | None = None,
+        employer: str | None = None,
+        search: str | None = None,
+        salary_min: int | None = None,
+        salary_max: int | None = None,
+    ) -> list[int]:
+        """Positions of matching careers, in catalog order."""
+        candidates: set[int] | None = None
+        for index, value in ((self.by_degree, degree), (self.by_program, program)):
+            if value:
+                matches = set(index.get(normalize(value), ()))
+                candidates = matches if candidates is None else candidates & matches
+        if employer:
+            needle = normalize(employer)
+            matches = {
+                position
+                for name, positions in self.employer_index.items()
+                if needle in name
+                for position in positions
+            }
+            candidates = matches if candidates is None else candidates & matches
+        positions = sorted(candidates) if candidates is not None else range(len(self.careers))
+
+        needle = normalize(search)
+        selected = []
+        for position in positions:
+            career = self.careers[position]
+            if needle and needle not in normalize(career["title"]):
+                continue
+            # Salary filters keep careers whose range overlaps the requested one.
+            if salary_min is not None and (career["salary_max"] or -1) < salary_min:
+                continue
+            if salary_max is not None and (
+                career["salary_min"] is None or career["salary_min"] > salary_max
+            ):
+                continue
+            selected.append(position)
+        return selected
+
+    def page(
+        self,
+        page: int = 0,
+        per_page: int = 20,
+        **filters: Any,
+    ) -> EncodedBody:
+        key = ("careers", page, per_page, tuple(sorted(filters.items())))
+        encoded = self._encoded.get(key)
+        if encoded is None:
+            positions = self.filter(**filters)
+            window = positions[page * per_page : (page + 1) * per_page]
+            encoded = EncodedBody.encode(
+                envelope(
+                    "Careers loaded",
+                    [self.careers[position] for position in window],
+                    metadata={"total": len(positions), "page": page, "per_page": per_page},
+                )
+            )
+            self._encoded.set(key, encoded)
+        return encoded
+
+
+def _build(documents: list[Any], version: str) -> CareerSnapshot:
+    return CareerSnapshot(documents[0], documents[1], version)
+
+
+career_catalog: ReloadableCatalog[CareerSnapshot] = ReloadableCatalog(
+    "Career catalog", CAREER_FILES, _build
+)
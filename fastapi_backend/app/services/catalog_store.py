@@ -0,0 +1,119 @@
+"""Hot-reloadable, pre-encoded views over the static catalog JSON files."""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import re
+import time
+from pathlib import Path
+from typing import Any, Callable, Generic, Sequence, TypeVar
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+SnapshotT = TypeVar("SnapshotT")
+_SLUG_RE = re.compile(r"[^a-z0-9]+")
+
+
+def normalize(value: Any) -> str:
+    """Case- and whitespace-insensitive lookup key."""
+    return " ".join(str(value or "").lower().split())
+
+
+def slugify(*parts: Any) -> str:
+    return _SLUG_RE.sub("-", " ".join(str(part or "") for part in parts).lower()).strip("-")
+
+
+def envelope(message: str, data: Any, **extra: Any) -> dict[str, Any]:
+    return {"success": True, "message": message, "data": data, **extra}
+
+
+class ReloadableCatalog(Generic[SnapshotT]):
+    """Holds the current snapshot built from a set of JSON files and swaps it on change.
+
+    ``build(documents, version)`` turns the parsed files into an immutable snapshot.
+    Request handlers take ``await current()`` once per request; a reload builds the
+    replacement off the event loop and swaps the reference, so requests never see a
+    half-built catalog. If a file is missing or broken the previous snapshot stays in
+    service. The initial load happens in the application lifespan.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        files: Sequence[str],
+        build: Callable[[list[Any], str], SnapshotT],
+        directory: str | Path | None = None,
+    ) -> None:
+        self.name = name
+        self.paths = [Path(directory or settings.catalog_assets_dir) / file for file in files]
+        self._build = build
+        self._snapshot: SnapshotT | None = None
+        self._mtimes: tuple[float | None, ...] | None = None
+        self._checked_at = 0.0
+        self._lock = asyncio.Lock()
+
+    @property
+    def snapshot(self) -> SnapshotT:
+        """The last loaded snapshot, for synchronous code running after ``await current()``.
+
+        It does not check the files itself; outside the app (scripts, tests) the first access
+        loads them synchronously.
+        """
+        if self._snapshot is None:
+            self.load()
+        return self._snapshot  # type: ignore[return-value]
+
+    def _stat(self) -> tuple[float | None, ...]:
+        mtimes = []
+        for path in self.paths:
+            try:
+                mtimes.append(os.stat(path).st_mtime)
+            except OSError:
+                mtimes.append(None)
+        return tuple(mtimes)
+
+    def load(self) -> SnapshotT:
+        """Read and index the files, then make the result the current snapshot."""
+        self._checked_at = time.monotonic()
+        mtimes = self._stat()
+        digest = hashlib.blake2b(digest_size=8)
+        try:
+            documents = []
+            for path in self.paths:
+                raw = path.read_bytes()
+                digest.update(raw)
+                documents.append(json.loads(raw))
+        except (OSError, ValueError):
+            if self._snapshot is not None:
+                # Remember the broken version so it is not re-read until the files change.
+                self._mtimes = mtimes
+                logger.exception("%s reload failed; keeping the loaded version", self.name)
+                return self._snapshot
+            logger.exception("%s could not be loaded from %s", self.name, self.paths)
+            documents = [None] * len(self.paths)
+        snapshot = self._build(documents, digest.hexdigest())
+        self._snapshot, self._mtimes = snapshot, mtimes
+        logger.info("%s loaded (version %s)", self.name, digest.hexdigest())
+        return snapshot
+
+    async def refresh(self) -> SnapshotT:
+        async with self._lock:
+            return await asyncio.to_thread(self.load)
+
+    async def current(self) -> SnapshotT:
+        """Current snapshot, reloading first if a file changed since the last check."""
+        if (
+            self._snapshot is not None
+            and time.monotonic() - self._checked_at < settings.catalog_reload_interval
+        ):
+            return self._snapshot
+        self._checked_at = time.monotonic()
+        if self._snapshot is None or self._stat() != self._mtimes:
+            return await self.refresh()
+        return self._snapshot
@@ -0,0 +1,441 @@
+"""Course dependency graph built from free-text prerequisite/corequisite fields."""
+
+from __future__ import annotations
+
+import copy
+import math
+import re
+import threading
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Any, Iterable, Sequence
+
+from app.schemas.education import ProgramCoursePayload
+from app.services.program_catalog import program_catalog
+from app.utils.cache import TTLCache
+
+# "MATH 1220", "C S 272", "M E 328", "CHEM 1215L".
+_CODE_RE = re.compile(r"\b[A-Z]{1,4}(?: [A-Z]{1,2})? \d{3,4}[A-Z]?\b")
+_AND_RE = re.compile(r"\band\b|[;,]", re.IGNORECASE)
+_YEAR_WORDS = {"first": 1, "second": 2, "third": 3, "fourth": 4, "fifth": 5, "sixth": 6}
+# Same ordering as the plan editor in the frontend.
+_SEMESTER_ORDER = ("fall", "spring", "summer", "winter")
+# Full-time load used for the credit bound of ``min_semesters``.
+MAX_TERM_CREDITS = 18
+
+# Conjunction of clauses; a clause is met by any one of its course codes.
+Requirement = tuple[tuple[str, ...], ...]
+
+
+def normalize_code(code: str | None) -> str:
+    return " ".join(str(code).upper().split()) if code else ""
+
+
+@lru_cache(maxsize=4096)
+def parse_requirement(text: str | None) -> Requirement:
+    """Parse ``"A and B"`` / ``"A or B"`` into clauses of course codes.
+
+    Text without course codes (``None``, ``Placement``, ``Advisor approval``) yields no
+    clauses, i.e. nothing the graph can check.
+    """
+    if not text:
+        return ()
+    clauses = []
+    for part in _AND_RE.split(text):
+        codes = tuple(dict.fromkeys(normalize_code(code) for code in _CODE_RE.findall(part)))
+        if codes:
+            clauses.append(codes)
+    return tuple(clauses)
+
+
+def catalog_credits(value: Any) -> int:
+    # Catalog credits are sometimes ranges ("2-11"); the lower bound is used.
+    match = re.search(r"\d+", str(value or ""))
+    return int(match.group()) if match else 0
+
+
+def _year_rank(year: str | None) -> int | None:
+    if not year:
+        return None
+    text = str(year).lower()
+    digits = re.search(r"\d+", text)
+    if digits:
+        return int(digits.group())
+    return next((rank for word, rank in _YEAR_WORDS.items() if word in text), None)
+
+
+def _semester_rank(semester: str | None) -> int | None:
+    text = str(semester or "").strip().lower()
+    return next((rank for rank, name in enumerate(_SEMESTER_ORDER) if text.startswith(name)), None)
+
+
+def term_index(year: str | None, semester: str | None) -> int | None:
+    """Ordinal of a (year, semester) slot, or ``None`` when either label is unknown."""
+    year_rank, semester_rank = _year_rank(year), _semester_rank(semester)
+    if year_rank is None or semester_rank is None:
+        return None
+    return year_rank * len(_SEMESTER_ORDER) + semester_rank
+
+
+class CourseGraph:
+    """Prerequisite DAG kept in topological order as edges arrive.
+
+    Edges are inserted with the Pearce-Kelly algorithm: only the nodes between the two
+    endpoints in the current order are visited, so adding a course costs time
+    proportional to the affected region rather than the whole graph. An edge that
+    would close a cycle is not inserted and is kept in ``rejected`` instead.
+    """
+
+    def __init__(self) -> None:
+        self._succ: dict[str, set[str]] = {}
+        self._pred: dict[str, set[str]] = {}
+        self._ord: dict[str, int] = {}
+        self._next = 0
+        self.rejected: set[tuple[str, str]] = set()
+
+    def __contains__(self, code: object) -> bool:
+        return code in self._ord
+
+    def has_edge(self, before: str, after: str) -> bool:
+        return after in self._succ.get(before, ())
+
+    def add_node(self, code: str) -> None:
+        if code not in self._ord:
+            self._ord[code] = self._next
+            self._next += 1
+            self._succ[code] = set()
+            self._pred[code] = set()
+
+    def remove_node(self, code: str) -> None:
+        if code not in self._ord:
+            return
+        for after in self._succ.pop(code):
+            self._pred[after].discard(code)
+        for before in self._pred.pop(code):
+            self._succ[before].discard(code)
+        del self._ord[code]
+        self.rejected = {edge for edge in self.rejected if code not in edge}
+        self._retry_rejected()
+
+    def add_edge(self, before: str, after: str) -> bool:
+        """Add ``before -> after``; returns ``False`` if that would create a cycle."""
+        if self.has_edge(before, after):
+            return True
+        if before == after:
+            self.rejected.add((before, after))
+            return False
+        lower, upper = self._ord[after], self._ord[before]
+        if lower < upper:
+            forward = self._reach(after, self._succ, lambda node: self._ord[node] <= upper)
+            if before in forward:
+                self.rejected.add((before, after))
+                return False
+            backward = self._reach(before, self._pred, lambda node: self._ord[node] >= lower)
+            self._reorder(backward, forward)
+        self._succ[before].add(after)
+        self._pred[after].add(before)
+        return True
+
+    def remove_edge(self, before: str, after: str) -> None:
+        self.rejected.discard((before, after))
+        if not self.has_edge(before, after):
+            return
+        self._succ[before].discard(after)
+        self._pred[after].discard(before)
+        self._retry_rejected()
+
+    def _retry_rejected(self) -> None:
+        # Removing a node or edge may break a cycle that previously blocked other edges.
+        retry = sorted(self.rejected)
+        self.rejected.clear()
+        for before, after in retry:
+            self.add_edge(before, after)
+
+    def topological(self) -> list[str]:
+        return sorted(self._ord, key=self._ord.__getitem__)
+
+    @staticmethod
+    def _reach(start: str, edges: dict[str, set[str]], keep) -> set[str]:
+        seen = {start}
+        stack = [start]
+        while stack:
+            for node in edges[stack.pop()]:
+                if node not in seen and keep(node):
+                    seen.add(node)
+                    stack.append(node)
+        return seen
+
+    def _reorder(self, backward: set[str], forward: set[str]) -> None:
+        by_order = self._ord.__getitem__
+        nodes = sorted(backward, key=by_order) + sorted(forward, key=by_order)
+        slots = sorted(self._ord[node] for node in nodes)
+        for node, slot in zip(nodes, slots, strict=True):
+            self._ord[node] = slot
+
+
+@dataclass(frozen=True)
+class PlannedCourse:
+    code: str
+    term: int | None
+    credits: int
+    prerequisites: Requirement
+    corequisites: Requirement
+
+
+@dataclass
+class PlanGraph:
+    """Dependency state of one set of courses, updated incrementally by ``apply``."""
+
+    graph: CourseGraph = field(default_factory=CourseGraph)
+    courses: dict[str, PlannedCourse] = field(default_factory=dict)
+    # code -> courses whose requirements mention it, including codes not in the plan.
+    referenced_by: dict[str, set[str]] = field(default_factory=dict)
+    issues: dict[str, list[dict[str, Any]]] = field(default_factory=dict)
+    _critical_path: list[str] | None = None
+
+    def apply(self, courses: dict[str, PlannedCourse]) -> int:
+        """Move to ``courses``, re-checking only what changed; returns the courses re-checked."""
+        changed = [
+            code
+            for code in self.courses.keys() | courses.keys()
+            if self.courses.get(code) != courses.get(code)
+        ]
+        dirty: set[str] = set()
+        for code in changed:
+            old, new = self.courses.get(code), courses.get(code)
+            dirty.add(code)
+            dirty.update(self.referenced_by.get(code, ()))
+            if old is not None and (new is None or _requirements(old) != _requirements(new)):
+                self._unlink(old)
+            if new is None:
+                del self.courses[code]
+                self.issues.pop(code, None)
+                self.graph.remove_node(code)
+                self._critical_path = None
+                continue
+            self.courses[code] = new
+            if code not in self.graph:
+                self.graph.add_node(code)
+                for dependent in self.referenced_by.get(code, ()):
+                    if any(code in clause for clause in self.courses[dependent].prerequisites):
+                        self.graph.add_edge(code, dependent)
+                self._critical_path = None
+            if old is None or _requirements(old) != _requirements(new):
+                self._link(new)
+
+        for code in dirty:
+            if code in self.courses:
+                self.issues[code] = self._check(self.courses[code])
+        return len(dirty & self.courses.keys())
+
+    def _link(self, course: PlannedCourse) -> None:
+        for clause in course.prerequisites + course.corequisites:
+            for code in clause:
+                self.referenced_by.setdefault(code, set()).add(course.code)
+        for clause in course.prerequisites:
+            for code in clause:
+                if code in self.graph and code != course.code:
+                    self.graph.add_edge(code, course.code)
+                elif code == course.code:
+                    self.graph.rejected.add((code, code))
+        self._critical_path = None
+
+    def _unlink(self, course: PlannedCourse) -> None:
+        for clause in course.prerequisites + course.corequisites:
+            for code in clause:
+                self.referenced_by.get(code, set()).discard(course.code)
+                self.graph.remove_edge(code, course.code)
+        self._critical_path = None
+
+    def _check(self, course: PlannedCourse) -> list[dict[str, Any]]:
+        issues = []
+        for kind, clauses in (
+            ("prerequisite", course.prerequisites),
+            ("corequisite", course.corequisites),
+        ):
+            for clause in clauses:
+                present = [code for code in clause if code in self.courses and code != course.code]
+                if not present:
+                    issues.append({"course": course.code, "kind": kind, "unmet": list(clause)})
+                    continue
+                terms = [self.courses[code].term for code in present]
+                if course.term is None or None in terms:
+                    continue
+                earliest = min(terms)
+                # Prerequisites must come in an earlier term; corequisites may share it.
+                if earliest > course.term or (kind == "prerequisite" and earliest == course.term):
+                    issues.append(
+                        {
+                            "course": course.code,
+                            "kind": kind,
+                            "requires": present,
+                            "term": course.term,
+                            "required_term": earliest,
+                        }
+                    )
+        return issues
+
+    def critical_path(self) -> list[str]:
+        """Longest prerequisite chain; an "or" clause follows its shortest alternative."""
+        if self._critical_path is None:
+            depth: dict[str, int] = {}
+            parent: dict[str, str | None] = {}
+            for code in self.graph.topological():
+                best, via = 0, None
+                for clause in self.courses[code].prerequisites:
+                    options = [c for c in clause if c in depth and self.graph.has_edge(c, code)]
+                    if options:
+                        pick = min(options, key=depth.__getitem__)
+                        if depth[pick] > best:
+                            best, via = depth[pick], pick
+                depth[code], parent[code] = best + 1, via
+            path: list[str] = []
+            node = max(depth, key=depth.__getitem__) if depth else None
+            while node is not None:
+                path.append(node)
+                node = parent[node]
+            self._critical_path = path[::-1]
+        return self._critical_path
+
+    def min_semesters(self, max_credits: int = MAX_TERM_CREDITS) -> int:
+        total = sum(course.credits for course in self.courses.values())
+        return max(len(self.critical_path()), math.ceil(total / max_credits) if max_credits else 0)
+
+    def report(self) -> dict[str, Any]:
+        issues = [issue for found in self.issues.values() for issue in found]
+        return {
+            "valid": not self.graph.rejected and not any("requires" in i for i in issues),
+            "cycles": [
+                {"course": after, "requires": before}
+                for before, after in sorted(self.graph.rejected)
+            ],
+            "violations": [issue for issue in issues if "requires" in issue],
+            "unmet": [issue for issue in issues if "unmet" in issue],
+            "critical_path": self.critical_path(),
+            "min_semesters": self.min_semesters(),
+        }
+
+
+def _requirements(course: PlannedCourse) -> tuple[Requirement, Requirement]:
+    return course.prerequisites, course.corequisites
+
+
+def _collect(entries: Iterable[PlannedCourse]) -> dict[str, PlannedCourse]:
+    """Index courses by code; a course listed twice counts at its earliest term."""
+    courses: dict[str, PlannedCourse] = {}
+    for entry in entries:
+        current = courses.get(entry.code)
+        if current is None or (
+            entry.term is not None and (current.term is None or entry.term < current.term)
+        ):
+            courses[entry.code] = entry
+    return courses
+
+
+def _key(program: str | None, university: str | None, degree: str | None) -> tuple[str, str, str]:
+    return tuple(str(value or "").strip().lower() for value in (program, university, degree))
+
+
+def find_program(
+    program: str | None, university: str | None, degree: str | None = None
+) -> dict[str, Any] | None:
+    """Catalog entry for a program; without a degree the first match is returned."""
+    return program_catalog.snapshot.find(program, university, degree)
+
+
+def iter_program_courses(item: dict[str, Any]) -> Iterable[tuple[str, str, dict[str, Any]]]:
+    """Yield ``(year, semester, course)`` for every course of a catalog entry."""
+    for year in item.get("years") or []:
+        for semester in year.get("semesters") or []:
+            for course in semester.get("courses") or []:
+                if course.get("code"):
+                    yield year.get("year"), semester.get("semester"), course
+
+
+def program_graph(program: str, university: str, degree: str | None = None) -> PlanGraph:
+    """Dependency graph of the catalog's default sequence for a program.
+
+    Cached per (program, university, degree) and catalog version; plan checks start from
+    a copy of it so only courses that differ from the catalog have to be parsed and linked.
+    """
+    return _program_graph(_key(program, university, degree), program_catalog.snapshot.version)
+
+
+@lru_cache(maxsize=256)
+def _program_graph(key: tuple[str, str, str], version: str) -> PlanGraph:
+    item = find_program(*key)
+    entries = [
+        PlannedCourse(
+            code=normalize_code(course.get("code")),
+            term=term_index(year, semester),
+            credits=catalog_credits(course.get("credits")),
+            prerequisites=parse_requirement(course.get("prerequisite")),
+            corequisites=parse_requirement(course.get("corequisite")),
+        )
+        for year, semester, course in (iter_program_courses(item) if item else ())
+    ]
+    plan_graph = PlanGraph()
+    plan_graph.apply(_collect(entries))
+    return plan_graph
+
+
+# plan id -> ((program key, catalog version), graph) of the last check, for re-checks.
+_plan_graphs = TTLCache(maxsize=1024, ttl=3600)
+# Checks run in worker threads and update cached graphs in place.
+_plan_lock = threading.Lock()
+
+
+def _planned(
+    courses: Sequence[ProgramCoursePayload], catalog: dict[str, PlannedCourse]
+) -> dict[str, PlannedCourse]:
+    entries = []
+    for course in courses:
+        code = normalize_code(course.code)
+        if not code:
+            continue
+        known = catalog.get(code)
+        entries.append(
+            PlannedCourse(
+                code=code,
+                term=term_index(course.year, course.semester),
+                credits=course.credits or 0,
+                prerequisites=parse_requirement(course.prerequisite)
+                if course.prerequisite is not None or known is None
+                else known.prerequisites,
+                corequisites=parse_requirement(course.corequisite)
+                if course.corequisite is not None or known is None
+                else known.corequisites,
+            )
+        )
+    return _collect(entries)
+
+
+def check_plan(
+    plan_id: int | None,
+    program: str,
+    university: str,
+    degree: str | None,
+    courses: Sequence[ProgramCoursePayload],
+) -> dict[str, Any]:
+    """Check a plan's ordering against its prerequisite graph.
+
+    The graph from the previous check of the same plan is reused, so re-saving a plan
+    only re-checks the courses that changed and the courses that depend on them.
+    Safe to call from worker threads.
+    """
+    key = (*_key(program, university, degree), program_catalog.snapshot.version)
+    with _plan_lock:
+        cached = _plan_graphs.get(plan_id) if plan_id is not None else None
+        catalog = program_graph(*key[:3])
+        if cached and cached[0] == key:
+            plan_graph = cached[1]
+        else:
+            plan_graph = copy.deepcopy(catalog)
+        checked = plan_graph.apply(_planned(courses, catalog.courses))
+        if plan_id is not None:
+            _plan_graphs.set(plan_id, (key, plan_graph))
+        return {**plan_graph.report(), "checked": checked}
+
+
+def forget_plan(plan_id: int) -> None:
+    _plan_graphs.invalidate(plan_id)
@@ -1,9 +1,13 @@
 from __future__ import annotations
 
+import asyncio
+import base64
+import json
+from datetime import datetime
 from typing import Sequence
 
 from fastapi import HTTPException, status
-from sqlalchemy import and_, delete, select
+from sqlalchemy import and_, delete, func, insert, or_, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.education_plan import CourseReschedule, EducationPlan, ProgramCourse
@@ -15,6 +19,9 @@ from app.schemas.education import (
     ProgramCoursePayload,
     RescheduleRequest,
 )
+from app.services import course_graph
+from app.services.plan_cache import plan_cache, plan_scope, user_scope
+from app.services.program_catalog import program_catalog
 
 
 def _normalize_degree(value: str | None) -> str:
@@ -37,12 +44,18 @@ def _infer_program(payload: Sequence[ProgramCoursePayload]) -> tuple[str, str]:
 
 async def add_or_replace_plan(
     db: AsyncSession, user: User, payload: EducationPlanRequest
-) -> EducationPlan:
+) -> tuple[EducationPlan, dict[str, int], dict]:
+    """Create or update a plan.
+
+    Returns the plan, per-row course change counts and the prerequisite check report.
+    """
     if not payload.program:
         raise HTTPException(status_code=400, detail="Program payload is empty")
 
     program_name, university_name = _infer_program(payload.program)
     degree_value = payload.degree.strip() if payload.degree else None
+    # The prerequisite check reads ``program_catalog.snapshot``; pick up reloads first.
+    await program_catalog.current()
 
     existing = await get_plan_by_program(
         db, user.id, program_name, university_name, degree_value
@@ -52,22 +65,33 @@ async def add_or_replace_plan(
         plan_payload["degree"] = degree_value
 
     if existing:
-        existing.payload = plan_payload
-        if degree_value:
+        if existing.payload != plan_payload:
+            existing.payload = plan_payload
+        if degree_value and existing.degree != degree_value:
             existing.degree = degree_value
-        await db.execute(
-            delete(ProgramCourse).where(ProgramCourse.education_plan_id == existing.id)
-        )
-        await _persist_courses(db, existing, payload.program)
+            existing.degree_norm = _normalize_degree(degree_value)
+        changes = await _sync_courses(db, existing, payload.program)
         await db.commit()
         await db.refresh(existing)
-        return existing
+        await plan_cache.invalidate(
+            user_scope(user.email), plan_scope(program_name, university_name)
+        )
+        report = await asyncio.to_thread(
+            course_graph.check_plan,
+            existing.id,
+            program_name,
+            university_name,
+            degree_value,
+            payload.program,
+        )
+        return existing, changes, report
 
     plan = EducationPlan(
         user_id=user.id,
         program_name=program_name,
         university_name=university_name,
         degree=degree_value,
+        degree_norm=_normalize_degree(degree_value),
         payload=plan_payload,
     )
     db.add(plan)
@@ -75,30 +99,110 @@ async def add_or_replace_plan(
     await _persist_courses(db, plan, payload.program)
     await db.commit()
     await db.refresh(plan)
-    return plan
+    await plan_cache.invalidate(user_scope(user.email), plan_scope(program_name, university_name))
+    report = await asyncio.to_thread(
+        course_graph.check_plan,
+        plan.id,
+        program_name,
+        university_name,
+        degree_value,
+        payload.program,
+    )
+    changes = {"inserted": len(payload.program), "updated": 0, "deleted": 0, "unchanged": 0}
+    return plan, changes, report
 
 
-async def _persist_courses(
+_COURSE_COLUMNS = (
+    "year_label",
+    "semester_label",
+    "course_code",
+    "course_name",
+    "credits",
+    "prerequisite",
+    "corequisite",
+    "schedule",
+)
+
+
+def _course_key(row: dict) -> tuple:
+    return (row["course_code"], row["year_label"], row["semester_label"])
+
+
+async def _sync_courses(
     db: AsyncSession, plan: EducationPlan, courses: Sequence[ProgramCoursePayload]
-) -> None:
+) -> dict[str, int]:
+    """Diff incoming courses against stored rows keyed by (code, year, semester).
+
+    Only rows that actually changed are written, so moving one course touches two rows
+    instead of deleting and re-inserting the whole plan.
+    """
+    result = await db.execute(
+        select(ProgramCourse.id, *(getattr(ProgramCourse, column) for column in _COURSE_COLUMNS))
+        .where(ProgramCourse.education_plan_id == plan.id)
+        .order_by(ProgramCourse.id)
+    )
+    stored: dict[tuple, list[dict]] = {}
+    for row in result.mappings():
+        stored.setdefault(_course_key(row), []).append(dict(row))
+
+    to_insert: list[ProgramCoursePayload] = []
+    to_update: list[dict] = []
+    unchanged = 0
     for entry in courses:
-        db.add(
-            ProgramCourse(
-                education_plan_id=plan.id,
-                year_label=entry.year,
-                semester_label=entry.semester,
-                course_code=entry.code,
-                course_name=entry.course_name,
-                credits=entry.credits,
-                prerequisite=entry.prerequisite,
-                corequisite=entry.corequisite,
-                schedule=(
-                    entry.schedule.model_dump()
-                    if hasattr(entry.schedule, "model_dump")
-                    else entry.schedule
-                ),
+        incoming = _course_row(plan.id, entry)
+        matches = stored.get(_course_key(incoming))
+        if not matches:
+            to_insert.append(entry)
+            continue
+        current = matches.pop(0)
+        if any(incoming[column] != current[column] for column in _COURSE_COLUMNS):
+            # Send every column so all updates share one executemany statement shape.
+            to_update.append(
+                {"id": current["id"], **{column: incoming[column] for column in _COURSE_COLUMNS}}
             )
-        )
+        else:
+            unchanged += 1
+
+    stale_ids = [row["id"] for rows in stored.values() for row in rows]
+    if stale_ids:
+        await db.execute(delete(ProgramCourse).where(ProgramCourse.id.in_(stale_ids)))
+    if to_update:
+        await db.execute(update(ProgramCourse), to_update)
+    await _persist_courses(db, plan, to_insert)
+    return {
+        "inserted": len(to_insert),
+        "updated": len(to_update),
+        "deleted": len(stale_ids),
+        "unchanged": unchanged,
+    }
+
+
+def _course_row(plan_id: int, entry: ProgramCoursePayload) -> dict:
+    return {
+        "education_plan_id": plan_id,
+        "year_label": entry.year,
+        "semester_label": entry.semester,
+        "course_code": entry.code,
+        "course_name": entry.course_name,
+        "credits": entry.credits,
+        "prerequisite": entry.prerequisite,
+        "corequisite": entry.corequisite,
+        "schedule": (
+            entry.schedule.model_dump()
+            if hasattr(entry.schedule, "model_dump")
+            else entry.schedule
+        ),
+    }
+
+
+async def _persist_courses(
+    db: AsyncSession, plan: EducationPlan, courses: Sequence[ProgramCoursePayload]
+) -> None:
+    # Core executemany insert: one round trip per batch instead of an ORM object and a
+    # row-by-row INSERT per course.
+    if not courses:
+        return
+    await db.execute(insert(ProgramCourse), [_course_row(plan.id, entry) for entry in courses])
 
 
 async def get_plan_by_program(
@@ -115,46 +219,221 @@ async def get_plan_by_program(
             EducationPlan.university_name == university_name,
         )
     )
-    result = await db.execute(stmt)
-    plans = result.scalars().all()
-
-    # No specific degree requested; return the first match (maintains legacy behavior)
-    if not degree:
-        return plans[0] if plans else None
+    # Without a degree the first match is returned (maintains legacy behavior)
+    if degree:
+        stmt = stmt.where(EducationPlan.degree_norm == _normalize_degree(degree))
+    result = await db.execute(stmt.order_by(EducationPlan.id).limit(1))
+    return result.scalar_one_or_none()
 
-    target_degree = _normalize_degree(degree)
-    for plan in plans:
-        existing_degree = _normalize_degree(plan.degree or (plan.payload or {}).get("degree"))
-        if existing_degree == target_degree:
-            return plan
 
-    return None
-
-
-async def query_plan(db: AsyncSession, query: EducationPlanQuery) -> EducationPlan | None:
-    stmt = select(EducationPlan).where(
+def _query_stmt(stmt, query: EducationPlanQuery):
+    stmt = stmt.where(
         and_(
             EducationPlan.program_name == query.programname,
             EducationPlan.university_name == query.univerityname,
         )
     )
-    result = await db.execute(stmt)
-    plans = result.scalars().all()
-    if not plans:
-        return None
-    if not query.degree:
-        return plans[0]
-    target_degree = _normalize_degree(query.degree)
-    for plan in plans:
-        existing_degree = _normalize_degree(plan.degree or (plan.payload or {}).get("degree"))
-        if existing_degree == target_degree:
-            return plan
-    return None
-
-
-async def list_plans(db: AsyncSession, query: EducationPlanListQuery) -> Sequence[EducationPlan]:
-    stmt = select(EducationPlan).where(EducationPlan.user.has(email=query.email.lower()))
-    result = await db.execute(stmt)
+    if query.degree:
+        stmt = stmt.where(EducationPlan.degree_norm == _normalize_degree(query.degree))
+    return stmt.order_by(EducationPlan.id).limit(1)
+
+
+async def query_plan(db: AsyncSession, query: EducationPlanQuery) -> EducationPlan | None:
+    result = await db.execute(_query_stmt(select(EducationPlan), query))
+    return result.scalar_one_or_none()
+
+
+async def query_plan_version(db: AsyncSession, query: EducationPlanQuery) -> tuple | None:
+    """``(id, updated_at)`` of the plan ``query_plan`` would return, without its payload."""
+    result = await db.execute(
+        _query_stmt(select(EducationPlan.id, EducationPlan.updated_at), query)
+    )
+    row = result.first()
+    return tuple(row) if row else None
+
+
+async def plan_list_version(db: AsyncSession, email: str) -> tuple:
+    """Plan count and latest ``updated_at`` for a user; changes with every plan write."""
+    result = await db.execute(
+        select(func.count(EducationPlan.id), func.max(EducationPlan.updated_at))
+        .join(User, User.id == EducationPlan.user_id)
+        .where(User.email == email.lower())
+    )
+    return tuple(result.one())
+
+
+def plan_payload(plan: EducationPlan) -> dict:
+    """The stored plan payload as returned to clients, with the degree filled in."""
+    payload = dict(plan.payload or {})
+    if plan.degree and not payload.get("degree"):
+        payload["degree"] = plan.degree
+    return payload
+
+
+async def query_plan_payload(
+    db: AsyncSession, query: EducationPlanQuery, version: tuple | None = None
+) -> dict | None:
+    """Cached ``query_plan`` result as a payload dict; ``None`` when there is no plan.
+
+    A ``version`` from ``query_plan_version`` becomes part of the cache key, so the
+    payload is never older than the ETag it is served with.
+    """
+
+    async def load() -> dict | None:
+        plan = await query_plan(db, query)
+        return plan_payload(plan) if plan else None
+
+    return await plan_cache.get_or_load(
+        plan_scope(query.programname, query.univerityname),
+        ("query", _normalize_degree(query.degree), version),
+        load,
+    )
+
+
+async def list_plan_payloads(
+    db: AsyncSession, query: EducationPlanListQuery, version: tuple | None = None
+) -> tuple[list[dict], str | None]:
+    """Cached listing: plan payloads, or listing summaries when ``query.summary`` is set.
+
+    ``version`` (from ``plan_list_version``) is part of the cache key, as for
+    ``query_plan_payload``.
+    """
+
+    async def load() -> list:
+        if query.summary:
+            data, cursor = await list_plan_summaries(db, query)
+        else:
+            plans, cursor = await list_plans(db, query)
+            data = [plan_payload(plan) for plan in plans]
+        return [data, cursor]
+
+    data, cursor = await plan_cache.get_or_load(
+        user_scope(query.email),
+        ("list", query.limit, query.cursor, query.summary, version),
+        load,
+    )
+    return data, cursor
+
+
+def _encode_cursor(plan_updated_at: datetime, plan_id: int) -> str:
+    raw = json.dumps([plan_updated_at.isoformat(), plan_id]).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def _decode_cursor(cursor: str) -> tuple[datetime, int]:
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        updated_at, plan_id = json.loads(raw)
+        return datetime.fromisoformat(updated_at), int(plan_id)
+    except (ValueError, TypeError) as exc:
+        raise HTTPException(status_code=400, detail="Invalid cursor") from exc
+
+
+def _list_page(stmt, query: EducationPlanListQuery):
+    """Apply the user filter and (updated_at, id) keyset ordering to a plan listing."""
+    stmt = stmt.join(User, User.id == EducationPlan.user_id).where(
+        User.email == query.email.lower()
+    )
+    if query.cursor:
+        updated_at, plan_id = _decode_cursor(query.cursor)
+        stmt = stmt.where(
+            or_(
+                EducationPlan.updated_at < updated_at,
+                and_(EducationPlan.updated_at == updated_at, EducationPlan.id < plan_id),
+            )
+        )
+    stmt = stmt.order_by(EducationPlan.updated_at.desc(), EducationPlan.id.desc())
+    if query.limit:
+        # Fetch one extra row to learn whether another page exists.
+        stmt = stmt.limit(query.limit + 1)
+    return stmt
+
+
+def _next_cursor(rows: list, query: EducationPlanListQuery) -> tuple[list, str | None]:
+    if not query.limit or len(rows) <= query.limit:
+        return rows, None
+    rows = rows[: query.limit]
+    last = rows[-1]
+    return rows, _encode_cursor(last.updated_at, last.id)
+
+
+async def list_plans(
+    db: AsyncSession, query: EducationPlanListQuery
+) -> tuple[Sequence[EducationPlan], str | None]:
+    """Return the user's plans, newest first, and the cursor of the next page if any."""
+    result = await db.execute(_list_page(select(EducationPlan), query))
+    return _next_cursor(list(result.scalars().all()), query)
+
+
+async def list_plan_summaries(
+    db: AsyncSession, query: EducationPlanListQuery
+) -> tuple[list[dict], str | None]:
+    """Like ``list_plans`` but selects only listing columns, never the payload or courses."""
+    credits = (
+        select(func.coalesce(func.sum(ProgramCourse.credits), 0))
+        .where(ProgramCourse.education_plan_id == EducationPlan.id)
+        .scalar_subquery()
+    )
+    course_count = (
+        select(func.count(ProgramCourse.id))
+        .where(ProgramCourse.education_plan_id == EducationPlan.id)
+        .scalar_subquery()
+    )
+    # Legacy plans keep their degree only in the payload; ``plan_payload`` fills it in too.
+    degree = func.coalesce(
+        func.nullif(EducationPlan.degree, ""),
+        func.nullif(EducationPlan.payload["degree"].astext, ""),
+    )
+    stmt = select(
+        EducationPlan.id,
+        EducationPlan.program_name,
+        EducationPlan.university_name,
+        degree.label("degree"),
+        EducationPlan.updated_at,
+        credits.label("total_credits"),
+        course_count.label("course_count"),
+    )
+    result = await db.execute(_list_page(stmt, query))
+    rows, cursor = _next_cursor(list(result.all()), query)
+    return [
+        {
+            "id": row.id,
+            "program": row.program_name,
+            "university": row.university_name,
+            "degree": row.degree,
+            "total_credits": int(row.total_credits or 0),
+            "course_count": int(row.course_count or 0),
+            "updated_at": row.updated_at.isoformat() if row.updated_at else None,
+        }
+        for row in rows
+    ], cursor
+
+
+async def find_plans_containing(
+    db: AsyncSession, criteria: dict, user_id: int | None = None
+) -> Sequence[EducationPlan]:
+    """Return plans whose payload contains ``criteria`` (JSONB ``@>``, GIN indexed)."""
+    stmt = select(EducationPlan).where(EducationPlan.payload.contains(criteria))
+    if user_id is not None:
+        stmt = stmt.where(EducationPlan.user_id == user_id)
+    result = await db.execute(stmt.order_by(EducationPlan.id))
+    return result.scalars().all()
+
+
+async def find_plans_with_course(
+    db: AsyncSession, course_code: str, user_id: int | None = None
+) -> Sequence[EducationPlan]:
+    return await find_plans_containing(db, {"program": [{"code": course_code}]}, user_id)
+
+
+async def find_reschedules_containing(
+    db: AsyncSession, criteria: dict, user_id: int | None = None
+) -> Sequence[CourseReschedule]:
+    """Return reschedule requests whose payload contains ``criteria``."""
+    stmt = select(CourseReschedule).where(CourseReschedule.payload.contains(criteria))
+    if user_id is not None:
+        stmt = stmt.where(CourseReschedule.user_id == user_id)
+    result = await db.execute(stmt.order_by(CourseReschedule.requested_at.desc()))
     return result.scalars().all()
 
 
@@ -170,6 +449,8 @@ async def delete_plan(
         raise HTTPException(status_code=404, detail="Education plan not found")
     await db.delete(plan)
     await db.commit()
+    course_graph.forget_plan(plan.id)
+    await plan_cache.invalidate(user_scope(user.email), plan_scope(program_name, university_name))
 
 
 async def save_reschedule(
@@ -181,4 +462,5 @@ async def save_reschedule(
     db.add(entry)
     await db.commit()
     await db.refresh(entry)
+    await plan_cache.invalidate(user_scope(user.email))
     return entry
@@ -1,4 +1,4 @@
-from sqlalchemy import select
+from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.education_plan import Country, State
@@ -12,3 +12,16 @@ async def list_countries(db: AsyncSession):
 async def list_states(db: AsyncSession, country_id: int):
     result = await db.execute(select(State).where(State.country_id == country_id))
     return result.scalars().all()
+
+
+async def countries_version(db: AsyncSession) -> tuple:
+    """Cheap change stamp for the country list (reference data is only ever appended)."""
+    result = await db.execute(select(func.count(Country.id), func.max(Country.id)))
+    return tuple(result.one())
+
+
+async def states_version(db: AsyncSession, country_id: int) -> tuple:
+    result = await db.execute(
+        select(func.count(State.id), func.max(State.id)).where(State.country_id == country_id)
+    )
+    return tuple(result.one())
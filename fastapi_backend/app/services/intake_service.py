@@ -0,0 +1,32 @@
+from __future__ import annotations
+
+from typing import Any, Sequence
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.intake import IntakeSubmission
+
+
+async def find_submissions(
+    db: AsyncSession, criteria: dict[str, Any], limit: int = 100
+) -> Sequence[IntakeSubmission]:
+    """Return the newest submissions whose payload contains ``criteria``.
+
+    ``{"field": "value"}`` matches submissions where ``field`` equals ``value``; the
+    containment check runs in Postgres against the GIN index on ``payload``.
+    """
+    stmt = (
+        select(IntakeSubmission)
+        .where(IntakeSubmission.payload.contains(criteria))
+        .order_by(IntakeSubmission.submitted_at.desc())
+        .limit(limit)
+    )
+    result = await db.execute(stmt)
+    return result.scalars().all()
+
+
+async def find_submissions_by_field(
+    db: AsyncSession, field: str, value: Any, limit: int = 100
+) -> Sequence[IntakeSubmission]:
+    return await find_submissions(db, {field: value}, limit)
@@ -0,0 +1,177 @@
+"""Read-through cache for education plan reads, invalidated by plan writes."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import math
+import uuid
+from typing import Any, Awaitable, Callable, Protocol
+
+from app.core.config import settings
+from app.utils.cache import TTLCache
+
+logger = logging.getLogger(__name__)
+
+
+class CacheBackend(Protocol):
+    async def get(self, key: str) -> Any | None: ...
+
+    async def set(self, key: str, value: Any, ttl: float) -> None: ...
+
+    async def get_token(self, key: str) -> str | None: ...
+
+    async def set_token(self, key: str, token: str, only_if_missing: bool = False) -> str: ...
+
+    async def close(self) -> None: ...
+
+
+class MemoryBackend:
+    """Per-process LRU; each uvicorn worker keeps its own copy."""
+
+    def __init__(self, maxsize: int, ttl: float) -> None:
+        self.entries = TTLCache(maxsize=maxsize, ttl=ttl)
+        # An evicted token is simply re-issued; entries under the old one become unreachable.
+        self._tokens = TTLCache(maxsize=maxsize * 4, ttl=math.inf)
+
+    async def get(self, key: str) -> Any | None:
+        return self.entries.get(key)
+
+    async def set(self, key: str, value: Any, ttl: float) -> None:
+        self.entries.set(key, value, ttl)
+
+    async def get_token(self, key: str) -> str | None:
+        return self._tokens.get(key)
+
+    async def set_token(self, key: str, token: str, only_if_missing: bool = False) -> str:
+        if only_if_missing and (current := self._tokens.get(key)) is not None:
+            return current
+        self._tokens.set(key, token)
+        return token
+
+    async def close(self) -> None:
+        self.entries.clear()
+
+
+class RedisBackend:
+    """Shared cache in Redis (or a compatible server such as Valkey or KeyDB).
+
+    Size is bounded by the server's ``maxmemory`` with an LRU eviction policy; entries
+    also expire after their TTL. Requires the optional ``redis`` package.
+    """
+
+    def __init__(self, url: str, token_ttl: float) -> None:
+        try:
+            from redis import asyncio as redis_asyncio
+        except ImportError as exc:  # pragma: no cover - optional dependency
+            raise RuntimeError("PLAN_CACHE_BACKEND=redis requires the 'redis' package") from exc
+        self._redis = redis_asyncio.from_url(url)
+        self._token_ttl = int(token_ttl)
+
+    async def get(self, key: str) -> Any | None:
+        raw = await self._redis.get(key)
+        return json.loads(raw) if raw is not None else None
+
+    async def set(self, key: str, value: Any, ttl: float) -> None:
+        await self._redis.set(key, json.dumps(value, default=str), ex=max(1, int(ttl)))
+
+    async def get_token(self, key: str) -> str | None:
+        raw = await self._redis.get(key)
+        return raw.decode() if isinstance(raw, bytes) else raw
+
+    async def set_token(self, key: str, token: str, only_if_missing: bool = False) -> str:
+        # Tokens outlive entries so an expired token cannot resurrect older entries.
+        if only_if_missing:
+            if await self._redis.set(key, token, ex=self._token_ttl, nx=True):
+                return token
+            return await self.get_token(key) or token
+        await self._redis.set(key, token, ex=self._token_ttl)
+        return token
+
+    async def close(self) -> None:
+        await self._redis.aclose()
+
+
+class PlanCache:
+    """Caches plan reads under per-scope tokens; bumping a scope's token invalidates it.
+
+    Keys look like ``plans:<scope>:<token>:<digest>``. Writers replace the scope token
+    rather than deleting keys, so a read that raced a write stores its result under the
+    old token where nobody will look it up again. Backend errors are logged and treated
+    as cache misses.
+    """
+
+    def __init__(self, backend: CacheBackend | None, ttl: float) -> None:
+        self.backend = backend
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+
+    async def _token(self, scope: str) -> str:
+        key = f"plans:token:{scope}"
+        token = await self.backend.get_token(key)  # type: ignore[union-attr]
+        if token is None:
+            token = await self.backend.set_token(  # type: ignore[union-attr]
+                key, uuid.uuid4().hex, only_if_missing=True
+            )
+        return token
+
+    async def get_or_load(
+        self, scope: str, parts: tuple[Any, ...], load: Callable[[], Awaitable[Any]]
+    ) -> Any:
+        if self.backend is None:
+            return await load()
+        digest = hashlib.blake2b(repr(parts).encode(), digest_size=12).hexdigest()
+        try:
+            key = f"plans:{scope}:{await self._token(scope)}:{digest}"
+            cached = await self.backend.get(key)
+        except Exception:  # noqa: BLE001 - a cache outage must not fail plan reads
+            logger.exception("Plan cache read failed")
+            return await load()
+        if cached is not None:
+            self.hits += 1
+            return cached["value"]
+        self.misses += 1
+        value = await load()
+        try:
+            # Wrapped so that a cached "no plan" (None) is distinguishable from a miss.
+            await self.backend.set(key, {"value": value}, self.ttl)
+        except Exception:  # noqa: BLE001
+            logger.exception("Plan cache write failed")
+        return value
+
+    async def invalidate(self, *scopes: str) -> None:
+        if self.backend is None:
+            return
+        for scope in scopes:
+            try:
+                await self.backend.set_token(f"plans:token:{scope}", uuid.uuid4().hex)
+            except Exception:  # noqa: BLE001
+                logger.exception("Plan cache invalidation failed for %s", scope)
+
+    async def close(self) -> None:
+        if self.backend is not None:
+            await self.backend.close()
+
+    def stats(self) -> dict[str, int]:
+        return {"hits": self.hits, "misses": self.misses}
+
+
+def _backend_from_settings() -> CacheBackend | None:
+    if settings.plan_cache_backend == "none":
+        return None
+    if settings.plan_cache_backend == "redis":
+        return RedisBackend(settings.plan_cache_url, token_ttl=settings.plan_cache_ttl * 4)
+    return MemoryBackend(settings.plan_cache_size, settings.plan_cache_ttl)
+
+
+def user_scope(email: str) -> str:
+    return f"user:{email.lower()}"
+
+
+def plan_scope(program: str, university: str) -> str:
+    return f"plan:{program}\x1f{university}"
+
+
+plan_cache = PlanCache(_backend_from_settings(), settings.plan_cache_ttl)
@@ -0,0 +1,354 @@
+"""Semester-by-semester plan generation from the program catalog."""
+
+from __future__ import annotations
+
+import math
+import time
+from dataclasses import dataclass, replace
+from typing import Any, Iterable, Sequence
+
+from fastapi import HTTPException
+
+from app.core.config import settings
+from app.schemas.education import ProgramCoursePayload
+from app.services.course_graph import (
+    Requirement,
+    catalog_credits,
+    find_program,
+    iter_program_courses,
+    normalize_code,
+    parse_requirement,
+)
+from app.services.schedule_conflicts import Intervals, weekly_intervals
+
+YEAR_LABELS = (
+    "First Year",
+    "Second Year",
+    "Third Year",
+    "Fourth Year",
+    "Fifth Year",
+    "Sixth Year",
+)
+# Alternative term selections tried at each step besides the greedy one.
+_BRANCHES = 2
+
+
+@dataclass(frozen=True)
+class _Course:
+    code: str
+    credits: int
+    prerequisites: Requirement
+    corequisites: Requirement
+    intervals: Intervals
+    order: int
+    source: dict[str, Any]
+
+
+@dataclass
+class GeneratedPlan:
+    program: list[dict[str, Any]]
+    semesters: int
+    optimal: bool
+    unscheduled: list[str]
+
+
+def _overlaps(first: Intervals, second: Intervals) -> bool:
+    return any(a < d and c < b for a, b in first for c, d in second)
+
+
+def _pending(requirement: Requirement, program: set[str], done: set[str]) -> Requirement:
+    """Keep only clauses that must be met by a program course the student still has to take.
+
+    A clause naming a completed course or a course outside this program (placement,
+    transfer credit, ...) is left to the advisor and not enforced here.
+    """
+    return tuple(
+        clause
+        for clause in requirement
+        if all(code in program for code in clause) and not any(code in done for code in clause)
+    )
+
+
+def _within(requirement: Requirement, courses: dict[str, _Course]) -> Requirement:
+    return tuple(tuple(code for code in clause if code in courses) for clause in requirement)
+
+
+def _schedulable(courses: dict[str, _Course]) -> set[str]:
+    """Courses whose prerequisite chains and corequisites can all be met within ``courses``."""
+    schedulable: set[str] = set()
+    while True:
+        ready = {
+            code
+            for code, course in courses.items()
+            if code not in schedulable
+            and all(any(c in schedulable for c in clause) for clause in course.prerequisites)
+        }
+        if not ready:
+            break
+        schedulable |= ready
+    return {
+        code
+        for code in schedulable
+        if all(any(c in schedulable for c in clause) for clause in courses[code].corequisites)
+    }
+
+
+class _Search:
+    def __init__(
+        self,
+        courses: dict[str, _Course],
+        max_credits: int,
+        max_semesters: int,
+        deadline: float,
+    ) -> None:
+        self.courses = courses
+        self.max_credits = max_credits
+        self.max_semesters = max_semesters
+        self.deadline = deadline
+        self.height = self._heights()
+        self.rank = sorted(
+            courses, key=lambda c: (-self.height[c], -courses[c].credits, courses[c].order)
+        )
+        # remaining set -> earliest term it was reached at; later visits cannot do better.
+        self.seen: dict[frozenset[str], int] = {}
+        self.best: list[frozenset[str]] | None = None
+        self.timed_out = False
+
+    def _heights(self) -> dict[str, int]:
+        """Length of the longest prerequisite chain starting at each course."""
+        dependents: dict[str, set[str]] = {code: set() for code in self.courses}
+        for course in self.courses.values():
+            for clause in course.prerequisites:
+                for code in clause:
+                    dependents[code].add(course.code)
+        height: dict[str, int] = {}
+
+        def visit(code: str) -> int:
+            # Cycles were removed before the search, so plain memoized recursion terminates.
+            if code not in height:
+                height[code] = 1 + max((visit(d) for d in dependents[code]), default=0)
+            return height[code]
+
+        for code in self.courses:
+            visit(code)
+        return height
+
+    def lower_bound(self, remaining: frozenset[str]) -> int:
+        if not remaining:
+            return 0
+        credits = sum(self.courses[code].credits for code in remaining)
+        return max(
+            max(self.height[code] for code in remaining),
+            math.ceil(credits / self.max_credits),
+        )
+
+    def _met(self, requirement: Requirement, taken: Iterable[str] | frozenset[str]) -> bool:
+        return all(any(code in taken for code in clause) for clause in requirement)
+
+    def candidates(self, remaining: frozenset[str]) -> list[frozenset[str]]:
+        """Greedy term selection plus variants that hold back one high-priority course."""
+        done = self.courses.keys() - remaining
+        available = [
+            code
+            for code in self.rank
+            if code in remaining and self._met(self.courses[code].prerequisites, done)
+        ]
+        options: list[frozenset[str]] = []
+        greedy = self._fill(available, done, skip=None)
+        if greedy:
+            options.append(greedy)
+        for skip in [code for code in available if code in greedy][:_BRANCHES]:
+            variant = self._fill(available, done, skip=skip)
+            if variant and variant not in options:
+                options.append(variant)
+        return options
+
+    def _fill(self, available: list[str], done: set[str], skip: str | None) -> frozenset[str]:
+        chosen: list[str] = []
+        credits = 0
+        for code in available:
+            if code == skip or code in chosen:
+                continue
+            bundle = [code] + self._partners(code, available, done, chosen, skip)
+            added = [c for c in dict.fromkeys(bundle) if c not in chosen]
+            load = sum(self.courses[c].credits for c in added)
+            if credits + load > self.max_credits:
+                continue
+            if any(
+                _overlaps(self.courses[a].intervals, self.courses[b].intervals)
+                for i, a in enumerate(added)
+                for b in chosen + added[i + 1 :]
+            ):
+                continue
+            taken = done | set(chosen) | set(added)
+            if not all(self._met(self.courses[c].corequisites, taken) for c in added):
+                continue
+            chosen.extend(added)
+            credits += load
+        return frozenset(chosen)
+
+    def _partners(
+        self, code: str, available: list[str], done: set[str], chosen: list[str], skip: str | None
+    ) -> list[str]:
+        """Available corequisites that must join ``code`` in the same term."""
+        partners = []
+        for clause in self.courses[code].corequisites:
+            if any(c in done or c in chosen for c in clause):
+                continue
+            partner = next((c for c in available if c in clause and c != skip), None)
+            if partner:
+                partners.append(partner)
+        return partners
+
+    def run(self, remaining: frozenset[str]) -> None:
+        self._visit(remaining, [])
+
+    def _visit(self, remaining: frozenset[str], path: list[frozenset[str]]) -> None:
+        if not remaining:
+            if self.best is None or len(path) < len(self.best):
+                self.best = list(path)
+            return
+        term = len(path)
+        limit = len(self.best) if self.best is not None else self.max_semesters + 1
+        if term + self.lower_bound(remaining) >= limit:
+            return
+        if self.seen.get(remaining, self.max_semesters + 1) <= term:
+            return
+        self.seen[remaining] = term
+        if time.perf_counter() > self.deadline:
+            self.timed_out = True
+            return
+        for selection in self.candidates(remaining):
+            path.append(selection)
+            self._visit(remaining - selection, path)
+            path.pop()
+            if self.timed_out:
+                return
+
+    def greedy(self, remaining: frozenset[str]) -> tuple[list[frozenset[str]], frozenset[str]]:
+        """Fallback schedule when search finds no complete plan; returns leftovers too."""
+        path: list[frozenset[str]] = []
+        while remaining and len(path) < self.max_semesters:
+            options = self.candidates(remaining)
+            if not options:
+                break
+            path.append(options[0])
+            remaining = remaining - options[0]
+        return path, remaining
+
+
+def _term_labels(index: int, seasons: Sequence[str]) -> tuple[str, str]:
+    year = index // len(seasons)
+    label = YEAR_LABELS[year] if year < len(YEAR_LABELS) else f"Year {year + 1}"
+    return label, seasons[index % len(seasons)]
+
+
+def generate_plan(
+    program: str,
+    university: str,
+    degree: str | None = None,
+    completed: Sequence[str] = (),
+    max_credits: int = 18,
+    seasons: Sequence[str] = ("Fall", "Spring"),
+    max_semesters: int = 16,
+    time_budget: float | None = None,
+) -> GeneratedPlan:
+    """Lay out the remaining catalog courses of a program over as few semesters as possible.
+
+    Prerequisites must be taken in an earlier term, corequisites in the same or an
+    earlier one, each term stays within ``max_credits`` and no two courses with fixed
+    meeting times may overlap. Search is depth-first over term selections with a
+    critical-path/credit lower bound and memoized remaining-course sets; when the time
+    budget runs out the best plan found so far is returned.
+    """
+    item = find_program(program, university, degree)
+    if not item:
+        raise HTTPException(status_code=404, detail="Program not found in catalog")
+    budget = settings.plan_generator_time_budget if time_budget is None else time_budget
+    deadline = time.perf_counter() + budget
+
+    done = {normalize_code(code) for code in completed}
+    entries: dict[str, tuple[int, dict[str, Any]]] = {}
+    for order, (_, _, course) in enumerate(iter_program_courses(item)):
+        entries.setdefault(normalize_code(course.get("code")), (order, course))
+    program_codes = set(entries)
+
+    courses: dict[str, _Course] = {}
+    unscheduled: list[str] = []
+    for code, (order, course) in entries.items():
+        if code in done:
+            continue
+        credits = catalog_credits(course.get("credits"))
+        if credits > max_credits:
+            unscheduled.append(code)
+            continue
+        schedule = course.get("schedule")
+        courses[code] = _Course(
+            code=code,
+            credits=credits,
+            prerequisites=_pending(
+                parse_requirement(course.get("prerequisite")), program_codes, done
+            ),
+            corequisites=_pending(
+                parse_requirement(course.get("corequisite")), program_codes, done
+            ),
+            intervals=weekly_intervals(schedule.get("day"), schedule.get("time"))
+            if isinstance(schedule, dict)
+            else (),
+            order=order,
+            source=course,
+        )
+
+    # Courses that never become available, ignoring credit caps and times, sit on a
+    # prerequisite cycle, behind an unschedulable course or need one as a corequisite.
+    while True:
+        schedulable = _schedulable(courses)
+        if len(schedulable) == len(courses):
+            break
+        unscheduled.extend(code for code in courses if code not in schedulable)
+        courses = {code: course for code, course in courses.items() if code in schedulable}
+    # Drop the alternatives that were left out, so every clause names searchable courses.
+    courses = {
+        code: replace(
+            course,
+            prerequisites=_within(course.prerequisites, courses),
+            corequisites=_within(course.corequisites, courses),
+        )
+        for code, course in courses.items()
+    }
+
+    search = _Search(courses, max_credits, max_semesters, deadline)
+    remaining = frozenset(courses)
+    search.run(remaining)
+    if search.best is not None:
+        path, leftover = search.best, frozenset()
+    else:
+        path, leftover = search.greedy(remaining)
+    unscheduled.extend(sorted(leftover, key=lambda code: courses[code].order))
+
+    plan = []
+    for index, selection in enumerate(path):
+        year, semester = _term_labels(index, seasons)
+        for code in sorted(selection, key=lambda c: courses[c].order):
+            source = courses[code].source
+            schedule = source.get("schedule")
+            plan.append(
+                ProgramCoursePayload(
+                    program=item.get("program"),
+                    university=item.get("university"),
+                    year=year,
+                    semester=semester,
+                    code=source.get("code"),
+                    course_name=source.get("name"),
+                    credits=courses[code].credits,
+                    prerequisite=source.get("prerequisite"),
+                    corequisite=source.get("corequisite"),
+                    schedule=schedule if isinstance(schedule, dict) else None,
+                ).model_dump(by_alias=True)
+            )
+    return GeneratedPlan(
+        program=plan,
+        semesters=len(path),
+        optimal=not leftover and not unscheduled and len(path) == search.lower_bound(remaining),
+        unscheduled=unscheduled,
+    )
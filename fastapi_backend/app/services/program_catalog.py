@@ -0,0 +1,132 @@
+"""In-memory program catalog loaded from ``programdetail.json``."""
+
+from __future__ import annotations
+
+import math
+from typing import Any, Iterable
+
+from app.services.catalog_store import (
+    ReloadableCatalog,
+    envelope,
+    normalize,
+    slugify,
+)
+from app.utils.cache import TTLCache
+from app.utils.http_cache import EncodedBody
+
+CATALOG_FILE = "programdetail.json"
+
+
+def _norm_code(value: Any) -> str:
+    return " ".join(str(value or "").upper().split())
+
+
+class CatalogSnapshot:
+    """Immutable catalog version with lookup indexes and pre-encoded responses."""
+
+    def __init__(self, entries: Iterable[dict[str, Any]], version: str = "") -> None:
+        self.version = version
+        self.programs: dict[str, dict[str, Any]] = {}
+        self.summaries: dict[str, dict[str, Any]] = {}
+        self.by_program: dict[str, list[str]] = {}
+        self.by_degree: dict[str, list[str]] = {}
+        self.by_university: dict[str, list[str]] = {}
+        self.by_course: dict[str, list[str]] = {}
+
+        for entry in entries:
+            base = slugify(entry.get("program"), entry.get("degree"), entry.get("university"))
+            program_id = base
+            suffix = 2
+            while program_id in self.programs:
+                program_id, suffix = f"{base}-{suffix}", suffix + 1
+            codes = list(
+                dict.fromkeys(
+                    _norm_code(course.get("code"))
+                    for year in entry.get("years") or []
+                    for semester in year.get("semesters") or []
+                    for course in semester.get("courses") or []
+                    if course.get("code")
+                )
+            )
+            self.programs[program_id] = {"id": program_id, **entry}
+            self.summaries[program_id] = {
+                "id": program_id,
+                "program": entry.get("program"),
+                "degree": entry.get("degree"),
+                "university": entry.get("university"),
+                "total_credit_hours": entry.get("total_credit_hours"),
+                "course_count": len(codes),
+            }
+            self.by_program.setdefault(normalize(entry.get("program")), []).append(program_id)
+            self.by_degree.setdefault(normalize(entry.get("degree")), []).append(program_id)
+            self.by_university.setdefault(normalize(entry.get("university")), []).append(program_id)
+            for code in codes:
+                self.by_course.setdefault(code, []).append(program_id)
+
+        self.listing = EncodedBody.encode(
+            envelope("Programs loaded", list(self.summaries.values()))
+        )
+        self.details = {
+            program_id: EncodedBody.encode(envelope("Program loaded", entry))
+            for program_id, entry in self.programs.items()
+        }
+        # Filtered listings are encoded on first use and kept for the life of the snapshot.
+        self._filtered = TTLCache(maxsize=256, ttl=math.inf)
+
+    def __len__(self) -> int:
+        return len(self.programs)
+
+    def filter_ids(
+        self,
+        program: str | None = None,
+        degree: str | None = None,
+        university: str | None = None,
+        course: str | None = None,
+    ) -> list[str]:
+        selected: list[str] = list(self.programs)
+        for index, value in (
+            (self.by_program, normalize(program)),
+            (self.by_degree, normalize(degree)),
+            (self.by_university, normalize(university)),
+            (self.by_course, _norm_code(course)),
+        ):
+            if value:
+                matches = set(index.get(value, ()))
+                selected = [program_id for program_id in selected if program_id in matches]
+        return selected
+
+    def listing_for(
+        self,
+        program: str | None = None,
+        degree: str | None = None,
+        university: str | None = None,
+        course: str | None = None,
+    ) -> EncodedBody:
+        if not any((program, degree, university, course)):
+            return self.listing
+        key = (normalize(program), normalize(degree), normalize(university), _norm_code(course))
+        encoded = self._filtered.get(key)
+        if encoded is None:
+            ids = self.filter_ids(program, degree, university, course)
+            encoded = EncodedBody.encode(
+                envelope("Programs loaded", [self.summaries[program_id] for program_id in ids])
+            )
+            self._filtered.set(key, encoded)
+        return encoded
+
+    def find(
+        self, program: str | None, university: str | None, degree: str | None = None
+    ) -> dict[str, Any] | None:
+        """Catalog entry for a program; without a degree the first match is returned."""
+        ids = self.filter_ids(program=program, university=university, degree=degree)
+        return self.programs[ids[0]] if ids else None
+
+
+def _build(documents: list[Any], version: str) -> CatalogSnapshot:
+    entries = documents[0] if isinstance(documents[0], list) else []
+    return CatalogSnapshot((entry for entry in entries if isinstance(entry, dict)), version)
+
+
+program_catalog: ReloadableCatalog[CatalogSnapshot] = ReloadableCatalog(
+    "Program catalog", [CATALOG_FILE], _build
+)
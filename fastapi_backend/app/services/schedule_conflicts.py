@@ -0,0 +1,241 @@
+"""Weekly schedule parsing and overlap detection for plan courses and reschedules."""
+
+from __future__ import annotations
+
+import heapq
+import re
+from functools import lru_cache
+from typing import Any, Iterable, Sequence
+
+from app.schemas.education import ProgramCoursePayload, RescheduleEntry, ScheduleBlock
+
+MINUTES_PER_DAY = 24 * 60
+DAY_NAMES = ("Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun")
+_DAY_ALIASES = {
+    "m": 0,
+    "mo": 0,
+    "mon": 0,
+    "monday": 0,
+    "tu": 1,
+    "tue": 1,
+    "tues": 1,
+    "tuesday": 1,
+    "w": 2,
+    "we": 2,
+    "wed": 2,
+    "wednesday": 2,
+    "th": 3,
+    "r": 3,
+    "thu": 3,
+    "thur": 3,
+    "thurs": 3,
+    "thursday": 3,
+    "f": 4,
+    "fr": 4,
+    "fri": 4,
+    "friday": 4,
+    "sa": 5,
+    "sat": 5,
+    "saturday": 5,
+    "su": 6,
+    "sun": 6,
+    "sunday": 6,
+}
+_DAY_SPLIT_RE = re.compile(r"\s*(?:,|/|&|\band\b|\s)\s*", re.IGNORECASE)
+_DAY_RANGE_RE = re.compile(r"\s*(?:-|–|—|\bto\b|\bthrough\b)\s*", re.IGNORECASE)
+# Registrar shorthand: "MWF", "TR", "TTh" (T = Tuesday, R/Th = Thursday, U/Su = Sunday).
+_COMPACT_DAYS_RE = re.compile(r"(?:th|tu|sa|su|[mtwrfsu])+")
+_COMPACT_DAY_RE = re.compile(r"th|tu|sa|su|[mtwrfsu]")
+_COMPACT_DAYS = {"t": 1, "s": 5, "u": 6}
+_TIME_RE = re.compile(r"^(\d{1,2})(?::(\d{2}))?\s*([ap])?\.?m?\.?$", re.IGNORECASE)
+_RANGE_SPLIT_RE = re.compile(r"\s*(?:-|–|—|\bto\b)\s*", re.IGNORECASE)
+
+# Weekly intervals in minutes from Monday 00:00, half-open: [start, end).
+Intervals = tuple[tuple[int, int], ...]
+
+
+def _day(token: str) -> int | None:
+    return _DAY_ALIASES.get(token, _COMPACT_DAYS.get(token))
+
+
+@lru_cache(maxsize=1024)
+def parse_days(text: str | None) -> tuple[int, ...]:
+    """``"Mon, Wed"``, ``"Tuesday, Thursday"``, ``"Mon - Fri"``, ``"MWF"``, ``"TR"`` -> weekdays."""
+    if not text:
+        return ()
+    days: list[int] = []
+    for part in _DAY_SPLIT_RE.split(_DAY_RANGE_RE.sub("-", text.strip().lower())):
+        if not part:
+            continue
+        if "-" in part:
+            first, _, last = part.partition("-")
+            if _day(first) is not None and _day(last) is not None:
+                days.extend(range(_day(first), _day(last) + 1))
+                continue
+            return ()
+        if part in _DAY_ALIASES:
+            days.append(_DAY_ALIASES[part])
+        elif _COMPACT_DAYS_RE.fullmatch(part):
+            days.extend(_day(token) for token in _COMPACT_DAY_RE.findall(part))
+        else:
+            # "TBD", "Online", ... carry no meeting days.
+            return ()
+    return tuple(sorted(set(days)))
+
+
+def _parse_clock(text: str) -> tuple[int, str | None] | None:
+    value = text.strip().lower()
+    if value == "noon":
+        return 12 * 60, "p"
+    match = _TIME_RE.match(value)
+    if not match:
+        return None
+    hour, minute, meridiem = int(match.group(1)), int(match.group(2) or 0), match.group(3)
+    if minute >= 60 or hour > 23 or (meridiem and not 1 <= hour <= 12):
+        return None
+    return hour * 60 + minute, meridiem
+
+
+def _to_minutes(clock: tuple[int, str | None], meridiem: str | None) -> int:
+    minutes, _ = clock
+    if meridiem == "p" and minutes < 12 * 60:
+        minutes += 12 * 60
+    elif meridiem == "a" and minutes >= 12 * 60:
+        minutes -= 12 * 60
+    return minutes
+
+
+def parse_time(text: str | None) -> int | None:
+    """``"9:00 AM"``, ``"1 PM"``, ``"14:30"`` -> minutes after midnight."""
+    clock = _parse_clock(text) if text else None
+    return _to_minutes(clock, clock[1]) if clock else None
+
+
+@lru_cache(maxsize=1024)
+def parse_time_range(text: str | None) -> tuple[int, int] | None:
+    """``"9:00 AM - 10:15 AM"`` -> ``(540, 615)``; ``None`` for "TBD" and similar."""
+    if not text:
+        return None
+    parts = _RANGE_SPLIT_RE.split(text.strip())
+    if len(parts) != 2:
+        return None
+    return _range(*parts)
+
+
+def _range(start_text: str | None, end_text: str | None) -> tuple[int, int] | None:
+    start = _parse_clock(start_text) if start_text else None
+    end = _parse_clock(end_text) if end_text else None
+    if not start or not end:
+        return None
+    end_minutes = _to_minutes(end, end[1])
+    # "9:00 - 10:15 AM": the start borrows the end's meridiem unless that puts it later.
+    start_minutes = _to_minutes(start, start[1] or end[1])
+    if start[1] is None and start_minutes >= end_minutes:
+        start_minutes = _to_minutes(start, "a")
+    if start_minutes >= end_minutes:
+        return None
+    return start_minutes, end_minutes
+
+
+@lru_cache(maxsize=8192)
+def weekly_intervals(day: str | None, time: str | None) -> Intervals:
+    """Meeting intervals of a ``schedule`` block; empty when it has no fixed time."""
+    return _weekly(parse_days(day), parse_time_range(time))
+
+
+@lru_cache(maxsize=8192)
+def _entry_intervals(day: str | None, fromtime: str | None, totime: str | None) -> Intervals:
+    return _weekly(parse_days(day), _range(fromtime, totime))
+
+
+def _weekly(days: tuple[int, ...], span: tuple[int, int] | None) -> Intervals:
+    if span is None:
+        return ()
+    start, end = span
+    return tuple((day * MINUTES_PER_DAY + start, day * MINUTES_PER_DAY + end) for day in days)
+
+
+def _format(minutes: int) -> str:
+    return f"{minutes // 60:02d}:{minutes % 60:02d}"
+
+
+def find_conflicts(items: Iterable[tuple[Any, Intervals]]) -> list[dict[str, Any]]:
+    """Report every overlapping pair among ``(label, intervals)`` items.
+
+    Sweep line over interval starts with a min-heap of active end times: O(n log n) plus
+    the number of overlaps reported. Intervals that only touch (10:15 end, 10:15 start)
+    do not conflict.
+    """
+    labels: list[Any] = []
+    events: list[tuple[int, int, int]] = []
+    for label, intervals in items:
+        for start, end in intervals:
+            events.append((start, end, len(labels)))
+        labels.append(label)
+    events.sort()
+
+    active: list[tuple[int, int, int]] = []
+    overlaps: dict[tuple[int, int], list[dict[str, Any]]] = {}
+    for start, end, index in events:
+        while active and active[0][0] <= start:
+            heapq.heappop(active)
+        for other_end, _other_start, other in active:
+            if other == index:
+                continue
+            pair = (min(index, other), max(index, other))
+            day, offset = divmod(start, MINUTES_PER_DAY)
+            overlaps.setdefault(pair, []).append(
+                {
+                    "day": DAY_NAMES[day],
+                    "from": _format(offset),
+                    "to": _format(min(end, other_end) - day * MINUTES_PER_DAY),
+                }
+            )
+        heapq.heappush(active, (end, start, index))
+
+    return [
+        {"items": [labels[first], labels[second]], "overlaps": found}
+        for (first, second), found in sorted(overlaps.items())
+    ]
+
+
+def _text(value: Any) -> str | None:
+    """Free-form ``schedule`` dicts may hold numbers or lists; the parsers take strings."""
+    if value is None or isinstance(value, str):
+        return value
+    if isinstance(value, (list, tuple)):
+        return ", ".join(str(item) for item in value if isinstance(item, (str, int)))
+    return str(value) if isinstance(value, (int, float)) else None
+
+
+def _block(schedule: ScheduleBlock | dict | None) -> tuple[str | None, str | None]:
+    if isinstance(schedule, ScheduleBlock):
+        return schedule.day, schedule.time
+    if isinstance(schedule, dict):
+        return _text(schedule.get("day")), _text(schedule.get("time"))
+    return None, None
+
+
+def plan_conflicts(courses: Sequence[ProgramCoursePayload]) -> list[dict[str, Any]]:
+    """Schedule overlaps between courses planned for the same year and semester."""
+    terms: dict[tuple[str | None, str | None], list[tuple[Any, Intervals]]] = {}
+    for course in courses:
+        intervals = weekly_intervals(*_block(course.schedule))
+        if intervals:
+            terms.setdefault((course.year, course.semester), []).append(
+                (course.code or course.course_name, intervals)
+            )
+    conflicts = []
+    for (year, semester), items in terms.items():
+        if len(items) > 1:
+            for conflict in find_conflicts(items):
+                conflicts.append({"year": year, "semester": semester, **conflict})
+    return conflicts
+
+
+def reschedule_conflicts(entries: Sequence[RescheduleEntry]) -> list[dict[str, Any]]:
+    """Overlaps between requested reschedule slots, labelled by their list position."""
+    return find_conflicts(
+        (index, _entry_intervals(entry.day, entry.fromtime, entry.totime))
+        for index, entry in enumerate(entries)
+    )
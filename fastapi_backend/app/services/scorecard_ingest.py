@@ -0,0 +1,205 @@
+"""Load the College Scorecard bulk data file into the ``scorecard_schools`` mirror."""
+
+from __future__ import annotations
+
+import csv
+import logging
+from pathlib import Path
+from typing import Any, Iterator
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from app.clients.college_scorecard import BASE_FIELDS
+from app.clients.scorecard_mirror import FIELD_COLUMNS
+from app.models.scorecard import ScorecardSchool
+
+logger = logging.getLogger(__name__)
+
+# Variable names used by the published bulk file (Most-Recent-Cohorts-Institution.csv).
+# Files whose header uses the API's dotted field names are accepted as well. Where the API
+# merges several file variables into one field (4-year vs. less-than-4-year, public vs.
+# private), the candidates are listed in order and the first non-null value per row wins.
+BULK_FILE_COLUMNS: dict[str, str | tuple[str, ...]] = {
+    "id": "UNITID",
+    "school.name": "INSTNM",
+    "school.city": "CITY",
+    "school.state": "STABBR",
+    "school.school_url": "INSTURL",
+    "school.ownership": "CONTROL",
+    "school.locale": "LOCALE",
+    "latest.student.size": "UGDS",
+    "latest.student.part_time_share": "PPTUG_EF",
+    "latest.completion.consumer_rate": ("C150_4", "C150_L4"),
+    "latest.cost.avg_net_price.overall": ("NPT4_PUB", "NPT4_PRIV", "NPT4_PROG", "NPT4_OTHER"),
+    "latest.earnings.10_yrs_after_entry.median": "MD_EARN_WNE_P10",
+    "latest.aid.median_debt.completers.overall": "GRAD_DEBT_MDN",
+    "latest.aid.median_debt.completers.monthly_payments": "GRAD_DEBT_MDN10YR",
+    "latest.student.share_white": "UGDS_WHITE",
+    "latest.student.share_black": "UGDS_BLACK",
+    "latest.student.share_hispanic": "UGDS_HISP",
+    "latest.student.share_asian": "UGDS_ASIAN",
+    "latest.student.share_two_or_more": "UGDS_2MOR",
+    "latest.student.share_non_resident_alien": "UGDS_NRA",
+    "latest.student.share_firstgeneration": "PAR_ED_PCT_1STGEN",
+    "latest.aid.pell_grant_rate": "PCTPELL",
+    "latest.aid.dcs_federal_loan_rate_pooled": (
+        "PCTFLOAN_DCS_POOLED_SUPP",
+        "PCTFLOAN_DCS",
+        "PCTFLOAN",
+    ),
+    "latest.student.demographics.student_faculty_ratio": "STUFACR",
+    "latest.student.retention_rate_suppressed.four_year.full_time_pooled": "RET_FT4_POOLED_SUPP",
+    "latest.student.retention_rate_suppressed.lt_four_year.full_time_pooled": (
+        "RET_FTL4_POOLED_SUPP"
+    ),
+    "latest.admissions.sat_scores.25th_percentile.critical_reading": "SATVR25",
+    "latest.admissions.sat_scores.75th_percentile.critical_reading": "SATVR75",
+    "latest.admissions.act_scores.25th_percentile.cumulative": "ACTCM25",
+    "latest.admissions.act_scores.75th_percentile.cumulative": "ACTCM75",
+    "latest.admissions.admission_rate.overall": "ADM_RATE",
+    "latest.repayment.3_yr_repayment.completers.rate": (
+        "COMPL_RPY_3YR_RT_SUPP",
+        "COMPL_RPY_3YR_RT",
+        "RPY_3YR_RT_SUPP",
+        "RPY_3YR_RT",
+    ),
+    "latest.earnings.6_yrs_after_entry.gt_threshold": "GT_THRESHOLD_P6",
+}
+# Not a column of the bulk file: the file covers one academic year, passed at ingest time.
+FILE_LEVEL_FIELDS = {"latest.academic_year"}
+for _sector, _suffix in (("public", "PUB"), ("private", "PRIV")):
+    for _index, _level in enumerate(
+        ("0-30000", "30001-48000", "48001-75000", "75001-110000", "110001-plus"), start=1
+    ):
+        BULK_FILE_COLUMNS[f"latest.cost.net_price.{_sector}.by_income_level.{_level}"] = (
+            f"NPT4{_index}_{_suffix}"
+        )
+
+NULL_TOKENS = {"", "NULL", "NA", "PrivacySuppressed", "PS"}
+
+COLUMNS = [FIELD_COLUMNS[field] for field in BASE_FIELDS]
+_PYTHON_TYPES = {
+    column: ScorecardSchool.__table__.c[column].type.python_type for column in COLUMNS
+}
+
+
+def _coerce(value: str | None, python_type: type) -> Any:
+    # Match the JSON types the API returns so _map_school behaves the same on both backends.
+    if value is None or value.strip() in NULL_TOKENS:
+        return None
+    value = value.strip()
+    if python_type is str:
+        return value
+    try:
+        number = float(value)
+    except ValueError:
+        return None
+    return int(number) if python_type is int else number
+
+
+def _candidates(field: str) -> tuple[str, ...]:
+    bulk = BULK_FILE_COLUMNS.get(field, ())
+    return (field, *((bulk,) if isinstance(bulk, str) else bulk))
+
+
+def _resolve_sources(header: list[str]) -> dict[str, tuple[str, ...]]:
+    """Map each mirror column to the header names it is read from, in priority order."""
+    available = set(header)
+    sources: dict[str, tuple[str, ...]] = {}
+    for field in BASE_FIELDS:
+        present = tuple(name for name in _candidates(field) if name in available)
+        if present:
+            sources[FIELD_COLUMNS[field]] = present
+    if "id" not in sources:
+        raise ValueError("Scorecard file has no UNITID/id column")
+    return sources
+
+
+def _read(row: dict[str, str], names: tuple[str, ...], python_type: type) -> Any:
+    for name in names:
+        value = _coerce(row.get(name), python_type)
+        if value is not None:
+            return value
+    return None
+
+
+def iter_chunks(
+    path: str | Path, chunk_size: int = 5000, academic_year: int | None = None
+) -> Iterator[list[tuple[Any, ...]]]:
+    """Stream the CSV as lists of row tuples ordered like ``COLUMNS``."""
+    with open(path, newline="", encoding="utf-8-sig") as handle:
+        reader = csv.DictReader(handle)
+        sources = _resolve_sources(reader.fieldnames or [])
+        missing = [
+            field
+            for field in BASE_FIELDS
+            if FIELD_COLUMNS[field] not in sources and field not in FILE_LEVEL_FIELDS
+        ]
+        if missing:
+            logger.warning(
+                "Scorecard file has no column for %s; these fields will be NULL for every school",
+                ", ".join(missing),
+            )
+        if "academic_year" not in sources and academic_year is None:
+            logger.warning(
+                "No academic year given (--academic-year); latest.academic_year will be NULL"
+            )
+
+        chunk: list[tuple[Any, ...]] = []
+        for row in reader:
+            values = {
+                column: _read(row, names, _PYTHON_TYPES[column])
+                for column, names in sources.items()
+            }
+            if values.get("id") is None:
+                continue
+            if academic_year is not None and values.get("academic_year") is None:
+                values["academic_year"] = academic_year
+            chunk.append(tuple(values.get(column) for column in COLUMNS))
+            if len(chunk) >= chunk_size:
+                yield chunk
+                chunk = []
+        if chunk:
+            yield chunk
+
+
+async def ingest_csv(
+    engine: AsyncEngine,
+    path: str | Path,
+    *,
+    chunk_size: int = 5000,
+    academic_year: int | None = None,
+    prune: bool = False,
+) -> int:
+    """COPY the file into a staging table chunk by chunk, then upsert in one transaction."""
+    table = ScorecardSchool.__tablename__
+    column_list = ", ".join(COLUMNS)
+    updates = ", ".join(f"{column} = EXCLUDED.{column}" for column in COLUMNS if column != "id")
+    loaded = 0
+
+    async with engine.begin() as conn:
+        await conn.execute(
+            text(
+                f"CREATE TEMP TABLE {table}_stage (LIKE {table} INCLUDING DEFAULTS) ON COMMIT DROP"
+            )
+        )
+        raw = await conn.get_raw_connection()
+        driver = raw.driver_connection
+        for chunk in iter_chunks(path, chunk_size, academic_year):
+            await driver.copy_records_to_table(f"{table}_stage", records=chunk, columns=COLUMNS)
+            loaded += len(chunk)
+            logger.info("Staged %s Scorecard rows", loaded)
+
+        await conn.execute(
+            text(
+                f"INSERT INTO {table} ({column_list}) "
+                f"SELECT DISTINCT ON (id) {column_list} FROM {table}_stage ORDER BY id "
+                f"ON CONFLICT (id) DO UPDATE SET {updates}"
+            )
+        )
+        if prune:
+            await conn.execute(
+                text(f"DELETE FROM {table} WHERE id NOT IN (SELECT id FROM {table}_stage)")
+            )
+    return loaded
@@ -0,0 +1,224 @@
+"""In-memory typeahead index over university names, cities and states."""
+
+from __future__ import annotations
+
+import json
+import logging
+import math
+import re
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Iterable
+
+from sqlalchemy import select
+
+from app.clients.college_scorecard import client as scorecard_client
+from app.clients.rate_limit import PRIORITY_BACKGROUND
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+# How many best-ranked entries each trie node keeps for single-token lookups.
+_NODE_TOP_K = 50
+
+
+@dataclass(frozen=True)
+class SuggestEntry:
+    unit_id: int
+    name: str
+    city: str | None = None
+    state: str | None = None
+    size: int | None = None
+
+
+def _tokens(text: str | None) -> list[str]:
+    return _TOKEN_RE.findall(text.lower()) if text else []
+
+
+def _trigrams(word: str) -> set[str]:
+    padded = f"  {word} "
+    return {padded[i : i + 3] for i in range(len(padded) - 2)}
+
+
+class _TrieNode:
+    __slots__ = ("children", "top")
+
+    def __init__(self) -> None:
+        self.children: dict[str, _TrieNode] = {}
+        self.top: list[int] = []
+
+
+class _Snapshot:
+    """Immutable index over one list of entries; replaced wholesale on refresh."""
+
+    def __init__(self, entries: Iterable[SuggestEntry]) -> None:
+        # Rank order is enrollment, largest first; entry positions double as ranks.
+        self.entries = sorted(entries, key=lambda entry: -(entry.size or 0))
+        self.root = _TrieNode()
+        self.words: dict[str, set[int]] = {}
+        self.entry_words: list[set[str]] = []
+        self.trigrams: dict[str, set[int]] = {}
+
+        for rank, entry in enumerate(self.entries):
+            words = set(_tokens(entry.name)) | set(_tokens(entry.city)) | set(_tokens(entry.state))
+            self.entry_words.append(words)
+            for word in words:
+                self.words.setdefault(word, set()).add(rank)
+                self._insert(word, rank)
+            for gram in set().union(*(_trigrams(word) for word in words)):
+                self.trigrams.setdefault(gram, set()).add(rank)
+
+    def _insert(self, word: str, rank: int) -> None:
+        node = self.root
+        for char in word:
+            node = node.children.setdefault(char, _TrieNode())
+            # Entries are inserted in rank order, so appending keeps ``top`` sorted.
+            if len(node.top) < _NODE_TOP_K and (not node.top or node.top[-1] != rank):
+                node.top.append(rank)
+
+    def _prefix_node(self, prefix: str) -> _TrieNode | None:
+        node = self.root
+        for char in prefix:
+            node = node.children.get(char)
+            if node is None:
+                return None
+        return node
+
+    def suggest(self, query: str, limit: int) -> list[SuggestEntry]:
+        tokens = _tokens(query)
+        if not tokens:
+            return []
+        *complete, prefix = tokens
+
+        ranks: list[int]
+        if not complete:
+            node = self._prefix_node(prefix)
+            ranks = node.top[:limit] if node else []
+        else:
+            # Earlier tokens must match whole words; the last one is a prefix.
+            postings = [self.words.get(word, set()) for word in complete]
+            candidates = set.intersection(*postings) if postings else set()
+            ranks = sorted(
+                rank
+                for rank in candidates
+                if any(word.startswith(prefix) for word in self.entry_words[rank])
+            )[:limit]
+
+        if not ranks:
+            # Nothing matched by prefix; fall back to trigram similarity to absorb typos.
+            ranks = self._fuzzy(tokens, limit)
+        return [self.entries[rank] for rank in ranks]
+
+    def _fuzzy(self, tokens: list[str], limit: int) -> list[int]:
+        grams = set().union(*(_trigrams(token) for token in tokens))
+        scores: dict[int, int] = {}
+        for gram in grams:
+            for rank in self.trigrams.get(gram, ()):
+                scores[rank] = scores.get(rank, 0) + 1
+        threshold = max(2, math.ceil(len(grams) * 0.6))
+        matches = [rank for rank, score in scores.items() if score >= threshold]
+        matches.sort(key=lambda rank: (-scores[rank], rank))
+        return matches[:limit]
+
+
+class UniversityNameIndex:
+    def __init__(self) -> None:
+        self._snapshot = _Snapshot([])
+
+    def __len__(self) -> int:
+        return len(self._snapshot.entries)
+
+    def load(self, entries: Iterable[SuggestEntry]) -> None:
+        # Build off to the side and swap the reference so readers never see a partial index.
+        self._snapshot = _Snapshot(entries)
+
+    def suggest(self, query: str, limit: int = 10) -> list[dict[str, Any]]:
+        return [asdict(entry) for entry in self._snapshot.suggest(query, limit)]
+
+    async def refresh(self, prefer_snapshot: bool = False) -> int:
+        """Rebuild from the Scorecard mirror, the API or the JSON snapshot file.
+
+        With ``prefer_snapshot`` an existing snapshot is used as-is (fast startup);
+        otherwise the API is crawled and the snapshot rewritten for the next start.
+        """
+        entries = await _load_entries(prefer_snapshot)
+        self.load(entries)
+        logger.info("University suggest index loaded with %s schools", len(self))
+        return len(self)
+
+
+SUGGEST_FIELDS = ("unit_id", "name", "city", "state", "size")
+
+
+async def _load_entries(prefer_snapshot: bool = False) -> list[SuggestEntry]:
+    if settings.college_scorecard_backend.strip().lower() == "local":
+        from app.db.session import AsyncSessionLocal
+        from app.models.scorecard import ScorecardSchool
+
+        stmt = select(
+            ScorecardSchool.id,
+            ScorecardSchool.name,
+            ScorecardSchool.city,
+            ScorecardSchool.state,
+            ScorecardSchool.student_size,
+        ).where(ScorecardSchool.name.is_not(None))
+        async with AsyncSessionLocal() as session:
+            rows = (await session.execute(stmt)).all()
+        return [SuggestEntry(*row) for row in rows]
+
+    path = Path(settings.university_name_snapshot_path or "")
+    has_snapshot = bool(settings.university_name_snapshot_path) and path.exists()
+    if prefer_snapshot and has_snapshot:
+        return _read_snapshot(path)
+    try:
+        records = [
+            record
+            async for record in scorecard_client.iter_schools(
+                fields=SUGGEST_FIELDS, priority=PRIORITY_BACKGROUND
+            )
+        ]
+    except Exception:
+        if not has_snapshot:
+            raise
+        logger.exception("University name crawl failed; using the snapshot file")
+        return _read_snapshot(path)
+    if settings.university_name_snapshot_path:
+        _write_snapshot(path, records)
+    return _entries(records)
+
+
+def _entries(records: Iterable[dict[str, Any]]) -> list[SuggestEntry]:
+    return [
+        SuggestEntry(
+            unit_id=int(record.get("unit_id") or record["id"]),
+            name=record["name"],
+            city=record.get("city"),
+            state=record.get("state"),
+            size=record.get("size"),
+        )
+        for record in records
+        if record.get("name")
+    ]
+
+
+def _read_snapshot(path: Path) -> list[SuggestEntry]:
+    with open(path, encoding="utf-8") as handle:
+        return _entries(json.load(handle))
+
+
+def _write_snapshot(path: Path, records: list[dict[str, Any]]) -> None:
+    # Write beside the target and rename, so a crash never leaves a truncated snapshot.
+    partial = path.with_name(path.name + ".tmp")
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(partial, "w", encoding="utf-8") as handle:
+            json.dump(
+                [{key: record.get(key) for key in SUGGEST_FIELDS} for record in records], handle
+            )
+        partial.replace(path)
+    except OSError:
+        logger.exception("Could not write university name snapshot to %s", path)
+
+
+name_index = UniversityNameIndex()
@@ -0,0 +1,200 @@
+"""Vectorized multi-criteria ranking over an in-memory table of Scorecard schools."""
+
+from __future__ import annotations
+
+import logging
+from dataclasses import dataclass
+from typing import Any, Iterable
+
+import numpy as np
+
+from app.clients.college_scorecard import INCOME_LEVELS, SCHOOL_FIELDS
+from app.clients.college_scorecard import client as scorecard_client
+from app.clients.rate_limit import PRIORITY_BACKGROUND
+
+logger = logging.getLogger(__name__)
+
+# Criterion -> True when larger values are better.
+CRITERIA: dict[str, bool] = {
+    "graduation_rate": True,
+    "average_annual_cost": False,
+    "median_earnings": True,
+    "acceptance_rate": False,
+    "repayment_rate": True,
+    "net_price": False,
+}
+TABLE_FIELDS = (
+    "unit_id",
+    "name",
+    "city",
+    "state",
+    "size",
+    "graduation_rate",
+    "average_annual_cost",
+    "median_earnings",
+    "acceptance_rate",
+    "repayment_rate",
+    "family_income_net_price",
+)
+# The API mapping defaults a missing admission rate to 1.0; ranking needs it as missing.
+ADMISSION_RATE_FIELD = "latest.admissions.admission_rate.overall"
+
+
+def _number(value: Any) -> float:
+    return float(value) if isinstance(value, (int, float)) else np.nan
+
+
+def table_row(record: dict[str, Any]) -> dict[str, Any]:
+    """Map a raw Scorecard record to the keys the ranking table reads."""
+    row = {key: SCHOOL_FIELDS[key][1](record) for key in TABLE_FIELDS}
+    row["acceptance_rate"] = record.get(ADMISSION_RATE_FIELD)
+    return row
+
+
+def _net_price(school: dict[str, Any], level: str) -> float:
+    breakdown = (school.get("family_income_net_price") or {}).get("breakdown") or {}
+    return _number(breakdown.get(level))
+
+
+@dataclass(frozen=True)
+class _Table:
+    unit_ids: np.ndarray
+    names: np.ndarray
+    cities: np.ndarray
+    states: np.ndarray
+    # criterion -> raw values, NaN where the upstream value is missing
+    raw: dict[str, np.ndarray]
+    # criterion -> values scaled to [0, 1] with 1 always "better", NaN where missing
+    scaled: dict[str, np.ndarray]
+
+    def __len__(self) -> int:
+        return len(self.unit_ids)
+
+
+def _scale(values: np.ndarray, higher_is_better: bool) -> np.ndarray:
+    if np.all(np.isnan(values)):
+        return values.copy()
+    low, high = np.nanmin(values), np.nanmax(values)
+    span = high - low
+    scaled = (values - low) / span if span > 0 else np.where(np.isnan(values), np.nan, 1.0)
+    return scaled if higher_is_better else 1.0 - scaled
+
+
+def build_table(schools: Iterable[dict[str, Any]]) -> _Table:
+    rows = [school for school in schools if school.get("unit_id") is not None]
+    raw: dict[str, np.ndarray] = {
+        name: np.array([_number(school.get(name)) for school in rows], dtype=np.float64)
+        for name in CRITERIA
+        if name != "net_price"
+    }
+    # Scorecard reports net price for either public or private institutions; both land here.
+    for level in INCOME_LEVELS:
+        raw[f"net_price:{level}"] = np.array(
+            [_net_price(school, level) for school in rows], dtype=np.float64
+        )
+    scaled = {
+        name: _scale(values, CRITERIA[name.split(":", 1)[0]]) for name, values in raw.items()
+    }
+    return _Table(
+        unit_ids=np.array([school["unit_id"] for school in rows], dtype=np.int64),
+        names=np.array([school.get("name") or "" for school in rows], dtype=object),
+        cities=np.array([school.get("city") for school in rows], dtype=object),
+        states=np.array([school.get("state") or "" for school in rows], dtype=object),
+        raw=raw,
+        scaled=scaled,
+    )
+
+
+class RankingEngine:
+    def __init__(self) -> None:
+        self._table: _Table | None = None
+
+    @property
+    def loaded(self) -> bool:
+        return self._table is not None
+
+    def load(self, schools: Iterable[dict[str, Any]]) -> int:
+        # Build first, then swap, so in-flight rankings keep a consistent table.
+        self._table = build_table(schools)
+        return len(self._table)
+
+    async def refresh(self) -> int:
+        schools = [
+            table_row(record)
+            async for record in scorecard_client.iter_schools(
+                fields=TABLE_FIELDS, priority=PRIORITY_BACKGROUND, raw=True
+            )
+        ]
+        count = self.load(schools)
+        logger.info("University ranking table loaded with %s schools", count)
+        return count
+
+    def rank(
+        self,
+        weights: dict[str, float],
+        *,
+        income_bracket: str | None = None,
+        state: str | None = None,
+        limit: int = 10,
+        missing_penalty: float = 0.5,
+    ) -> list[dict[str, Any]]:
+        """Score every school as the weighted mean of its scaled criteria.
+
+        A missing criterion contributes ``missing_penalty`` (0 = worst, 1 = best) so schools
+        that do not report a value are neither dropped nor rewarded.
+        """
+        table = self._table
+        if table is None:
+            raise RuntimeError("Ranking table is not loaded")
+        unknown = set(weights) - set(CRITERIA)
+        if unknown:
+            raise ValueError(f"Unknown criteria: {', '.join(sorted(unknown))}")
+        if weights.get("net_price", 0) > 0 and income_bracket not in INCOME_LEVELS:
+            raise ValueError(
+                f"net_price needs income_bracket, one of: {', '.join(INCOME_LEVELS)}"
+            )
+
+        columns: list[str] = []
+        column_weights: list[float] = []
+        for name, weight in weights.items():
+            if weight <= 0:
+                continue
+            columns.append(f"net_price:{income_bracket}" if name == "net_price" else name)
+            column_weights.append(weight)
+        if not columns:
+            raise ValueError("At least one criterion needs a positive weight")
+
+        matrix = np.vstack([table.scaled[column] for column in columns])
+        matrix = np.where(np.isnan(matrix), missing_penalty, matrix)
+        weight_vector = np.asarray(column_weights, dtype=np.float64)
+        scores = weight_vector @ matrix / weight_vector.sum()
+
+        candidates = np.arange(len(table))
+        if state:
+            candidates = candidates[table.states == state.strip().upper()]
+        if candidates.size == 0:
+            return []
+        limit = min(limit, candidates.size)
+        candidate_scores = scores[candidates]
+        top = np.argpartition(-candidate_scores, limit - 1)[:limit]
+        order = candidates[top[np.argsort(-candidate_scores[top], kind="stable")]]
+
+        return [
+            {
+                "unit_id": int(table.unit_ids[index]),
+                "name": table.names[index],
+                "city": table.cities[index],
+                "state": table.states[index],
+                "score": round(float(scores[index]), 6),
+                "criteria": {
+                    column.split(":", 1)[0]: (
+                        None if np.isnan(value := table.raw[column][index]) else float(value)
+                    )
+                    for column in columns
+                },
+            }
+            for index in order
+        ]
+
+
+ranking_engine = RankingEngine()
@@ -7,7 +7,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.user import User, UserRole
 from app.schemas.auth import RegisterRequest
-from app.security.auth import hash_password, verify_password
+from app.security.auth import forget_user, hash_password, verify_and_update_password
 
 logger = logging.getLogger(__name__)
 
@@ -35,7 +35,7 @@ async def register_user(db: AsyncSession, payload: RegisterRequest) -> User:
         last_name=payload.last_name,
         phone_number=payload.phone_number,
         role=role_value or UserRole.CUSTOMER.value,
-        password_hash=hash_password(payload.password),
+        password_hash=await hash_password(payload.password),
     )
     db.add(user)
     try:
@@ -58,9 +58,15 @@ async def register_user(db: AsyncSession, payload: RegisterRequest) -> User:
 
 async def authenticate_user(db: AsyncSession, email: str, password: str) -> User:
     user = await get_user_by_email(db, email.lower())
-    if not user or not verify_password(password, user.password_hash):
+    if not user:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid credentials")
+    valid, new_hash = await verify_and_update_password(password, user.password_hash)
+    if not valid:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid credentials")
 
+    if new_hash:
+        # Stored with outdated hashing parameters; upgrade while the password is at hand.
+        user.password_hash = new_hash
     user.last_login_at = func.now()
     try:
         await db.commit()
@@ -71,4 +77,5 @@ async def authenticate_user(db: AsyncSession, email: str, password: str) -> User
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Database error"
         ) from exc
+    forget_user(user.email)
     return user
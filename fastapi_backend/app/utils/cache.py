@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Hashable
+
+FRESH = "fresh"
+STALE = "stale"
+
+
+@dataclass
+class _Entry:
+    value: Any
+    fresh_until: float
+    stale_until: float
+
+
+class TTLCache:
+    """Size-bounded LRU cache with per-entry TTL and an optional stale window.
+
+    Entries are ``fresh`` for ``ttl`` seconds and then ``stale`` for a further
+    ``stale_ttl`` seconds, during which callers may serve them while refreshing.
+    Expired entries are only dropped by LRU eviction, so ``peek`` can still return
+    the last known value when the source is unavailable.
+    """
+
+    def __init__(self, maxsize: int, ttl: float, stale_ttl: float = 0.0) -> None:
+        self.maxsize = max(0, maxsize)
+        self.ttl = ttl
+        self.stale_ttl = stale_ttl
+        self._data: OrderedDict[Hashable, _Entry] = OrderedDict()
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def lookup(self, key: Hashable) -> tuple[Any, str | None]:
+        """Return ``(value, state)`` where state is ``fresh``, ``stale`` or ``None``."""
+        entry = self._data.get(key)
+        now = time.monotonic()
+        if entry is None or now >= entry.stale_until:
+            # Expired entries stay until LRU eviction so ``peek`` can serve them as a fallback.
+            self.misses += 1
+            return None, None
+        self._data.move_to_end(key)
+        if now < entry.fresh_until:
+            self.hits += 1
+            return entry.value, FRESH
+        self.stale_hits += 1
+        return entry.value, STALE
+
+    def peek(self, key: Hashable) -> tuple[Any, bool]:
+        """Return ``(value, found)`` for any retained entry, however old."""
+        entry = self._data.get(key)
+        if entry is None:
+            return None, False
+        return entry.value, True
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        value, state = self.lookup(key)
+        return default if state != FRESH else value
+
+    def set(self, key: Hashable, value: Any, ttl: float | None = None) -> None:
+        if self.maxsize == 0:
+            return
+        now = time.monotonic()
+        fresh_until = now + (self.ttl if ttl is None else ttl)
+        self._data[key] = _Entry(value, fresh_until, fresh_until + self.stale_ttl)
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+            self.evictions += 1
+
+    def invalidate(self, key: Hashable) -> None:
+        self._data.pop(key, None)
+
+    def clear(self) -> None:
+        self._data.clear()
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "size": len(self._data),
+            "maxsize": self.maxsize,
+            "hits": self.hits,
+            "stale_hits": self.stale_hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
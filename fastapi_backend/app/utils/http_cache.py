@@ -0,0 +1,153 @@
+from __future__ import annotations
+
+import gzip
+import hashlib
+import json
+from dataclasses import dataclass
+from typing import Any
+
+from fastapi import Request, Response
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+DEFAULT_CACHE_CONTROL = "public, max-age=300"
+# Per-user data: the browser may keep a copy but must revalidate it on every use.
+PRIVATE_REVALIDATE = "private, no-cache"
+
+
+@dataclass(frozen=True)
+class EncodedBody:
+    """A JSON response body serialized once, with its gzip form and ETag."""
+
+    body: bytes
+    gzipped: bytes
+    etag: str
+
+    @classmethod
+    def encode(cls, payload: Any) -> EncodedBody:
+        body = json.dumps(payload, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+        # Weak ETag: the identity and gzip encodings share it.
+        etag = f'W/"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+        return cls(body=body, gzipped=gzip.compress(body, compresslevel=6, mtime=0), etag=etag)
+
+
+def etag_matches(request: Request, etag: str) -> bool:
+    """Weak If-None-Match comparison (RFC 9110 section 13.1.2)."""
+    header = request.headers.get("if-none-match")
+    return bool(header) and _tag_in(header, etag)
+
+
+def encoded_response(
+    request: Request, encoded: EncodedBody, cache_control: str = DEFAULT_CACHE_CONTROL
+) -> Response:
+    """Serve a pre-encoded body: 304 on a matching ETag, gzip when the client accepts it."""
+    headers = {"ETag": encoded.etag, "Cache-Control": cache_control, "Vary": "Accept-Encoding"}
+    if etag_matches(request, encoded.etag):
+        return Response(status_code=304, headers=headers)
+    if "gzip" in request.headers.get("accept-encoding", "").lower():
+        headers["Content-Encoding"] = "gzip"
+        return Response(encoded.gzipped, media_type="application/json", headers=headers)
+    return Response(encoded.body, media_type="application/json", headers=headers)
+
+
+def version_etag(*parts: Any) -> str:
+    """Strong ETag derived from version stamps (ids, ``updated_at``, catalog hashes, ...).
+
+    The parts must identify both the resource and its version, so the tag can be
+    computed and compared before the body is loaded or serialized.
+    """
+    raw = json.dumps(parts, default=str, separators=(",", ":")).encode("utf-8")
+    return f'"{hashlib.blake2b(raw, digest_size=16).hexdigest()}"'
+
+
+def not_modified(
+    request: Request,
+    response: Response,
+    etag: str,
+    cache_control: str = PRIVATE_REVALIDATE,
+) -> Response | None:
+    """A 304 when the client already holds ``etag``; otherwise tag ``response`` and return None.
+
+    Call it right after computing the version stamp and return the 304 as-is, so the
+    expensive service calls are skipped for unchanged resources.
+    """
+    headers = {"ETag": etag, "Cache-Control": cache_control}
+    if etag_matches(request, etag):
+        return Response(status_code=304, headers=headers)
+    response.headers.update(headers)
+    return None
+
+
+class ConditionalGetMiddleware:
+    """ETag/If-None-Match handling for GET responses that do not compute their own tag.
+
+    JSON bodies of up to ``max_body`` bytes are hashed into a strong ETag and replaced by
+    a 304 when the client already has them. That saves bandwidth, not server work; routes
+    with a cheap version stamp should answer early with ``not_modified`` instead. Responses
+    that already carry an ETag, are not 200, are encoded or are streamed beyond
+    ``max_body`` pass through unchanged.
+    """
+
+    def __init__(self, app: ASGIApp, max_body: int = 1024 * 1024) -> None:
+        self.app = app
+        self.max_body = max_body
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["method"] != "GET":
+            await self.app(scope, receive, send)
+            return
+        if_none_match = Headers(scope=scope).get("if-none-match")
+        start: Message | None = None
+        chunks: list[bytes] = []
+        size = 0
+        passthrough = False
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal start, size, passthrough
+            if passthrough:
+                await send(message)
+                return
+            if message["type"] == "http.response.start":
+                headers = Headers(raw=message["headers"])
+                if (
+                    message["status"] != 200
+                    or "etag" in headers
+                    or "content-encoding" in headers
+                    or not headers.get("content-type", "").startswith("application/json")
+                ):
+                    passthrough = True
+                    await send(message)
+                else:
+                    start = message
+                return
+            chunks.append(message.get("body", b""))
+            size += len(chunks[-1])
+            if message.get("more_body", False):
+                if size > self.max_body:
+                    # Too large to buffer: send what we have and stream the rest.
+                    passthrough = True
+                    await send(start)  # type: ignore[arg-type]
+                    await send(
+                        {"type": "http.response.body", "body": b"".join(chunks), "more_body": True}
+                    )
+                return
+            body = b"".join(chunks)
+            etag = f'"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+            headers = MutableHeaders(raw=start["headers"])  # type: ignore[index]
+            headers["ETag"] = etag
+            headers.setdefault("Cache-Control", "no-cache")
+            if if_none_match and _tag_in(if_none_match, etag):
+                del headers["content-length"]
+                del headers["content-type"]
+                await send({**start, "status": 304})  # type: ignore[dict-item]
+                await send({"type": "http.response.body", "body": b""})
+                return
+            await send(start)  # type: ignore[arg-type]
+            await send({"type": "http.response.body", "body": body})
+
+        await self.app(scope, receive, send_wrapper)
+
+
+def _tag_in(header: str, etag: str) -> bool:
+    tags = {tag.strip().removeprefix("W/") for tag in header.split(",")}
+    return "*" in tags or etag.removeprefix("W/") in tags
@@ -0,0 +1,27 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections.abc import Awaitable, Callable
+
+logger = logging.getLogger(__name__)
+
+
+async def run_periodically(
+    name: str,
+    refresh: Callable[[], Awaitable[object]],
+    interval: float,
+    first: Callable[[], Awaitable[object]] | None = None,
+) -> None:
+    """Call ``first`` (or ``refresh``) now and ``refresh`` every ``interval`` seconds after.
+
+    Failures are logged and retried at the next tick, so the task only ends when cancelled.
+    """
+    load = first or refresh
+    while True:
+        try:
+            await load()
+        except Exception:  # noqa: BLE001 - keep serving the last good version
+            logger.exception("%s refresh failed", name)
+        load = refresh
+        await asyncio.sleep(interval)
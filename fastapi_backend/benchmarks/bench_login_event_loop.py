@@ -0,0 +1,88 @@
+"""Event-loop latency during a login storm: inline password hashing vs. the hashing pool.
+
+Usage (from fastapi_backend/)::
+
+    python -m benchmarks.bench_login_event_loop --logins 200 --concurrency 50
+
+A probe task sleeps 1 ms in a loop and records how late each wake-up is; that lateness
+is what every other in-flight request experiences while logins are being verified. No
+database is needed: each simulated login is only the password verification.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import statistics
+import time
+
+from passlib.context import CryptContext
+
+from app.security.hashing import HashingPool
+
+PROBE_INTERVAL = 0.001
+
+
+async def _probe(lags: list[float], stop: asyncio.Event) -> None:
+    while not stop.is_set():
+        expected = time.perf_counter() + PROBE_INTERVAL
+        await asyncio.sleep(PROBE_INTERVAL)
+        lags.append(max(0.0, time.perf_counter() - expected))
+
+
+async def _storm(login, logins: int, concurrency: int) -> tuple[list[float], float]:
+    lags: list[float] = []
+    stop = asyncio.Event()
+    probe = asyncio.create_task(_probe(lags, stop))
+    gate = asyncio.Semaphore(concurrency)
+
+    async def one() -> None:
+        async with gate:
+            await login()
+
+    started = time.perf_counter()
+    await asyncio.gather(*(one() for _ in range(logins)))
+    elapsed = time.perf_counter() - started
+    stop.set()
+    await probe
+    return lags, elapsed
+
+
+def _row(label: str, lags: list[float], elapsed: float, logins: int) -> str:
+    ordered = sorted(lags) or [0.0]
+    p99 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.99))]
+    return (
+        f"{label:>8} {statistics.median(ordered) * 1000:>9.2f} {p99 * 1000:>9.2f} "
+        f"{ordered[-1] * 1000:>9.2f} {logins / elapsed:>10.1f}"
+    )
+
+
+async def main(logins: int, concurrency: int, rounds: int, workers: int) -> None:
+    context = CryptContext(schemes=["pbkdf2_sha256"], pbkdf2_sha256__rounds=rounds)
+    stored = context.hash("correct horse battery staple")
+    pool = HashingPool(workers, max_pending=logins)
+
+    async def inline() -> None:
+        # The previous behaviour: verification runs on the event loop thread.
+        context.verify("correct horse battery staple", stored)
+        await asyncio.sleep(0)
+
+    async def pooled() -> None:
+        await pool.run(context.verify, "correct horse battery staple", stored)
+
+    print(f"{'mode':>8} {'p50 (ms)':>9} {'p99 (ms)':>9} {'max (ms)':>9} {'logins/s':>10}")
+    for label, login in (("inline", inline), ("pool", pooled)):
+        lags, elapsed = await _storm(login, logins, concurrency)
+        print(_row(label, lags, elapsed, logins))
+    print(f"pool stats: {pool.stats()}")
+    pool.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--logins", type=int, default=200, help="Logins per run")
+    parser.add_argument("--concurrency", type=int, default=50, help="Logins in flight at once")
+    parser.add_argument("--rounds", type=int, default=29000, help="PBKDF2 rounds")
+    parser.add_argument("--workers", type=int, default=4, help="Hashing pool threads")
+    args = parser.parse_args()
+    asyncio.run(main(args.logins, args.concurrency, args.rounds, args.workers))
@@ -0,0 +1,103 @@
+"""Compare ORM add() vs. bulk insert for persisting plan courses.
+
+Usage (from fastapi_backend/)::
+
+    python -m benchmarks.bench_persist_courses --url postgresql+asyncpg://...
+
+Every run happens inside a transaction that is rolled back, so the target database is left
+untouched. Defaults to the configured DATABASE_URL.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import time
+
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from app.db.base import Base
+from app.models.education_plan import EducationPlan, ProgramCourse
+from app.models.user import User
+from app.schemas.education import ProgramCoursePayload
+from app.services.education_plan_service import _course_row, _persist_courses
+
+SIZES = (50, 500, 5000)
+
+
+def _courses(count: int) -> list[ProgramCoursePayload]:
+    return [
+        ProgramCoursePayload(
+            program="Computer Science",
+            university="Benchmark University",
+            year=f"Year {index // 10 + 1}",
+            semester="Fall" if index % 2 else "Spring",
+            code=f"CSCI {1000 + index}",
+            courseName=f"Course {index}",
+            credits=3,
+            prerequisite="None",
+            corequisite="None",
+            schedule={"day": "Mon, Wed", "time": "9:00 AM - 10:15 AM"},
+        )
+        for index in range(count)
+    ]
+
+
+async def _orm_add(db: AsyncSession, plan: EducationPlan, courses) -> None:
+    # The previous implementation: one ORM object per course, flushed row by row.
+    for entry in courses:
+        db.add(ProgramCourse(**_course_row(plan.id, entry)))
+    await db.flush()
+
+
+async def _bulk_insert(db: AsyncSession, plan: EducationPlan, courses) -> None:
+    await _persist_courses(db, plan, courses)
+
+
+async def _time(engine, strategy, courses, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        async with engine.connect() as conn:
+            transaction = await conn.begin()
+            async with AsyncSession(bind=conn, expire_on_commit=False) as db:
+                user = User(email="bench@example.com", password_hash="x")
+                db.add(user)
+                await db.flush()
+                plan = EducationPlan(
+                    user_id=user.id, program_name="CS", university_name="Bench", payload={}
+                )
+                db.add(plan)
+                await db.flush()
+                started = time.perf_counter()
+                await strategy(db, plan, courses)
+                best = min(best, time.perf_counter() - started)
+            await transaction.rollback()
+    return best
+
+
+async def main(url: str, repeat: int) -> None:
+    engine = create_async_engine(url)
+    async with engine.begin() as conn:
+        await conn.run_sync(
+            Base.metadata.create_all,
+            tables=[User.__table__, EducationPlan.__table__, ProgramCourse.__table__],
+        )
+    print(f"{'courses':>8} {'orm add (ms)':>14} {'bulk insert (ms)':>18} {'speedup':>8}")
+    for size in SIZES:
+        courses = _courses(size)
+        orm = await _time(engine, _orm_add, courses, repeat)
+        bulk = await _time(engine, _bulk_insert, courses, repeat)
+        print(f"{size:>8} {orm * 1000:>14.1f} {bulk * 1000:>18.1f} {orm / bulk:>7.1f}x")
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--url", default=None, help="Async SQLAlchemy URL (default: DATABASE_URL)")
+    parser.add_argument("--repeat", type=int, default=5, help="Runs per size; best is reported")
+    args = parser.parse_args()
+    if args.url is None:
+        from app.core.config import settings
+
+        args.url = settings.database_url
+    asyncio.run(main(args.url, args.repeat))
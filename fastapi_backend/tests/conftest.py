@@ -0,0 +1,18 @@
+import os
+from pathlib import Path
+
+import pytest
+
+# Settings are read at import time; give the required ones harmless values for tests.
+os.environ.setdefault("DATABASE_URL", "sqlite+aiosqlite:///:memory:")
+os.environ.setdefault("JWT_SECRET", "test-secret")
+os.environ.setdefault("COLLEGE_SCORECARD_API_KEY", "test-key")
+os.environ.setdefault("DEFAULT_ADMIN_EMAIL", "admin@example.com")
+os.environ.setdefault("DEFAULT_ADMIN_PASSWORD", "admin-password")
+
+FIXTURES = Path(__file__).parent / "fixtures"
+
+
+@pytest.fixture
+def scorecard_csv() -> Path:
+    return FIXTURES / "scorecard_sample.csv"
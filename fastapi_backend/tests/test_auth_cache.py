@@ -0,0 +1,28 @@
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+import app.models  # noqa: F401 - configure every mapper the User relationships need
+from app.models.user import User
+from app.security import auth
+
+
+async def test_user_cache_is_cleared_on_commit_not_on_flush():
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.begin() as connection:
+        await connection.run_sync(User.metadata.create_all, tables=[User.__table__])
+    sessions = async_sessionmaker(engine, expire_on_commit=False)
+    async with sessions() as session:
+        user = User(email="student@example.com", password_hash="x")
+        session.add(user)
+        await session.commit()
+    cached = auth._user_state(user)
+
+    async with sessions() as session:
+        user = await session.get(User, user.id)
+        user.is_deactivated = True
+        await session.flush()
+        # A concurrent request still sees the committed row and caches it meanwhile.
+        auth._user_cache.set("student@example.com", cached)
+        await session.commit()
+
+    assert auth._user_cache.get("student@example.com") is None
+    await engine.dispose()
@@ -0,0 +1,66 @@
+import random
+
+import pytest
+
+from app.services.course_graph import PlanGraph, PlannedCourse
+
+CODES = [f"AAA {1000 + step}" for step in range(6)]
+
+
+def _course(code: str, *prerequisites: str, term: int | None = None) -> PlannedCourse:
+    return PlannedCourse(
+        code=code,
+        term=term,
+        credits=3,
+        prerequisites=tuple((prerequisite,) for prerequisite in prerequisites),
+        corequisites=(),
+    )
+
+
+def _fresh(courses: dict[str, PlannedCourse]) -> dict:
+    graph = PlanGraph()
+    graph.apply(courses)
+    return graph.report()
+
+
+def _comparable(report: dict) -> dict:
+    # Which edge of a cycle gets rejected depends on insertion order; the rest must agree.
+    summary = {key: sorted(map(repr, report[key])) for key in ("violations", "unmet")}
+    summary["valid"] = report["valid"]
+    summary["cyclic"] = bool(report["cycles"])
+    if not report["cycles"]:
+        summary["critical_path"] = len(report["critical_path"])
+        summary["min_semesters"] = report["min_semesters"]
+    return summary
+
+
+@pytest.mark.parametrize(("fixed", "other"), [("AAA 1000", "BBB 1000"), ("BBB 1000", "AAA 1000")])
+def test_fixing_a_cycle_by_editing_a_requirement_restores_the_edge(fixed, other):
+    graph = PlanGraph()
+    graph.apply({fixed: _course(fixed, other), other: _course(other, fixed)})
+    assert graph.report()["cycles"]
+
+    # Whichever edge was accepted first, dropping one requirement must clear the cycle.
+    graph.apply({fixed: _course(fixed), other: _course(other, fixed)})
+    report = graph.report()
+
+    assert report["cycles"] == []
+    assert report["valid"] is True
+    assert report["critical_path"] == [fixed, other]
+    assert report["min_semesters"] == 2
+
+
+def test_incremental_reports_match_fresh_checks():
+    rng = random.Random(17)
+    graph = PlanGraph()
+    courses: dict[str, PlannedCourse] = {}
+    for _ in range(400):
+        code = rng.choice(CODES)
+        if code in courses and rng.random() < 0.2:
+            del courses[code]
+        else:
+            prerequisites = rng.sample(CODES, rng.randint(0, 2))
+            courses[code] = _course(code, *prerequisites, term=rng.choice([None, 1, 2, 3]))
+        graph.apply(dict(courses))
+
+        assert _comparable(graph.report()) == _comparable(_fresh(courses))
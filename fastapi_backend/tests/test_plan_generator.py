@@ -0,0 +1,54 @@
+from app.services import plan_generator
+from app.services.plan_generator import generate_plan
+
+
+def _program(*courses):
+    semester = {"semester": "Fall", "courses": [dict(course) for course in courses]}
+    return {"program": "Test", "university": "Test U", "years": [{"semesters": [semester]}]}
+
+
+def _generate(monkeypatch, *courses, **options):
+    monkeypatch.setattr(plan_generator, "find_program", lambda *args: _program(*courses))
+    return generate_plan("Test", "Test U", time_budget=1.0, **options)
+
+
+def _terms(plan):
+    return {course["code"]: course["semester"] for course in plan.program}
+
+
+def test_or_clause_naming_a_dropped_course_uses_the_other_option(monkeypatch):
+    plan = _generate(
+        monkeypatch,
+        {"code": "BIG 1000", "credits": "20"},
+        {"code": "SMA 1000", "credits": "3"},
+        {"code": "NXT 2000", "credits": "3", "prerequisite": "BIG 1000 or SMA 1000"},
+    )
+
+    assert _terms(plan) == {"SMA 1000": "Fall", "NXT 2000": "Spring"}
+    assert plan.unscheduled == ["BIG 1000"]
+    assert plan.optimal is False
+
+
+def test_requirement_only_met_by_a_dropped_course_is_unscheduled(monkeypatch):
+    plan = _generate(
+        monkeypatch,
+        {"code": "BIG 1000", "credits": "20"},
+        {"code": "LAB 1000", "credits": "1", "corequisite": "BIG 1000"},
+        {"code": "NXT 2000", "credits": "3", "prerequisite": "LAB 1000"},
+    )
+
+    assert plan.program == []
+    assert plan.unscheduled == ["BIG 1000", "LAB 1000", "NXT 2000"]
+    assert plan.optimal is False
+
+
+def test_complete_plan_at_the_lower_bound_is_optimal(monkeypatch):
+    plan = _generate(
+        monkeypatch,
+        {"code": "AAA 1000", "credits": "3"},
+        {"code": "AAA 2000", "credits": "3", "prerequisite": "AAA 1000"},
+    )
+
+    assert plan.semesters == 2
+    assert plan.unscheduled == []
+    assert plan.optimal is True
@@ -0,0 +1,60 @@
+import os
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+import app.models  # noqa: F401 - configure every mapper the plan relationships need
+from app.db.base import Base
+from app.models.education_plan import EducationPlan, ProgramCourse
+from app.models.user import User
+from app.schemas.education import EducationPlanListQuery
+from app.services.education_plan_service import list_plan_summaries, list_plans, plan_payload
+
+POSTGRES_URL = os.environ.get("TEST_DATABASE_URL", "")
+TABLES = [User.__table__, EducationPlan.__table__, ProgramCourse.__table__]
+
+
+@pytest.mark.skipif(
+    not POSTGRES_URL.startswith("postgresql+asyncpg"),
+    reason="set TEST_DATABASE_URL=postgresql+asyncpg://... to run the plan listing test",
+)
+async def test_summaries_fill_in_the_legacy_payload_degree():
+    engine = create_async_engine(POSTGRES_URL)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all, tables=TABLES)
+        await conn.run_sync(Base.metadata.create_all, tables=TABLES)
+    try:
+        async with AsyncSession(engine, expire_on_commit=False) as db:
+            user = User(email="student@example.com", password_hash="x")
+            db.add(user)
+            await db.flush()
+            db.add_all(
+                [
+                    EducationPlan(
+                        user_id=user.id,
+                        program_name="Biology",
+                        university_name="Test U",
+                        payload={"program": [], "degree": "BS"},
+                    ),
+                    EducationPlan(
+                        user_id=user.id,
+                        program_name="History",
+                        university_name="Test U",
+                        degree="BA",
+                        payload={"program": []},
+                    ),
+                ]
+            )
+            await db.commit()
+
+            query = EducationPlanListQuery(email="student@example.com")
+            summaries, _ = await list_plan_summaries(db, query)
+            plans, _ = await list_plans(db, query)
+
+        by_program = {summary["program"]: summary["degree"] for summary in summaries}
+        assert by_program == {"Biology": "BS", "History": "BA"}
+        assert sorted(plan_payload(plan)["degree"] for plan in plans) == ["BA", "BS"]
+    finally:
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.drop_all, tables=TABLES)
+        await engine.dispose()
@@ -0,0 +1,37 @@
+import json
+import os
+
+import httpx
+
+from app.core.config import settings
+from app.main import create_application
+from app.services.program_catalog import program_catalog
+
+
+def _write_catalog(path, code, mtime):
+    semester = {"semester": "Fall", "courses": [{"code": code, "credits": "3"}]}
+    entry = {"program": "Test", "university": "Test U", "years": [{"semesters": [semester]}]}
+    path.write_text(json.dumps([entry]))
+    os.utime(path, (mtime, mtime))
+
+
+async def test_generated_plans_follow_catalog_reloads(monkeypatch, tmp_path):
+    path = tmp_path / "catalog.json"
+    _write_catalog(path, "AAA 1000", 1_000_000)
+    monkeypatch.setattr(program_catalog, "paths", [path])
+    monkeypatch.setattr(program_catalog, "_snapshot", None)
+    monkeypatch.setattr(program_catalog, "_mtimes", None)
+    monkeypatch.setattr(settings, "catalog_reload_interval", 0)
+    transport = httpx.ASGITransport(app=create_application())
+
+    async def generate():
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            response = await client.post(
+                "/api/users/education-plan/generate",
+                json={"program": "Test", "university": "Test U"},
+            )
+        return [course["code"] for course in response.json()["data"]["program"]]
+
+    assert await generate() == ["AAA 1000"]
+    _write_catalog(path, "BBB 1000", 2_000_000)
+    assert await generate() == ["BBB 1000"]
@@ -0,0 +1,61 @@
+import pytest
+
+from app.schemas.education import ProgramCoursePayload
+from app.services.schedule_conflicts import parse_days, plan_conflicts
+
+
+@pytest.mark.parametrize(
+    ("text", "days"),
+    [
+        ("Mon, Wed", (0, 2)),
+        ("Tuesday, Thursday", (1, 3)),
+        ("Mon-Fri", (0, 1, 2, 3, 4)),
+        ("Mon - Fri", (0, 1, 2, 3, 4)),
+        ("M-F", (0, 1, 2, 3, 4)),
+        ("MWF", (0, 2, 4)),
+        ("TR", (1, 3)),
+        ("TTh", (1, 3)),
+        ("TBD", ()),
+        ("Online", ()),
+    ],
+)
+def test_parse_days(text, days):
+    assert parse_days(text) == days
+
+
+def _course(code, schedule):
+    return ProgramCoursePayload(year="First Year", semester="Fall", code=code, schedule=schedule)
+
+
+def test_compact_days_overlap_with_spelled_out_days():
+    conflicts = plan_conflicts(
+        [
+            _course("AAA 1000", {"day": "MWF", "time": "9:00 AM - 9:50 AM"}),
+            _course("BBB 1000", {"day": "Mon - Fri", "time": "9:30 AM - 10:20 AM"}),
+        ]
+    )
+
+    assert len(conflicts) == 1
+    assert conflicts[0]["items"] == ["AAA 1000", "BBB 1000"]
+    assert [overlap["day"] for overlap in conflicts[0]["overlaps"]] == ["Mon", "Wed", "Fri"]
+
+
+@pytest.mark.parametrize("day", [5, ["Mon"], {"name": "Mon"}, 1.5])
+def test_non_string_schedule_values_do_not_raise(day):
+    courses = [
+        _course("AAA 1000", {"day": day, "time": "9:00 AM - 10:00 AM"}),
+        _course("BBB 1000", {"day": "Mon", "time": 900}),
+    ]
+
+    assert isinstance(plan_conflicts(courses), list)
+
+
+def test_list_of_days_is_read_as_a_day_list():
+    conflicts = plan_conflicts(
+        [
+            _course("AAA 1000", {"day": ["Mon", "Wed"], "time": "9:00 AM - 10:00 AM"}),
+            _course("BBB 1000", {"day": "Wed", "time": "9:30 AM - 10:30 AM"}),
+        ]
+    )
+
+    assert [overlap["day"] for overlap in conflicts[0]["overlaps"]] == ["Wed"]
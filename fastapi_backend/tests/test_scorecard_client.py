@@ -0,0 +1,146 @@
+import httpx
+import pytest
+
+from app.clients.college_scorecard import CollegeScorecardClient
+from app.clients.rate_limit import PRIORITY_BACKGROUND, RateLimitError, TokenBucket
+from app.core.config import settings
+
+BASE_URL = "https://scorecard.test/v1"
+RECORD = {"id": 100654, "school.name": "Alabama A & M University", "school.state": "AL"}
+
+
+def _client(monkeypatch, handler) -> CollegeScorecardClient:
+    monkeypatch.setattr(settings, "college_scorecard_backend", "api")
+    monkeypatch.setattr(settings, "college_scorecard_backoff_base", 0.0)
+    monkeypatch.setattr(settings, "college_scorecard_backoff_max", 0.0)
+    client = CollegeScorecardClient(base_url=BASE_URL, api_key="test-key")
+    client._http = httpx.AsyncClient(transport=httpx.MockTransport(handler), base_url=BASE_URL)
+    return client
+
+
+def _page(*records, total=None, headers=None) -> httpx.Response:
+    metadata = {"total": len(records) if total is None else total}
+    payload = {"results": list(records), "metadata": metadata}
+    return httpx.Response(200, json=payload, headers=headers)
+
+
+async def test_429_is_retried_after_the_advertised_delay(monkeypatch):
+    calls = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        if len(calls) == 1:
+            return httpx.Response(429, headers={"Retry-After": "0"})
+        return _page(RECORD)
+
+    client = _client(monkeypatch, handler)
+    school = await client.get_school("100654", fields=("unit_id", "name"))
+
+    assert school == {"unit_id": 100654, "name": "Alabama A & M University"}
+    assert calls[0].url.params["api_key"] == "test-key"
+    assert calls[0].url.params["id"] == "100654"
+    assert client.stats()["retried"] == 1
+    assert client.stats()["throttled"] == 1
+    await client.close()
+
+
+async def test_persistent_5xx_gives_up_after_max_retries(monkeypatch):
+    calls = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        return httpx.Response(502)
+
+    monkeypatch.setattr(settings, "college_scorecard_max_retries", 2)
+    client = _client(monkeypatch, handler)
+
+    with pytest.raises(httpx.HTTPStatusError):
+        await client.get_school("100654")
+    assert len(calls) == 3
+    assert client.stats()["retried"] == 2
+    await client.close()
+
+
+async def test_low_remaining_quota_slows_the_limiter(monkeypatch):
+    def handler(request: httpx.Request) -> httpx.Response:
+        return _page(RECORD, headers={"X-RateLimit-Remaining": "5", "X-RateLimit-Limit": "1000"})
+
+    client = _client(monkeypatch, handler)
+    await client.get_school("100654")
+
+    assert client._limiter.rate == pytest.approx(5 / 3600)
+    assert client._limiter.rate < client._limiter.base_rate
+    await client.close()
+
+
+async def test_exhausted_quota_fails_fast_on_the_request_path(monkeypatch):
+    calls = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        return _page(RECORD)
+
+    monkeypatch.setattr(settings, "college_scorecard_max_queue_wait", 0.05)
+    client = _client(monkeypatch, handler)
+    client._limiter = TokenBucket(rate_per_hour=1, burst=1)
+    await client.get_school("100654")
+
+    with pytest.raises(RateLimitError) as exc_info:
+        await client.get_school("100655")
+    assert exc_info.value.retry_after > 1
+    assert len(calls) == 1
+    assert client.stats()["rate_limit_rejected"] == 1
+    # The local quota wait says nothing about upstream health.
+    assert client.stats()["breaker_state"] == "closed"
+    await client.close()
+
+
+async def test_token_bucket_max_wait():
+    bucket = TokenBucket(rate_per_hour=3600, burst=1)
+    await bucket.acquire()
+
+    with pytest.raises(RateLimitError):
+        await bucket.acquire(max_wait=0.1)
+    assert bucket._waiters == []
+
+    # Without a bound the caller waits for the next token (one per second here).
+    bucket.rate = 100.0
+    await bucket.acquire(PRIORITY_BACKGROUND)
+    assert bucket.throttled == 1
+
+
+def _expired(client: CollegeScorecardClient, *unit_ids: str) -> None:
+    client._cache.stale_ttl = 0
+    for unit_id in unit_ids:
+        client._cache.set(("school", unit_id, None), {"unit_id": int(unit_id)}, ttl=-1)
+
+
+async def test_exhausted_429_serves_the_last_known_value(monkeypatch):
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(429, headers={"Retry-After": "0"})
+
+    monkeypatch.setattr(settings, "college_scorecard_max_retries", 1)
+    client = _client(monkeypatch, handler)
+    _expired(client, "100654")
+
+    assert await client.get_school("100654") == {"unit_id": 100654, "stale": True}
+    await client.close()
+
+
+async def test_exhausted_429_on_a_batch_does_not_fan_out(monkeypatch):
+    calls = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        return httpx.Response(429, headers={"Retry-After": "0"})
+
+    monkeypatch.setattr(settings, "college_scorecard_max_retries", 1)
+    client = _client(monkeypatch, handler)
+    _expired(client, "100654", "100663")
+
+    result = await client.get_schools(["100654", "100663"])
+
+    assert result["stale"] is True
+    assert [school["unit_id"] for school in result["results"]] == [100654, 100663]
+    assert len(calls) == 2
+    await client.close()
@@ -0,0 +1,148 @@
+import csv
+import os
+from pathlib import Path
+
+import pytest
+from sqlalchemy import select, text
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy.schema import CreateTable
+
+from app.clients.college_scorecard import BASE_FIELDS
+from app.models.scorecard import ScorecardSchool
+from app.services.scorecard_ingest import (
+    BULK_FILE_COLUMNS,
+    COLUMNS,
+    FILE_LEVEL_FIELDS,
+    _coerce,
+    ingest_csv,
+    iter_chunks,
+)
+
+
+def _rows(path: Path, **kwargs) -> list[dict]:
+    return [
+        dict(zip(COLUMNS, row, strict=True))
+        for chunk in iter_chunks(path, **kwargs)
+        for row in chunk
+    ]
+
+
+def test_every_api_field_has_a_bulk_file_source():
+    assert [
+        field
+        for field in BASE_FIELDS
+        if field not in BULK_FILE_COLUMNS and field not in FILE_LEVEL_FIELDS
+    ] == []
+
+
+@pytest.mark.parametrize("token", ["", "NULL", "NA", "PrivacySuppressed", "PS", "  NULL  "])
+def test_suppressed_and_missing_values_become_none(token):
+    assert _coerce(token, float) is None
+    assert _coerce(token, int) is None
+    assert _coerce(None, str) is None
+
+
+def test_numbers_are_coerced_to_the_column_type():
+    assert _coerce("5196", int) == 5196
+    assert isinstance(_coerce("5196.0", int), int)
+    assert _coerce("0.0539", float) == pytest.approx(0.0539)
+    assert _coerce("18", float) == 18.0 and isinstance(_coerce("18", float), float)
+    assert _coerce(" Normal ", str) == "Normal"
+    assert _coerce("n/a-ish", float) is None
+
+
+def test_iter_chunks_reads_the_fixture(scorecard_csv):
+    rows = _rows(scorecard_csv, academic_year=2022)
+
+    # The row without a UNITID is skipped.
+    assert [row["id"] for row in rows] == [100654, 100724, 100760]
+    aamu, amridge, cacc = rows
+    assert aamu["name"] == "Alabama A & M University"
+    assert isinstance(aamu["student_size"], int) and isinstance(aamu["ownership"], int)
+    assert aamu["academic_year"] == 2022
+    assert amridge["median_debt"] is None
+    assert amridge["sat_reading_25th"] is None
+    assert cacc["school_url"] is None
+
+
+def test_merged_fields_take_the_first_available_variable(scorecard_csv):
+    aamu, amridge, cacc = _rows(scorecard_csv)
+
+    assert aamu["completion_rate"] == pytest.approx(0.2807)  # C150_4
+    assert cacc["completion_rate"] == pytest.approx(0.3297)  # C150_L4
+    assert aamu["avg_net_price"] == 14982  # NPT4_PUB
+    assert amridge["avg_net_price"] == 20251  # NPT4_PRIV
+    assert aamu["federal_loan_rate"] == pytest.approx(0.7503)
+    assert amridge["federal_loan_rate"] == pytest.approx(0.8409)
+    assert aamu["repayment_rate_3yr"] == pytest.approx(0.3140)
+    assert amridge["repayment_rate_3yr"] == pytest.approx(0.2188)
+
+
+def test_dotted_api_headers_are_accepted(tmp_path):
+    path = tmp_path / "dotted.csv"
+    path.write_text("id,school.name,latest.student.size\n42,Dotted College,1200\n")
+
+    (row,) = _rows(path)
+
+    assert (row["id"], row["name"], row["student_size"]) == (42, "Dotted College", 1200)
+
+
+def test_missing_columns_are_reported(tmp_path, caplog):
+    path = tmp_path / "narrow.csv"
+    path.write_text("UNITID,INSTNM\n1,Narrow College\n")
+
+    _rows(path)
+
+    assert "latest.completion.consumer_rate" in caplog.text
+    assert "--academic-year" in caplog.text
+
+
+def test_file_without_unit_ids_is_rejected(tmp_path):
+    path = tmp_path / "bad.csv"
+    path.write_text("INSTNM\nNo Id College\n")
+
+    with pytest.raises(ValueError):
+        _rows(path)
+
+
+# The loader COPYs through asyncpg, so the upsert path needs a real PostgreSQL database.
+POSTGRES_URL = os.environ.get("TEST_DATABASE_URL", "")
+
+
+@pytest.mark.skipif(
+    not POSTGRES_URL.startswith("postgresql+asyncpg"),
+    reason="set TEST_DATABASE_URL=postgresql+asyncpg://... to run the ingest upsert test",
+)
+async def test_ingest_upserts_and_prunes(scorecard_csv, tmp_path):
+    engine = create_async_engine(POSTGRES_URL)
+    table = ScorecardSchool.__table__
+    async with engine.begin() as conn:
+        await conn.execute(text(f"DROP TABLE IF EXISTS {table.name}"))
+        await conn.execute(CreateTable(table))
+    try:
+        assert await ingest_csv(engine, scorecard_csv, chunk_size=2, academic_year=2022) == 3
+
+        # Re-ingest a file where one school changed and another disappeared.
+        with open(scorecard_csv, newline="") as handle:
+            reader = csv.DictReader(handle)
+            header, rows = reader.fieldnames, list(reader)
+        rows[0]["INSTNM"] = "Alabama A&M University"
+        updated = tmp_path / "updated.csv"
+        with open(updated, "w", newline="") as handle:
+            writer = csv.DictWriter(handle, header)
+            writer.writeheader()
+            writer.writerows([rows[0], rows[2]])
+        assert await ingest_csv(engine, updated, academic_year=2023, prune=True) == 2
+
+        async with engine.connect() as conn:
+            result = await conn.execute(
+                select(table.c.id, table.c.name, table.c.academic_year).order_by(table.c.id)
+            )
+            assert result.all() == [
+                (100654, "Alabama A&M University", 2023),
+                (100760, "Central Alabama Community College", 2023),
+            ]
+    finally:
+        async with engine.begin() as conn:
+            await conn.execute(text(f"DROP TABLE IF EXISTS {table.name}"))
+        await engine.dispose()
@@ -0,0 +1,101 @@
+import pytest
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from app.clients.college_scorecard import BASE_FIELDS, CollegeScorecardClient
+from app.clients.scorecard_mirror import ScorecardMirror
+from app.models.scorecard import ScorecardSchool
+from app.services.scorecard_ingest import COLUMNS, iter_chunks
+
+# What api.data.gov returns for the first fixture school with fields=BASE_FIELDS.
+API_RECORD = {
+    "id": 100654,
+    "school.name": "Alabama A & M University",
+    "school.city": "Normal",
+    "school.state": "AL",
+    "school.school_url": "www.aamu.edu/",
+    "school.ownership": 1,
+    "school.locale": 12,
+    "latest.student.size": 5196,
+    "latest.student.part_time_share": 0.0539,
+    "latest.academic_year": 2022,
+    "latest.completion.consumer_rate": 0.2807,
+    "latest.cost.avg_net_price.overall": 14982,
+    "latest.earnings.10_yrs_after_entry.median": 36339,
+    "latest.aid.median_debt.completers.overall": 32750,
+    "latest.aid.median_debt.completers.monthly_payments": 339.0743,
+    "latest.student.share_white": 0.0159,
+    "latest.student.share_black": 0.9022,
+    "latest.student.share_hispanic": 0.0116,
+    "latest.student.share_asian": 0.0012,
+    "latest.student.share_two_or_more": 0.0104,
+    "latest.student.share_non_resident_alien": 0.0507,
+    "latest.student.share_firstgeneration": 0.3658,
+    "latest.aid.pell_grant_rate": 0.6937,
+    "latest.aid.dcs_federal_loan_rate_pooled": 0.7503,
+    "latest.student.demographics.student_faculty_ratio": 18,
+    "latest.student.retention_rate_suppressed.four_year.full_time_pooled": 0.5746,
+    "latest.student.retention_rate_suppressed.lt_four_year.full_time_pooled": None,
+    "latest.admissions.sat_scores.25th_percentile.critical_reading": 430,
+    "latest.admissions.sat_scores.75th_percentile.critical_reading": 520,
+    "latest.admissions.act_scores.25th_percentile.cumulative": 15,
+    "latest.admissions.act_scores.75th_percentile.cumulative": 19,
+    "latest.admissions.admission_rate.overall": 0.684,
+    "latest.repayment.3_yr_repayment.completers.rate": 0.314,
+    "latest.earnings.6_yrs_after_entry.gt_threshold": 0.5364,
+    "latest.cost.net_price.public.by_income_level.0-30000": 14360,
+    "latest.cost.net_price.public.by_income_level.30001-48000": 15253,
+    "latest.cost.net_price.public.by_income_level.48001-75000": 18169,
+    "latest.cost.net_price.public.by_income_level.75001-110000": 18639,
+    "latest.cost.net_price.public.by_income_level.110001-plus": 20047,
+    "latest.cost.net_price.private.by_income_level.0-30000": None,
+    "latest.cost.net_price.private.by_income_level.30001-48000": None,
+    "latest.cost.net_price.private.by_income_level.48001-75000": None,
+    "latest.cost.net_price.private.by_income_level.75001-110000": None,
+    "latest.cost.net_price.private.by_income_level.110001-plus": None,
+}
+
+
+@pytest.fixture
+async def mirror(scorecard_csv):
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.begin() as conn:
+        await conn.run_sync(ScorecardSchool.__table__.create)
+        for chunk in iter_chunks(scorecard_csv, academic_year=2022):
+            await conn.execute(
+                insert(ScorecardSchool),
+                [dict(zip(COLUMNS, row, strict=True)) for row in chunk],
+            )
+    yield ScorecardMirror(async_sessionmaker(engine, expire_on_commit=False))
+    await engine.dispose()
+
+
+def test_api_record_covers_every_base_field():
+    assert sorted(API_RECORD) == sorted(BASE_FIELDS)
+
+
+async def test_mapped_school_matches_the_api(mirror):
+    payload = await mirror.query({"id": "100654", "fields": ",".join(BASE_FIELDS)})
+    (record,) = payload["results"]
+    client = CollegeScorecardClient()
+
+    mirrored = client._map_school(record)
+    expected = client._map_school(API_RECORD)
+
+    # Both sides parse the same decimal strings, so values compare exactly.
+    assert mirrored == expected
+    assert mirrored["graduation_rate"] is not None
+    assert mirrored["average_annual_cost"] is not None
+    assert mirrored["federal_loan_rate"] is not None
+    assert mirrored["repayment_rate"] is not None
+
+
+async def test_query_filters_and_paginates_like_the_api(mirror):
+    payload = await mirror.query({"school.state": "al", "page": 0, "per_page": 2, "fields": "id"})
+
+    assert payload["metadata"] == {"page": 0, "per_page": 2, "total": 3}
+    # Largest schools first, as with sort=latest.student.size:desc upstream.
+    assert payload["results"] == [{"id": 100654}, {"id": 100760}]
+
+    by_name = await mirror.query({"school.name": "amridge", "fields": "id,school.name"})
+    assert by_name["results"] == [{"id": 100724, "school.name": "Amridge University"}]
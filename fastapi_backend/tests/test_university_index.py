@@ -0,0 +1,57 @@
+import json
+
+from app.core.config import settings
+from app.services import university_index
+from app.services.university_index import UniversityNameIndex
+
+SCHOOLS = [
+    {"unit_id": 1, "name": "Ohio State University", "city": "Columbus", "state": "OH", "size": 1},
+    {"unit_id": 2, "name": "Ohio University", "city": "Athens", "state": "OH", "size": 0},
+]
+
+
+class _Client:
+    def __init__(self, schools):
+        self.schools = schools
+        self.crawls = 0
+
+    async def iter_schools(self, **kwargs):
+        self.crawls += 1
+        for school in self.schools:
+            yield school
+
+
+async def test_index_is_crawled_and_snapshotted_without_the_mirror(monkeypatch, tmp_path):
+    snapshot = tmp_path / "names.json"
+    client = _Client(SCHOOLS)
+    monkeypatch.setattr(university_index, "scorecard_client", client)
+    monkeypatch.setattr(settings, "college_scorecard_backend", "api")
+    monkeypatch.setattr(settings, "university_name_snapshot_path", str(snapshot))
+    index = UniversityNameIndex()
+
+    assert await index.refresh(prefer_snapshot=True) == 2
+    assert [entry["unit_id"] for entry in index.suggest("ohio")] == [1, 2]
+    assert json.loads(snapshot.read_text())[0]["name"] == "Ohio State University"
+
+    # A restart loads the snapshot without crawling; periodic refreshes crawl again.
+    client.schools = SCHOOLS[:1]
+    assert await UniversityNameIndex().refresh(prefer_snapshot=True) == 2
+    assert client.crawls == 1
+    assert await index.refresh() == 1
+    assert client.crawls == 2
+
+
+async def test_failed_crawl_falls_back_to_the_snapshot(monkeypatch, tmp_path):
+    snapshot = tmp_path / "names.json"
+    snapshot.write_text(json.dumps(SCHOOLS))
+
+    class _Down:
+        async def iter_schools(self, **kwargs):
+            raise ConnectionError("upstream down")
+            yield  # pragma: no cover
+
+    monkeypatch.setattr(university_index, "scorecard_client", _Down())
+    monkeypatch.setattr(settings, "college_scorecard_backend", "api")
+    monkeypatch.setattr(settings, "university_name_snapshot_path", str(snapshot))
+
+    assert await UniversityNameIndex().refresh() == 2
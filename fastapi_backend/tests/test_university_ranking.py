@@ -0,0 +1,43 @@
+from app.services import university_ranking
+from app.services.university_ranking import RankingEngine
+
+RECORDS = [
+    {
+        "id": 1,
+        "school.name": "Selective College",
+        "school.state": "OH",
+        "latest.admissions.admission_rate.overall": 0.2,
+    },
+    {
+        "id": 2,
+        "school.name": "Open College",
+        "school.state": "OH",
+        "latest.admissions.admission_rate.overall": 0.9,
+    },
+    {"id": 3, "school.name": "Unreported College", "school.state": "OH"},
+]
+
+
+class _Client:
+    def __init__(self):
+        self.calls = []
+
+    async def iter_schools(self, **kwargs):
+        self.calls.append(kwargs)
+        for record in RECORDS:
+            yield record
+
+
+async def test_missing_admission_rate_is_ranked_as_missing(monkeypatch):
+    client = _Client()
+    monkeypatch.setattr(university_ranking, "scorecard_client", client)
+    engine = RankingEngine()
+
+    assert await engine.refresh() == 3
+    assert client.calls[0]["raw"] is True
+    results = engine.rank({"acceptance_rate": 1.0}, limit=3, missing_penalty=0.5)
+
+    # Not reporting must not read as a 100% acceptance rate (the worst possible score).
+    assert [school["unit_id"] for school in results] == [1, 3, 2]
+    assert results[1]["criteria"] == {"acceptance_rate": None}
+    assert results[1]["score"] == 0.5
@@ -0,0 +1,42 @@
+import httpx
+import pytest
+
+from app.clients.circuit_breaker import CircuitOpenError
+from app.clients.rate_limit import RateLimitError
+from app.main import create_application
+
+UPSTREAM = httpx.Request("GET", "https://scorecard.test/v1/schools")
+
+
+def _status_error(code: int, **headers) -> httpx.HTTPStatusError:
+    response = httpx.Response(code, headers=headers, request=UPSTREAM)
+    return httpx.HTTPStatusError(f"{code}", request=UPSTREAM, response=response)
+
+
+@pytest.mark.parametrize(
+    ("error", "status", "retry_after"),
+    [
+        (httpx.ReadTimeout("timed out", request=UPSTREAM), 504, "30"),
+        (httpx.ConnectError("refused", request=UPSTREAM), 503, "30"),
+        (_status_error(502), 503, "30"),
+        (_status_error(429, **{"Retry-After": "7"}), 503, "7"),
+        (CircuitOpenError(12.5), 503, "12"),
+        (RateLimitError(0.2), 503, "1"),
+        (_status_error(403), 502, None),
+        (_status_error(400), 502, None),
+    ],
+)
+async def test_upstream_failures_are_not_500s(error, status, retry_after):
+    app = create_application()
+
+    async def fail():
+        raise error
+
+    app.add_api_route("/fail", fail)
+    transport = httpx.ASGITransport(app=app, raise_app_exceptions=False)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        response = await client.get("/fail")
+
+    assert response.status_code == status
+    assert response.headers.get("Retry-After") == retry_after
+    assert response.json()["success"] is False